@@ -17,6 +17,7 @@ from .const import (
 )
 from .services import async_setup_services
 from .coordinator import OctopusNetDataUpdateCoordinator
+from .channels import OctopusNetChannelCatalog
 from .api import OctopusNetApiAuthenticationError
 
 CONFIG_SCHEMA = cv.empty_config_schema(DOMAIN)
@@ -30,16 +31,18 @@ async def async_setup(hass: HomeAssistant, config: dict) -> bool:
 
 async def async_setup_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> bool:
     """Set up platform from a ConfigEntry."""
+    coordinator = OctopusNetDataUpdateCoordinator(
+        hass=hass,
+        config_entry=config_entry,
+    )
     try:
-        coordinator = OctopusNetDataUpdateCoordinator(
-            hass=hass,
-            config_entry=config_entry,
-        )
         await coordinator.initialize()
         await coordinator.async_config_entry_first_refresh()
     except OctopusNetApiAuthenticationError as err:
+        await coordinator.async_close()
         raise ConfigEntryAuthFailed from err
     except Exception as err:
+        await coordinator.async_close()
         raise ConfigEntryNotReady from err
 
     config_entry.runtime_data = coordinator
@@ -55,9 +58,20 @@ async def async_unload_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     unload_ok = await hass.config_entries.async_unload_platforms(
         config_entry, PLATFORMS
     )
+    if unload_ok:
+        await config_entry.runtime_data.async_close()
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
+    """Remove the stored data of a config entry."""
+    await OctopusNetChannelCatalog(
+        hass=hass,
+        client=None,
+        entry_id=config_entry.entry_id,
+    ).async_remove()
+
+
 async def async_reload_entry(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Reload config entry."""
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -1,16 +1,75 @@
 """Digital Devices Octopus NET API Client."""
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import socket
+import time
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from urllib.parse import urlsplit
+
 import aiohttp
 import async_timeout
 
-from homeassistant.helpers.aiohttp_client import HassClientResponse
+from homeassistant.helpers.aiohttp_client import (
+    HassClientResponse,
+    SERVER_SOFTWARE,
+)
+from homeassistant.util.ssl import (
+    client_context,
+    client_context_no_verify,
+)
 
+from .auth import OctopusNetAuth
+from .metrics import (
+    OctopusNetRequestMetrics,
+    OctopusNetResponseCapture,
+)
 from .const import (
     LOGGER,
+    LOG_TAIL_SUFFIX,
+    LOG_TAIL_ANCHOR,
+    LOG_STREAM_CHUNK,
+    SESSION_CONNECTION_LIMIT,
+    SESSION_KEEPALIVE_TIMEOUT,
+    SESSION_DNS_CACHE_TTL,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_BACKOFF_MIN,
+    CIRCUIT_BACKOFF_MAX,
+    CIRCUIT_PROBE_TIMEOUT,
 )
 
+CIRCUIT_CLOSED = "closed"
+CIRCUIT_OPEN = "open"
+CIRCUIT_HALF_OPEN = "half_open"
+
+def create_session(
+    tls: bool,
+    verify_ssl: bool,
+) -> aiohttp.ClientSession:
+    """Create a session with a connector tuned for a single device."""
+    _ssl = False
+    if tls:
+        # The contexts are cached and shared across sessions
+        _ssl = client_context() if verify_ssl else client_context_no_verify()
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit=SESSION_CONNECTION_LIMIT,
+            limit_per_host=SESSION_CONNECTION_LIMIT,
+            keepalive_timeout=SESSION_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=SESSION_DNS_CACHE_TTL,
+            ssl=_ssl,
+        ),
+        cookie_jar=aiohttp.CookieJar(unsafe=True),
+        headers={
+            aiohttp.hdrs.USER_AGENT: SERVER_SOFTWARE,
+        },
+        response_class=HassClientResponse,
+    )
+
+
 class OctopusNetApiError(Exception):
     """Exception to indicate a general client error."""
 
@@ -23,10 +82,207 @@ class OctopusNetApiCommunicationError(OctopusNetApiError):
     """Exception to indicate a communication error."""
 
 
+class OctopusNetApiCircuitOpenError(OctopusNetApiCommunicationError):
+    """Exception to indicate a request skipped for an unreachable device."""
+
+
 class OctopusNetApiAuthenticationError(OctopusNetApiError):
     """Exception to indicate an authentication error."""
 
 
+class OctopusNetLogTail:
+    """Incremental reader for an append-only log file on the device."""
+
+    def __init__(
+        self,
+        suffix_size: int = LOG_TAIL_SUFFIX,
+        anchor_size: int = LOG_TAIL_ANCHOR,
+    ) -> None:
+        """Initialize."""
+        self._suffix_size = suffix_size
+        self._anchor_size = anchor_size
+        self.offset: int | None = None
+        self.etag: str | None = None
+        self.last_modified: str | None = None
+        # Last bytes before the offset, to recognize the log in a full reply
+        self.anchor = b""
+
+    def reset(self) -> None:
+        """Forget the read position, e.g. after the log was rotated."""
+        self.offset = None
+        self.etag = None
+        self.last_modified = None
+        self.anchor = b""
+
+    def seek(
+        self,
+        offset: int,
+        headers: dict,
+        anchor: bytes = b"",
+    ) -> None:
+        """Continue reading at the given offset of a known log version."""
+        self.offset = offset
+        self.etag = headers.get("ETag")
+        self.last_modified = headers.get("Last-Modified")
+        self.anchor = anchor[-self._anchor_size:]
+
+    def request_headers(self) -> dict:
+        """Return the headers to request only the unread part of the log."""
+        if self.offset is None:
+            return {
+                "Range": f"bytes=-{self._suffix_size}",
+            }
+        _headers = {
+            "Range": f"bytes={self.offset}-",
+        }
+        # A changed log is sent in full instead of a range of another version
+        if self.etag or self.last_modified:
+            _headers["If-Range"] = self.etag or self.last_modified
+        return _headers
+
+    def feed(
+        self,
+        status: int,
+        headers: dict,
+        body: bytes,
+    ) -> list[str] | None:
+        """Consume a response and return the new complete lines.
+
+        Returns None if the log was rotated and has to be read again.
+        """
+        if status == 304:
+            return []
+
+        _start, _total = self._parse_content_range(headers.get("Content-Range"))
+        if status == 416:
+            if _total is not None and self.offset is not None and _total < self.offset:
+                return None
+            return []
+
+        if status != 206:
+            # The complete log was sent, because it changed or Range is not supported
+            _start = 0
+            if self.offset is not None:
+                if (
+                    len(body) >= self.offset
+                    and body[:self.offset].endswith(self.anchor)
+                ):
+                    # Appended to the known log, skip the lines already read
+                    _start = self.offset
+                    body = body[self.offset:]
+                else:
+                    # Another log, all of its lines are new
+                    self.offset = 0
+                    self.anchor = b""
+        elif _start is None:
+            _start = self.offset or 0
+
+        _suffix_read = self.offset is None
+        _end = body.rfind(b"\n") + 1
+        _lines = body[:_end].decode("utf-8", "replace").splitlines()
+        if _suffix_read and _start > 0 and _lines:
+            # The first line of a suffix range is most likely incomplete
+            _lines.pop(0)
+
+        self.offset = _start + _end
+        self.etag = headers.get("ETag")
+        self.last_modified = headers.get("Last-Modified")
+        self.anchor = (self.anchor + body[:_end])[-self._anchor_size:]
+        return _lines
+
+    @staticmethod
+    def _parse_content_range(
+        content_range: str | None,
+    ) -> tuple[int | None, int | None]:
+        """Parse the start and total size of a Content-Range header."""
+        if not content_range or not content_range.startswith("bytes "):
+            return None, None
+        _range, _, _total = content_range[6:].partition("/")
+        _start = None
+        if _range != "*":
+            try:
+                _start = int(_range.partition("-")[0])
+            except ValueError:
+                _start = None
+        try:
+            return _start, int(_total)
+        except ValueError:
+            return _start, None
+
+
+class OctopusNetCircuitBreaker:
+    """Pause requests to a device after repeated connection failures."""
+
+    def __init__(
+        self,
+        host: str,
+        threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+    ) -> None:
+        """Initialize."""
+        self._host = host
+        self._threshold = threshold
+        self._retry_at = 0.0
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.backoff = 0
+        self.lock = asyncio.Lock()
+
+    @property
+    def closed(self) -> bool:
+        """Return True if requests are sent to the device."""
+        return self.state == CIRCUIT_CLOSED
+
+    def probe_due(self) -> bool:
+        """Return True and switch to half-open if the backoff has expired."""
+        if time.monotonic() < self._retry_at:
+            return False
+        self.state = CIRCUIT_HALF_OPEN
+        return True
+
+    def record_success(self) -> None:
+        """Close the circuit once the device answered."""
+        if self.state != CIRCUIT_CLOSED:
+            LOGGER.info("%s is reachable again, resuming requests", self._host)
+        self.state = CIRCUIT_CLOSED
+        self.failures = 0
+        self.backoff = 0
+
+    def record_failure(self) -> None:
+        """Count a connection failure and open the circuit if needed."""
+        self.failures += 1
+        if self.state == CIRCUIT_OPEN:
+            # Requests that were sent before the circuit opened
+            return
+        if self.state == CIRCUIT_CLOSED and self.failures < self._threshold:
+            return
+        self.backoff = min(CIRCUIT_BACKOFF_MAX, self.backoff * 2 or CIRCUIT_BACKOFF_MIN)
+        self._retry_at = time.monotonic() + self.backoff
+        if self.state == CIRCUIT_CLOSED:
+            LOGGER.warning(
+                "%s is unreachable after %s failed requests, pausing requests for %s seconds",
+                self._host,
+                self.failures,
+                self.backoff,
+            )
+        else:
+            LOGGER.debug(
+                "%s is still unreachable, next probe in %s seconds",
+                self._host,
+                self.backoff,
+            )
+        self.state = CIRCUIT_OPEN
+
+
+@dataclass(slots=True)
+class OctopusNetPayload:
+    """Last body of an endpoint, identified by its digest."""
+
+    digest: bytes
+    data: any
+    etag: str | None = None
+    last_modified: str | None = None
+
+
 class OctopusNetApiClient:
     """Octopus NET Client."""
 
@@ -52,6 +308,57 @@ class OctopusNetApiClient:
             self._endpoint = f"https://{self._host}:{self._port}"
         else:
             self._endpoint = f"http://{self._host}:{self._port}"
+        self._auth = OctopusNetAuth(username, password)
+        self.circuit = OctopusNetCircuitBreaker(host)
+        self.metrics = OctopusNetRequestMetrics()
+        self.responses = OctopusNetResponseCapture()
+        self._payloads: dict[str, OctopusNetPayload] = {}
+        self._temperature_log = OctopusNetLogTail()
+        self._temperature: float | None = None
+        self.temperature_samples: list[float] = []
+
+    async def async_close(self) -> None:
+        """Close the session."""
+        if not self._session.closed:
+            await self._session.close()
+
+    def detach(self) -> None:
+        """Release the session without waiting, e.g. when Home Assistant closes."""
+        if not self._session.closed:
+            self._session.detach()
+
+    async def _async_check_circuit(self) -> None:
+        """Skip requests to an unreachable device until a probe succeeds."""
+        if self.circuit.closed:
+            return
+        # Only one request probes the device, the others wait for its result
+        async with self.circuit.lock:
+            if self.circuit.closed:
+                return
+            if self.circuit.probe_due() and await self.async_probe():
+                return
+            if self.circuit.state == CIRCUIT_HALF_OPEN:
+                self.circuit.record_failure()
+            raise OctopusNetApiCircuitOpenError(
+                f"{self._host} is unreachable, request skipped",
+            )
+
+    async def async_probe(self) -> bool:
+        """Return True if the device answers a lightweight request."""
+        try:
+            async with async_timeout.timeout(CIRCUIT_PROBE_TIMEOUT):
+                _response = await self._session.request(
+                    method="GET",
+                    url=f"{self._endpoint}/system/fanspeed",
+                )
+                _response.release()
+        except (TimeoutError, aiohttp.ClientError, socket.gaierror):
+            return False
+        # A booting device may answer before its services are ready
+        if _response.status >= 500:
+            return False
+        self.circuit.record_success()
+        return True
 
     async def _async_request_wrapper(
         self,
@@ -59,53 +366,178 @@ class OctopusNetApiClient:
         url: str,
         data: dict | None = None,
         headers: dict | None = None,
+        accepted_status: tuple[int, ...] = (),
     ) -> HassClientResponse:
         """Get information from the device."""
+        await self._async_check_circuit()
+        _start = time.monotonic()
+        _error: str | None = None
+        _cancelled = False
         try:
             LOGGER.debug(url)
             async with async_timeout.timeout(10):
-                response = await self._session.request(
-                    method=method,
-                    url=url,
-                    headers=headers,
-                    json=data,
-                )
-                LOGGER.debug(response)
+                for _attempt in range(2):
+                    _auth_headers = self._auth.get_headers(method, url)
+                    response = await self._session.request(
+                        method=method,
+                        url=url,
+                        headers={
+                            **(headers or {}),
+                            **_auth_headers,
+                        },
+                        json=data,
+                    )
+                    self.circuit.record_success()
+                    LOGGER.debug(response)
+                    # Authenticate only when challenged and replay the request once
+                    if (
+                        response.status == 401
+                        and _attempt == 0
+                        and self._auth.handle_challenge(
+                            response.headers.get("WWW-Authenticate"),
+                            bool(_auth_headers),
+                        )
+                    ):
+                        response.release()
+                        continue
+                    break
                 if response.status in (401, 403):
                     raise OctopusNetApiAuthenticationError(
                         "Invalid credentials",
                     )
-                response.raise_for_status()
+                if response.status not in accepted_status:
+                    response.raise_for_status()
                 return response
         except OctopusNetApiAuthenticationError as exception:
+            _error = type(exception).__name__
             raise exception
         except TimeoutError as exception:
+            _error = type(exception).__name__
+            self.circuit.record_failure()
             raise OctopusNetApiTimeoutError(
                 "Timeout error fetching information"
             ) from exception
         except (aiohttp.ClientError, socket.gaierror) as exception:
+            _error = type(exception).__name__
+            if not isinstance(exception, aiohttp.ClientResponseError):
+                self.circuit.record_failure()
             raise OctopusNetApiCommunicationError(
                 "Error fetching information"
             ) from exception
+        except asyncio.CancelledError:
+            # Cut off by the poll deadline, not an answer time of the device
+            _cancelled = True
+            raise
         except Exception as exception:  # pylint: disable=broad-except
+            _error = type(exception).__name__
             raise OctopusNetApiError(
                 "Something really wrong happened!"
             ) from exception
+        finally:
+            # Time to the response headers, the body is read by the caller
+            if not _cancelled:
+                self.metrics.add(urlsplit(url).path, time.monotonic() - _start, _error)
+
+    def _get_conditional_headers(
+        self,
+        path: str,
+    ) -> dict[str, str]:
+        """Return the headers of a request that may be answered with 304."""
+        _payload = self._payloads.get(path)
+        _headers = {}
+        if _payload is not None and _payload.etag:
+            _headers["If-None-Match"] = _payload.etag
+        if _payload is not None and _payload.last_modified:
+            _headers["If-Modified-Since"] = _payload.last_modified
+        return _headers
+
+    def _parse_json(
+        self,
+        path: str,
+        response: HassClientResponse,
+        body: bytes,
+    ) -> any:
+        """Parse a JSON body."""
+        try:
+            return json.loads(body.decode(response.get_encoding()))
+        except ValueError as exception:
+            # Do not take an invalid body as unchanged next time
+            self._payloads.pop(path, None)
+            raise OctopusNetApiCommunicationError(
+                "Invalid response",
+            ) from exception
+
+    async def _async_read_json(
+        self,
+        response: HassClientResponse,
+        changed_only: bool = False,
+        cache: bool = True,
+    ) -> any:
+        """Read, capture and parse the JSON body of a response.
+
+        A body equal to the last one of the endpoint is not parsed again,
+        its cached data is returned or None with changed_only.
+        """
+        _path = response.url.path
+        if response.status == 304:
+            return None
+        _body = await response.read()
+        self.responses.add(_path, response.status, _body)
+        if not cache:
+            return self._parse_json(_path, response, _body)
+        _digest = hashlib.blake2b(_body, digest_size=16).digest()
+        _payload = self._payloads.get(_path)
+        if _payload is not None and _payload.digest == _digest:
+            _payload.etag = response.headers.get("ETag")
+            _payload.last_modified = response.headers.get("Last-Modified")
+            return None if changed_only else _payload.data
+        _data = self._parse_json(_path, response, _body)
+        self._payloads[_path] = OctopusNetPayload(
+            digest=_digest,
+            data=_data,
+            etag=response.headers.get("ETag"),
+            last_modified=response.headers.get("Last-Modified"),
+        )
+        return _data
 
     async def async_get_temperature(self) -> float:
         """Get current temperature."""
         try:
-            response = await self._async_request_wrapper(
-                method="GET",
-                url=f"{self._endpoint}/log/Temperatur.log",
-            )
-            response_text = await response.text()
-            response_lines = response_text.splitlines()
-            if len(response_lines) < 3:
+            for _ in range(2):
+                _incremental = self._temperature_log.offset is not None
+                response = await self._async_request_wrapper(
+                    method="GET",
+                    url=f"{self._endpoint}/log/Temperatur.log",
+                    headers=self._temperature_log.request_headers(),
+                    accepted_status=(416,),
+                )
+                response_body = await response.read()
+                self.responses.add(response.url.path, response.status, response_body)
+                response_lines = self._temperature_log.feed(
+                    response.status,
+                    response.headers,
+                    response_body,
+                )
+                if response_lines is not None:
+                    break
+                LOGGER.debug("Temperature log was rotated, reading tail again")
+                self._temperature_log.reset()
+            _samples = []
+            for response_line in response_lines or []:
+                try:
+                    _samples.append(float(response_line))
+                except ValueError:
+                    continue
+            # Samples of a suffix read may already be known, only report
+            # samples which were appended since the last read
+            self.temperature_samples = _samples if _incremental else []
+            if _samples:
+                self._temperature = _samples[-1]
+            if self._temperature is None:
                 raise OctopusNetApiCommunicationError(
                     "Invalid response",
                 )
-            return float(response_lines[len(response_lines) - 1])
+            return self._temperature
         except aiohttp.ContentTypeError as exception:
             raise OctopusNetApiCommunicationError(
                 "Error fetching information"
@@ -113,16 +545,55 @@ class OctopusNetApiClient:
         except Exception as exception:
             raise exception
 
-    async def async_get_fanspeed(self) -> int:
-        """Get current fan speed."""
+    async def async_iter_temperature_log(self) -> AsyncIterator[float]:
+        """Stream all temperature samples of the device log."""
         try:
             response = await self._async_request_wrapper(
                 method="GET",
-                url=f"{self._endpoint}/system/fanspeed",
+                url=f"{self._endpoint}/log/Temperatur.log",
             )
-            response_json = await response.json(
-                content_type=None,
+            _buffer = b""
+            _offset = 0
+            _anchor = b""
+            async for _chunk in response.content.iter_chunked(LOG_STREAM_CHUNK):
+                _buffer += _chunk
+                *_lines, _buffer = _buffer.split(b"\n")
+                for _line in _lines:
+                    _offset += len(_line) + 1
+                    _anchor = _line + b"\n"
+                    try:
+                        yield float(_line)
+                    except ValueError:
+                        continue
+            # Continue the incremental reads after the streamed part
+            self._temperature_log.seek(_offset, response.headers, _anchor)
+        except (aiohttp.ClientError, socket.gaierror) as exception:
+            raise OctopusNetApiCommunicationError(
+                "Error fetching information"
+            ) from exception
+
+    async def async_get_fanspeed(
+        self,
+        changed_only: bool = False,
+    ) -> int | None:
+        """Get current fan speed.
+
+        With changed_only the request is conditional and None is returned
+        if the fan speed did not change since the last request.
+        """
+        try:
+            response = await self._async_request_wrapper(
+                method="GET",
+                url=f"{self._endpoint}/system/fanspeed",
+                headers=(
+                    self._get_conditional_headers("/system/fanspeed")
+                    if changed_only
+                    else None
+                ),
             )
+            response_json = await self._async_read_json(response, changed_only)
+            if response_json is None:
+                return None
             if "speed" not in response_json:
                 raise OctopusNetApiCommunicationError(
                     "Invalid response",
@@ -135,16 +606,28 @@ class OctopusNetApiClient:
         except Exception as exception:
             raise exception
 
-    async def async_get_epg(self) -> dict:
-        """Get current epg status."""
+    async def async_get_epg(
+        self,
+        changed_only: bool = False,
+    ) -> dict | None:
+        """Get current epg status.
+
+        With changed_only the request is conditional and None is returned
+        if the epg status did not change since the last request.
+        """
         try:
             response = await self._async_request_wrapper(
                 method="GET",
                 url=f"{self._endpoint}/epg/status",
+                headers=(
+                    self._get_conditional_headers("/epg/status")
+                    if changed_only
+                    else None
+                ),
             )
-            response_json = await response.json(
-                content_type=None,
-            )
+            response_json = await self._async_read_json(response, changed_only)
+            if response_json is None:
+                return None
             if "status" not in response_json:
                 raise OctopusNetApiCommunicationError(
                     "Invalid response",
@@ -157,16 +640,28 @@ class OctopusNetApiClient:
         except Exception as exception:
             raise exception
 
-    async def async_get_tuner_status(self) -> list:
-        """Get current tuner status."""
+    async def async_get_tuner_status(
+        self,
+        changed_only: bool = False,
+    ) -> list | None:
+        """Get current tuner status.
+
+        With changed_only the request is conditional and None is returned
+        if the status did not change since the last request.
+        """
         try:
             response = await self._async_request_wrapper(
                 method="GET",
                 url=f"{self._endpoint}/octoserve/tunerstatus.json",
+                headers=(
+                    self._get_conditional_headers("/octoserve/tunerstatus.json")
+                    if changed_only
+                    else None
+                ),
             )
-            response_json = await response.json(
-                content_type=None,
-            )
+            response_json = await self._async_read_json(response, changed_only)
+            if response_json is None:
+                return None
             if "TunerList" not in response_json:
                 raise OctopusNetApiCommunicationError(
                     "Invalid response",
@@ -179,16 +674,28 @@ class OctopusNetApiClient:
         except Exception as exception:
             raise exception
 
-    async def async_get_stream_status(self) -> list:
-        """Get current stream status."""
+    async def async_get_stream_status(
+        self,
+        changed_only: bool = False,
+    ) -> list | None:
+        """Get current stream status.
+
+        With changed_only the request is conditional and None is returned
+        if the status did not change since the last request.
+        """
         try:
             response = await self._async_request_wrapper(
                 method="GET",
                 url=f"{self._endpoint}/octoserve/streamstatus.json",
+                headers=(
+                    self._get_conditional_headers("/octoserve/streamstatus.json")
+                    if changed_only
+                    else None
+                ),
             )
-            response_json = await response.json(
-                content_type=None,
-            )
+            response_json = await self._async_read_json(response, changed_only)
+            if response_json is None:
+                return None
             if "StreamList" not in response_json:
                 raise OctopusNetApiCommunicationError(
                     "Invalid response",
@@ -201,21 +708,29 @@ class OctopusNetApiClient:
         except Exception as exception:
             raise exception
 
-    async def async_get_channels(self) -> list:
-        """Get channel list."""
+    async def async_get_channels(
+        self,
+        etag: str | None = None,
+    ) -> tuple[list | None, str | None]:
+        """Get channel list and its ETag.
+
+        The list is None if it did not change since the given ETag.
+        """
         try:
             response = await self._async_request_wrapper(
                 method="POST",
                 url=f"{self._endpoint}/channels/data",
+                headers={"If-None-Match": etag} if etag else None,
             )
-            response_json = await response.json(
-                content_type=None,
-            )
+            if response.status == 304:
+                return None, etag
+            # The channel catalog keeps its own digest of the large list
+            response_json = await self._async_read_json(response, cache=False)
             if "data" not in response_json:
                 raise OctopusNetApiCommunicationError(
                     "Invalid response",
                 )
-            return response_json.get("data", [])
+            return response_json.get("data", []), response.headers.get("ETag")
         except aiohttp.ContentTypeError as exception:
             raise OctopusNetApiCommunicationError(
                 "Error fetching information"
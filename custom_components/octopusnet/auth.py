@@ -0,0 +1,145 @@
+"""Digital Devices Octopus NET HTTP authentication."""
+from __future__ import annotations
+
+import hashlib
+import os
+import re
+from urllib.parse import urlsplit
+
+import aiohttp
+
+_CHALLENGE_PARAM = re.compile(r'(\w+)=(?:"([^"]*)"|([^\s,]+))')
+_DIGEST_ALGORITHMS = {
+    "MD5": hashlib.md5,
+    "MD5-SESS": hashlib.md5,
+    "SHA-256": hashlib.sha256,
+    "SHA-256-SESS": hashlib.sha256,
+}
+
+
+class OctopusNetAuth:
+    """Basic or Digest authentication with a cached challenge."""
+
+    def __init__(
+        self,
+        username: str | None,
+        password: str | None,
+    ) -> None:
+        """Initialize."""
+        self._username = username or ""
+        self._password = password or ""
+        self._scheme: str | None = None
+        self._challenge: dict[str, str] = {}
+        self._basic: str | None = None
+        self._nonce_count = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if credentials are configured."""
+        return bool(self._username)
+
+    def handle_challenge(
+        self,
+        header: str | None,
+        authorized: bool,
+    ) -> bool:
+        """Remember the challenge of a 401 response.
+
+        Returns True if the request should be sent again with credentials.
+        """
+        if not self.enabled or not header:
+            return False
+        _scheme, _, _params = header.strip().partition(" ")
+        _scheme = _scheme.lower()
+        if _scheme == "basic":
+            if authorized:
+                # Credentials were already sent and rejected
+                return False
+            self._scheme = _scheme
+            self._basic = aiohttp.BasicAuth(self._username, self._password).encode()
+            return True
+        if _scheme == "digest":
+            _challenge = {
+                _match.group(1).lower(): _match.group(2) if _match.group(2) is not None else _match.group(3)
+                for _match in _CHALLENGE_PARAM.finditer(_params)
+            }
+            if _challenge.get("algorithm", "MD5").upper() not in _DIGEST_ALGORITHMS:
+                return False
+            _stale = _challenge.get("stale", "").lower() == "true"
+            if authorized and not _stale:
+                # Credentials were already sent and rejected
+                return False
+            self._scheme = _scheme
+            self._challenge = _challenge
+            self._nonce_count = 0
+            return True
+        return False
+
+    def get_headers(
+        self,
+        method: str,
+        url: str,
+    ) -> dict[str, str]:
+        """Return the authorization header for a request."""
+        if self._scheme == "basic" and self._basic:
+            return {
+                "Authorization": self._basic,
+            }
+        if self._scheme == "digest" and self._challenge:
+            return {
+                "Authorization": self._get_digest(method, url),
+            }
+        return {}
+
+    def _get_digest(
+        self,
+        method: str,
+        url: str,
+    ) -> str:
+        """Return the digest authorization for a request."""
+        _split = urlsplit(url)
+        _uri = _split.path or "/"
+        if _split.query:
+            _uri = f"{_uri}?{_split.query}"
+
+        _realm = self._challenge.get("realm", "")
+        _nonce = self._challenge.get("nonce", "")
+        _opaque = self._challenge.get("opaque")
+        _algorithm = self._challenge.get("algorithm", "MD5")
+        _hash = _DIGEST_ALGORITHMS[_algorithm.upper()]
+        _qop = "auth" if "auth" in [_value.strip() for _value in self._challenge.get("qop", "").split(",")] else None
+
+        def _digest(value: str) -> str:
+            return _hash(value.encode()).hexdigest()
+
+        self._nonce_count += 1
+        _nc = f"{self._nonce_count:08x}"
+        _cnonce = os.urandom(8).hex()
+        _ha1 = _digest(f"{self._username}:{_realm}:{self._password}")
+        if _algorithm.upper().endswith("-SESS"):
+            _ha1 = _digest(f"{_ha1}:{_nonce}:{_cnonce}")
+        _ha2 = _digest(f"{method}:{_uri}")
+        if _qop:
+            _response = _digest(f"{_ha1}:{_nonce}:{_nc}:{_cnonce}:{_qop}:{_ha2}")
+        else:
+            _response = _digest(f"{_ha1}:{_nonce}:{_ha2}")
+
+        _params = [
+            f'username="{self._username}"',
+            f'realm="{_realm}"',
+            f'nonce="{_nonce}"',
+            f'uri="{_uri}"',
+            f'response="{_response}"',
+            f"algorithm={_algorithm}",
+        ]
+        if _opaque is not None:
+            _params.append(f'opaque="{_opaque}"')
+        if _qop:
+            _params.extend(
+                [
+                    f"qop={_qop}",
+                    f"nc={_nc}",
+                    f'cnonce="{_cnonce}"',
+                ]
+            )
+        return "Digest " + ", ".join(_params)
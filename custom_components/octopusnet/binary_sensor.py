@@ -17,14 +17,17 @@ from homeassistant.helpers.entity import (
 )
 
 from .const import (
-    CONF_TUNER_COUNT,
-    CONF_STREAM_COUNT,
     ATTR_EPG,
     ATTR_TUNER,
     ATTR_STREAM,
+    ATTR_DEGRADED,
 )
 from .coordinator import OctopusNetDataUpdateCoordinator
-from .entity import OctopusNetEntity
+from .entity import (
+    OctopusNetEntity,
+    async_setup_slot_entities,
+)
+from .tuner_signal import SIGNAL_ATTRIBUTES
 
 
 async def async_setup_entry(
@@ -42,7 +45,37 @@ async def async_setup_entry(
             entity_category=EntityCategory.DIAGNOSTIC,
         ),
     ]
-    for i in range(1, config_entry.data[CONF_TUNER_COUNT] + 1):
+    async_add_entities(
+        [
+            OctopusNetBinarySensor(
+                coordinator=coordinator,
+                host=config_entry.data[CONF_HOST],
+                entity_description=entity_description,
+            )
+            for entity_description in entity_descriptions
+        ],
+        update_before_add=True,
+    )
+    async_setup_slot_entities(
+        hass=hass,
+        config_entry=config_entry,
+        async_add_entities=async_add_entities,
+        get_descriptions=_get_slot_descriptions,
+        create_entity=lambda entity_description: OctopusNetBinarySensor(
+            coordinator=coordinator,
+            host=config_entry.data[CONF_HOST],
+            entity_description=entity_description,
+        ),
+    )
+
+
+def _get_slot_descriptions(
+    tuner_count: int,
+    stream_count: int,
+) -> list[BinarySensorEntityDescription]:
+    """Return the descriptions of all tuners and streams."""
+    entity_descriptions = []
+    for i in range(1, tuner_count + 1):
         entity_descriptions.append(
             BinarySensorEntityDescription(
                 key=f"{ATTR_TUNER}_{i}",
@@ -53,7 +86,7 @@ async def async_setup_entry(
                 entity_registry_enabled_default=False,
             )
         )
-    for i in range(1, config_entry.data[CONF_STREAM_COUNT] + 1):
+    for i in range(1, stream_count + 1):
         entity_descriptions.append(
             BinarySensorEntityDescription(
                 key=f"{ATTR_STREAM}_{i}",
@@ -64,24 +97,15 @@ async def async_setup_entry(
                 entity_registry_enabled_default=False,
             )
         )
-
-    async_add_entities(
-        [
-            OctopusNetBinarySensor(
-                coordinator=coordinator,
-                host=config_entry.data[CONF_HOST],
-                entity_description=entity_description,
-            )
-            for entity_description in entity_descriptions
-        ],
-        update_before_add=True,
-    )
-
+    return entity_descriptions
 
 
 class OctopusNetBinarySensor(OctopusNetEntity, BinarySensorEntity):
     """Representation of a Digital Devices Octopus NET binary sensor."""
 
+    # The signal statistics of tuners would fill the recorder database
+    _unrecorded_attributes = SIGNAL_ATTRIBUTES | {ATTR_DEGRADED}
+
     def __init__(
         self,
         coordinator: OctopusNetDataUpdateCoordinator,
@@ -0,0 +1,251 @@
+"""Channel catalog for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timedelta
+from urllib.parse import parse_qs, urlsplit
+
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.storage import Store
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    CHANNEL_STORAGE_VERSION,
+    CHANNEL_REFRESH_INTERVAL,
+    CHANNEL_RETRY_INTERVAL,
+)
+from .api import (
+    OctopusNetApiClient,
+    OctopusNetApiError,
+)
+
+
+def get_request_params(
+    request: str | None,
+) -> dict[str, str]:
+    """Return the parameters of a SAT>IP request string."""
+    if not request:
+        return {}
+    _query = urlsplit(request).query or request.lstrip("?")
+    return {
+        _name.lower(): _values[0]
+        for _name, _values in parse_qs(_query).items()
+    }
+
+
+def get_transponder_key(
+    params: dict[str, str],
+) -> str | None:
+    """Return a normalized key of the transponder of request parameters."""
+    _frequency = params.get("freq")
+    if not _frequency:
+        return None
+    try:
+        _frequency = str(round(float(_frequency)))
+    except ValueError:
+        return None
+    return ":".join(
+        (
+            params.get("src", ""),
+            _frequency,
+            params.get("pol", "").lower(),
+        )
+    )
+
+
+def get_service_pids(
+    params: dict[str, str],
+) -> list[str]:
+    """Return the service specific PIDs of request parameters."""
+    # PIDs below 32 carry shared tables like PAT, NIT and SDT
+    return [
+        _pid
+        for _pid in params.get("pids", "").split(",")
+        if _pid.isdigit() and int(_pid) >= 32
+    ]
+
+
+def get_channel_value(
+    channel: dict,
+    *names: str,
+) -> any:
+    """Return the first available value of several possible field names."""
+    for _name in names:
+        if (_value := channel.get(_name)) not in (None, ""):
+            return _value
+    return None
+
+
+class OctopusNetChannelCatalog:
+    """Cached and indexed channel list of a device."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: OctopusNetApiClient | None,
+        entry_id: str,
+    ) -> None:
+        """Initialize."""
+        self._client = client
+        self._store: Store[dict] = Store(
+            hass,
+            CHANNEL_STORAGE_VERSION,
+            f"{DOMAIN}.{entry_id}.channels",
+        )
+        self._lock = asyncio.Lock()
+        self._loaded = False
+        self._stale = False
+        self._etag: str | None = None
+        self._digest: str | None = None
+        self._fetched: datetime | None = None
+        self._retry: datetime | None = None
+        self.channels: list[dict] = []
+        self.by_service_id: dict[str, dict] = {}
+        self.by_name: dict[str, dict] = {}
+        self.by_transponder: dict[str, list[dict]] = {}
+        self.by_transponder_pid: dict[str, dict] = {}
+
+    def invalidate(self) -> None:
+        """Revalidate the channel list on next use, e.g. after an EPG scan."""
+        self._stale = True
+
+    async def async_remove(self) -> None:
+        """Remove the stored channel list."""
+        await self._store.async_remove()
+
+    async def async_ensure(self) -> None:
+        """Load the channel list and revalidate it if it is outdated."""
+        async with self._lock:
+            if not self._loaded:
+                await self._async_load()
+            if self._retry is not None and dt_util.utcnow() < self._retry:
+                return
+            if (
+                self._stale
+                or self._fetched is None
+                or dt_util.utcnow() - self._fetched > timedelta(seconds=CHANNEL_REFRESH_INTERVAL)
+            ):
+                await self._async_fetch()
+
+    async def _async_load(self) -> None:
+        """Load the channel list from the storage."""
+        self._loaded = True
+        _stored = await self._store.async_load()
+        if not _stored:
+            return
+        self._etag = _stored.get("etag")
+        self._digest = _stored.get("digest")
+        self._fetched = dt_util.parse_datetime(_stored.get("fetched") or "")
+        self._build_indexes(_stored.get("channels", []))
+
+    async def _async_fetch(self) -> None:
+        """Fetch the channel list if it changed on the device."""
+        try:
+            _channels, _etag = await self._client.async_get_channels(self._etag)
+        except OctopusNetApiError as exception:
+            # Keep the known list and do not ask again on every poll
+            self._retry = dt_util.utcnow() + timedelta(seconds=CHANNEL_RETRY_INTERVAL)
+            LOGGER.error("Error fetching channel list: %s", exception)
+            return
+        self._retry = None
+        self._stale = False
+        self._fetched = dt_util.utcnow()
+        if _channels is None:
+            # Unchanged, the stored list is revalidated once after a restart
+            return
+        _channels = self._flatten(_channels)
+        _digest = hashlib.sha1(
+            json.dumps(_channels, sort_keys=True).encode(),
+            usedforsecurity=False,
+        ).hexdigest()
+        if _digest == self._digest and _etag == self._etag:
+            return
+        if _digest != self._digest:
+            LOGGER.debug("Channel list changed, %s channels", len(_channels))
+            self._digest = _digest
+            self._build_indexes(_channels)
+        self._etag = _etag
+        await self._store.async_save(
+            {
+                "etag": self._etag,
+                "digest": self._digest,
+                "fetched": self._fetched.isoformat(),
+                "channels": self.channels,
+            }
+        )
+
+    @staticmethod
+    def _flatten(
+        channels: list,
+    ) -> list[dict]:
+        """Return the channels of a list that may contain channel groups."""
+        _result = []
+        for _entry in channels:
+            if not isinstance(_entry, dict):
+                continue
+            _group = get_channel_value(_entry, "ChannelList", "channels")
+            if isinstance(_group, list):
+                _result.extend(_channel for _channel in _group if isinstance(_channel, dict))
+            else:
+                _result.append(_entry)
+        return _result
+
+    def _build_indexes(
+        self,
+        channels: list[dict],
+    ) -> None:
+        """Index the channels by service ID, name and transponder."""
+        self.channels = channels
+        self.by_service_id = {}
+        self.by_name = {}
+        self.by_transponder = {}
+        self.by_transponder_pid = {}
+        for _channel in channels:
+            _params = get_request_params(get_channel_value(_channel, "Request", "request"))
+            _service_id = get_channel_value(_channel, "ServiceID", "sid", "SID") or _params.get("sid")
+            if _service_id is not None:
+                self.by_service_id.setdefault(str(_service_id), _channel)
+            _name = get_channel_value(_channel, "Title", "Name", "name")
+            if _name:
+                self.by_name.setdefault(str(_name).casefold(), _channel)
+            _transponder = get_transponder_key(_params)
+            if _transponder:
+                self.by_transponder.setdefault(_transponder, []).append(_channel)
+                for _pid in get_service_pids(_params):
+                    self.by_transponder_pid.setdefault(f"{_transponder}:{_pid}", _channel)
+
+    def resolve(
+        self,
+        request: str | None,
+    ) -> dict | None:
+        """Return the channel of a SAT>IP request.
+
+        Only index lookups are used, the cost does not depend on the size
+        of the channel list.
+        """
+        _params = get_request_params(request)
+        if not _params:
+            return None
+        _service_id = _params.get("sid")
+        if _service_id and (_channel := self.by_service_id.get(_service_id)):
+            return _channel
+        _transponder = get_transponder_key(_params)
+        if not _transponder:
+            return None
+        for _pid in get_service_pids(_params):
+            if _channel := self.by_transponder_pid.get(f"{_transponder}:{_pid}"):
+                return _channel
+        return None
+
+    def resolve_name(
+        self,
+        request: str | None,
+    ) -> str | None:
+        """Return the channel name of a SAT>IP request."""
+        if _channel := self.resolve(request):
+            return get_channel_value(_channel, "Title", "Name", "name")
+        return None
@@ -1,8 +1,11 @@
 """Adds config flow for Digital Devices Octopus NET."""
 from __future__ import annotations
 
+from homeassistant.core import callback
 from homeassistant.config_entries import (
+    ConfigEntry,
     ConfigFlow,
+    OptionsFlow,
     CONN_CLASS_LOCAL_PUSH,
 )
 from homeassistant.const import (
@@ -17,9 +20,6 @@ from homeassistant.data_entry_flow import FlowResult
 from homeassistant.helpers import (
     selector,
 )
-from homeassistant.helpers.aiohttp_client import (
-    async_create_clientsession,
-)
 import voluptuous as vol
 
 from .const import (
@@ -27,8 +27,10 @@ from .const import (
     DOMAIN,
     CONF_TUNER_COUNT,
     CONF_STREAM_COUNT,
+    CONF_LIVE_MODE,
 )
 from .api import (
+    create_session,
     OctopusNetApiClient,
     OctopusNetApiTimeoutError,
     OctopusNetApiCommunicationError,
@@ -46,6 +48,14 @@ class OctopusNetConfigFlow(ConfigFlow, domain=DOMAIN):
         self.data: dict[str, any] | None = None
         self.options: dict[str, any] | None = None
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: ConfigEntry,
+    ) -> OctopusNetOptionsFlow:
+        """Get the options flow for this handler."""
+        return OctopusNetOptionsFlow()
+
     async def async_step_user(
         self,
         user_input: dict[str, any] | None = None,
@@ -59,16 +69,19 @@ class OctopusNetConfigFlow(ConfigFlow, domain=DOMAIN):
                     CONF_PORT: user_input.get(CONF_PORT),
                 }
             )
-            try:
-                client = OctopusNetApiClient(
-                    host=user_input.get(CONF_HOST),
-                    username=user_input.get(CONF_USERNAME),
-                    password=user_input.get(CONF_PASSWORD),
-                    port=int(user_input.get(CONF_PORT)),
+            client = OctopusNetApiClient(
+                host=user_input.get(CONF_HOST),
+                username=user_input.get(CONF_USERNAME),
+                password=user_input.get(CONF_PASSWORD),
+                port=int(user_input.get(CONF_PORT)),
+                tls=user_input.get(CONF_SSL, False),
+                verify_ssl=user_input.get(CONF_VERIFY_SSL, False),
+                session=create_session(
                     tls=user_input.get(CONF_SSL, False),
                     verify_ssl=user_input.get(CONF_VERIFY_SSL, False),
-                    session=async_create_clientsession(self.hass, user_input.get(CONF_VERIFY_SSL, False)),
-                )
+                ),
+            )
+            try:
                 _tuners = await client.async_get_tuner_status()
                 _streams = await client.async_get_stream_status()
             except OctopusNetApiAuthenticationError:
@@ -82,6 +95,8 @@ class OctopusNetConfigFlow(ConfigFlow, domain=DOMAIN):
             except Exception as exception:
                 LOGGER.exception(exception)
                 errors["base"] = "unknown"
+            finally:
+                await client.async_close()
 
             if not errors:
                 # Input is valid, set data
@@ -150,3 +165,26 @@ class OctopusNetConfigFlow(ConfigFlow, domain=DOMAIN):
             ),
             errors=errors,
         )
+
+
+class OctopusNetOptionsFlow(OptionsFlow):
+    """Digital Devices Octopus NET options flow."""
+
+    async def async_step_init(
+        self,
+        user_input: dict[str, any] | None = None,
+    ) -> FlowResult:
+        """Manage the options of a device."""
+        if user_input is not None:
+            return self.async_create_entry(data=user_input)
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_LIVE_MODE,
+                        default=self.config_entry.options.get(CONF_LIVE_MODE, False),
+                    ): selector.BooleanSelector(),
+                }
+            ),
+        )
@@ -5,6 +5,8 @@ import voluptuous as vol
 from homeassistant.const import (
     Platform,
     CONF_DEVICE_ID,
+    CONF_TIMEOUT,
+    ATTR_TEMPERATURE,
 )
 from homeassistant.helpers import config_validation as cv
 
@@ -20,9 +22,42 @@ PLATFORMS = [
 ]
 
 UPDATE_INTERVAL = 120
+POLL_TIMEOUT = 20
+POLL_CONCURRENCY = 4
+REQUEST_LATENCY_SAMPLES = 100
+RAW_CAPTURE_RESPONSES = 5
+RAW_CAPTURE_BYTES = 16384
+CIRCUIT_FAILURE_THRESHOLD = 3
+CIRCUIT_BACKOFF_MIN = 60
+CIRCUIT_BACKOFF_MAX = 1800
+CIRCUIT_PROBE_TIMEOUT = 5
+SESSION_CONNECTION_LIMIT = 5
+SESSION_KEEPALIVE_TIMEOUT = 150
+SESSION_DNS_CACHE_TTL = 300
+LOG_TAIL_SUFFIX = 4096
+LOG_TAIL_ANCHOR = 64
+LOG_STREAM_CHUNK = 16384
+TEMPERATURE_LOG_INTERVAL = 60
+EPG_SCAN_POLL_INTERVAL = 5
+LIVE_UPDATE_INTERVAL = 3
+CHANNEL_STORAGE_VERSION = 1
+CHANNEL_REFRESH_INTERVAL = 86400
+CHANNEL_RETRY_INTERVAL = 900
+SIGNAL_WINDOW_SIZE = 120
+SIGNAL_BASELINE_ALPHA = 0.05
+SIGNAL_WARMUP_SAMPLES = 20
+SIGNAL_DEVIATION_FACTOR = 3
+SIGNAL_FLAP_WINDOW = 10
+SIGNAL_FLAP_THRESHOLD = 3
+SIGNAL_LOCK_LOSS_POLLS = 3
 
 CONF_TUNER_COUNT = "tuner_count"
 CONF_STREAM_COUNT = "stream_count"
+CONF_LIVE_MODE = "live_mode"
+
+UNIT_PACKETS_PER_SECOND = "packets/s"
+
+EVENT_SIGNAL_DEGRADED = f"{DOMAIN}_signal_degraded"
 
 ATTR_UPDATE = "update"
 ATTR_FANSPEED = "fanspeed"
@@ -30,8 +65,12 @@ ATTR_EXTRA_STATE_ATTRIBUTES = "extra_state_attributes"
 ATTR_EPG = "epg"
 ATTR_EPG_SCAN = "epg_scan"
 ATTR_REBOOT = "reboot"
+ATTR_REBOOTING = "rebooting"
 ATTR_TOTAL = "total"
 ATTR_EVENTS = "events"
+ATTR_PROGRESS = "progress"
+ATTR_EVENT_RATE = "event_rate"
+ATTR_ETA = "eta"
 ATTR_TUNER = "tuner"
 ATTR_LOCK = "lock"
 ATTR_STRENGTH = "strength"
@@ -43,18 +82,88 @@ ATTR_INPUT = "input"
 ATTR_PACKETS = "packets"
 ATTR_BYTES = "bytes"
 ATTR_CLIENT = "client"
+ATTR_CHANNEL = "channel"
+ATTR_BITRATE = "bitrate"
+ATTR_PACKET_RATE = "packet_rate"
 ATTR_AVAILABLE = "available"
 ATTR_LAST_PULL = "last_pull"
+ATTR_SKIPPED_WRITES = "skipped_writes"
+ATTR_POLL_DURATION = "poll_duration"
+ATTR_CHANNELS = "channels"
+ATTR_LATENCY = "latency"
+ATTR_REQUESTS = "requests"
+ATTR_ERRORS = "errors"
+ATTR_ERROR_CLASSES = "error_classes"
+ATTR_P50 = "p50"
+ATTR_P95 = "p95"
+ATTR_MAX = "max"
+ATTR_MIN = "min"
+ATTR_MEAN = "mean"
+ATTR_STDDEV = "stddev"
+ATTR_SAMPLES = "samples"
+ATTR_LOCK_LOSSES = "lock_losses"
+ATTR_DEGRADED = "degraded"
+ATTR_BASELINE = "baseline"
+ATTR_REASONS = "reasons"
+ATTR_LOCK_CHANGES = "lock_changes"
+
+# Poll intervals in seconds per data section while (idle, active)
+SECTION_UPDATE_INTERVALS = {
+    ATTR_FANSPEED: (UPDATE_INTERVAL, UPDATE_INTERVAL),
+    ATTR_TEMPERATURE: (UPDATE_INTERVAL, UPDATE_INTERVAL),
+    ATTR_EPG: (UPDATE_INTERVAL, UPDATE_INTERVAL),
+    ATTR_TUNER: (UPDATE_INTERVAL, 15),
+    ATTR_STREAM: (UPDATE_INTERVAL, 15),
+}
+UPDATE_INTERVAL_MIN = 5
+
+# Smallest drop below the baseline that counts as degradation, in dB and dBµV
+SIGNAL_MIN_DEVIATION = {
+    ATTR_SNR: 1.5,
+    ATTR_STRENGTH: 3,
+}
+
+REQUEST_ENDPOINTS = {
+    ATTR_FANSPEED: "/system/fanspeed",
+    ATTR_TEMPERATURE: "/log/Temperatur.log",
+    ATTR_EPG: "/epg/status",
+    ATTR_TUNER: "/octoserve/tunerstatus.json",
+    ATTR_STREAM: "/octoserve/streamstatus.json",
+    ATTR_CHANNELS: "/channels/data",
+}
+
+REBOOT_DOWN_DELAY = 15
+REBOOT_PROBE_INTERVAL = 5
+REBOOT_PROBE_INTERVAL_MAX = 30
+REBOOT_TIMEOUT = 600
+
+CONF_WAVE_SIZE = "wave_size"
+CONF_WAIT_ONLINE = "wait_online"
+SERVICE_WAVE_SIZE = 5
+SERVICE_TIMEOUT = 60
 
 SERVICE_REBOOT = "reboot"
 SERVICE_REBOOT_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_DEVICE_ID): cv.entity_ids_or_uuids,
+        vol.Optional(CONF_WAVE_SIZE, default=SERVICE_WAVE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_WAIT_ONLINE, default=False): cv.boolean,
+        vol.Optional(CONF_TIMEOUT, default=SERVICE_TIMEOUT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3600)
+        ),
     }
 )
 SERVICE_EPG_SCAN = "epg_scan"
 SERVICE_EPG_SCAN_SCHEMA = vol.Schema(
     {
         vol.Required(CONF_DEVICE_ID): cv.entity_ids_or_uuids,
+        vol.Optional(CONF_WAVE_SIZE, default=SERVICE_WAVE_SIZE): vol.All(
+            vol.Coerce(int), vol.Range(min=1)
+        ),
+        vol.Optional(CONF_TIMEOUT, default=SERVICE_TIMEOUT): vol.All(
+            vol.Coerce(int), vol.Range(min=1, max=3600)
+        ),
     }
 )
@@ -2,10 +2,11 @@
 from __future__ import annotations
 
 import asyncio
+from collections.abc import Callable
 
 from datetime import timedelta
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
 from homeassistant.const import (
     CONF_HOST,
     CONF_USERNAME,
@@ -13,11 +14,13 @@ from homeassistant.const import (
     CONF_PORT,
     CONF_SSL,
     CONF_VERIFY_SSL,
-    ATTR_STATE,
+    ATTR_DEVICE_ID,
     ATTR_TEMPERATURE,
+    EVENT_HOMEASSISTANT_STOP,
+    EVENT_HOMEASSISTANT_CLOSE,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers import device_registry as dr
 from homeassistant.helpers.update_coordinator import (
     DataUpdateCoordinator,
 )
@@ -27,31 +30,52 @@ from .const import (
     DOMAIN,
     LOGGER,
     UPDATE_INTERVAL,
-    ATTR_UPDATE,
+    UPDATE_INTERVAL_MIN,
+    SECTION_UPDATE_INTERVALS,
+    REQUEST_ENDPOINTS,
+    POLL_TIMEOUT,
+    CONF_TUNER_COUNT,
+    CONF_STREAM_COUNT,
+    CONF_LIVE_MODE,
+    EVENT_SIGNAL_DEGRADED,
     ATTR_FANSPEED,
-    ATTR_EXTRA_STATE_ATTRIBUTES,
     ATTR_EPG,
-    ATTR_EPG_SCAN,
     ATTR_REBOOT,
-    ATTR_TOTAL,
-    ATTR_EVENTS,
     ATTR_TUNER,
+    ATTR_STREAM,
     ATTR_LOCK,
     ATTR_STRENGTH,
     ATTR_SNR,
-    ATTR_QUALITY,
-    ATTR_LEVEL,
-    ATTR_STREAM,
-    ATTR_INPUT,
-    ATTR_PACKETS,
-    ATTR_BYTES,
-    ATTR_CLIENT,
-    ATTR_AVAILABLE,
-    ATTR_LAST_PULL,
+    ATTR_DEGRADED,
+    ATTR_BASELINE,
+    ATTR_REASONS,
+    ATTR_LOCK_CHANGES,
 )
 from .api import (
+    create_session,
     OctopusNetApiClient,
     OctopusNetApiError,
+    OctopusNetApiTimeoutError,
+    OctopusNetApiCircuitOpenError,
+)
+from .history import OctopusNetTemperatureHistory
+from .channels import (
+    OctopusNetChannelCatalog,
+    get_request_params,
+    get_transponder_key,
+)
+from .orchestrator import async_get_orchestrator
+from .epg import OctopusNetEpgScanTracker
+from .reboot import OctopusNetRebootWatcher
+from .live import OctopusNetLiveUpdater
+from .tuner_signal import (
+    OctopusNetSignalWindow,
+    OctopusNetSignalDetector,
+)
+from .models import (
+    OctopusNetRecord,
+    OctopusNetTunerRecord,
+    OctopusNetSnapshot,
 )
 
 
@@ -81,14 +105,102 @@ class OctopusNetDataUpdateCoordinator(DataUpdateCoordinator):
             port=config_entry.data.get(CONF_PORT),
             tls=config_entry.data.get(CONF_SSL),
             verify_ssl=config_entry.data.get(CONF_VERIFY_SSL),
-            session=async_get_clientsession(hass),
+            session=create_session(
+                tls=config_entry.data.get(CONF_SSL),
+                verify_ssl=config_entry.data.get(CONF_VERIFY_SSL),
+            ),
+        )
+        self.history = OctopusNetTemperatureHistory(
+            hass=hass,
+            client=self.client,
+            host=config_entry.data.get(CONF_HOST),
+        )
+        self.channels = OctopusNetChannelCatalog(
+            hass=hass,
+            client=self.client,
+            entry_id=config_entry.entry_id,
+        )
+        self.epg_tracker = OctopusNetEpgScanTracker(
+            hass=hass,
+            config_entry=config_entry,
+            client=self.client,
+            update_callback=self.async_set_epg_status,
         )
-        self.data = {}
+        self.reboot_watcher = OctopusNetRebootWatcher(
+            hass=hass,
+            config_entry=config_entry,
+            client=self.client,
+            ready_callback=self._async_reboot_finished,
+        )
+        self.live_updater = OctopusNetLiveUpdater(
+            hass=hass,
+            config_entry=config_entry,
+            update_method=self.async_live_update,
+        )
+        self.orchestrator = async_get_orchestrator(hass)
+        # Spread the polls of several devices, applied once after the first refresh
+        self._jitter = self.orchestrator.get_jitter(config_entry.entry_id, UPDATE_INTERVAL)
+        self.data = OctopusNetSnapshot()
         self._loop = asyncio.get_event_loop()
         self._scheduled_update_listeners: asyncio.TimerHandle | None = None
+        self._section_next_poll: dict[str, float] = {}
+        self._changed_keys: set[str] | None = None
+        self.skipped_writes = 0
+        self.unchanged_sections: dict[str, int] = {}
+        # Last processed tuner and stream lists
+        self._slot_status: dict[str, list] = {}
+        # Loop time of the response of the last processed lists and of the
+        # sections fetched by the current poll
+        self._slot_fetched: dict[str, float] = {}
+        self._section_fetched: dict[str, float] = {}
+        # The counts found at configuration are replaced by the polled lists
+        self.tuner_count: int = config_entry.data.get(CONF_TUNER_COUNT, 0)
+        self.stream_count: int = config_entry.data.get(CONF_STREAM_COUNT, 0)
+        self._slot_listeners: list[CALLBACK_TYPE] = []
+        self._slots_changed = False
+        self._signal_windows: list[OctopusNetSignalWindow] = [
+            OctopusNetSignalWindow() for _ in range(self.tuner_count)
+        ]
+        self._signal_detectors: list[OctopusNetSignalDetector] = [
+            OctopusNetSignalDetector() for _ in range(self.tuner_count)
+        ]
+        # Counters of the previous poll per stream: (monotonic time, packets, bytes)
+        self._stream_counters: list[tuple[float, int, int] | None] = [
+            None
+        ] * self.stream_count
+        self._force_update = False
+        # Channel names of the active streams per tuner input
+        self._input_channels: dict[int, list[str]] = {}
+        # Transponder of the active streams per tuner input
+        self._input_transponders: dict[int, str] = {}
 
     async def initialize(self) -> None:
         """Set up a Octopus NET instance."""
+        if self.history.needs_backfill:
+            self._start_history_backfill()
+        # Entries are not unloaded when Home Assistant stops
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_STOP,
+                lambda _event: self.history.flush(),
+            )
+        )
+        self.config_entry.async_on_unload(
+            self.hass.bus.async_listen_once(
+                EVENT_HOMEASSISTANT_CLOSE,
+                lambda _event: self.client.detach(),
+            )
+        )
+        if self.config_entry.options.get(CONF_LIVE_MODE, False):
+            self.live_updater.async_start()
+
+    def _start_history_backfill(self) -> None:
+        """Import the temperature log into the statistics in the background."""
+        self.config_entry.async_create_background_task(
+            self.hass,
+            self.history.async_backfill(),
+            f"{DOMAIN}_temperature_history_{self.config_entry.entry_id}",
+        )
 
     async def __aenter__(self):
         """Return Self."""
@@ -96,245 +208,891 @@ class OctopusNetDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def __aexit__(self, *excinfo):
         """Close Session before class is destroyed."""
-        await self.client._session.close()
+        await self.async_close()
 
-    async def _async_update_data(self):
-        """Update data via library."""
-        self.data = {
-            ATTR_UPDATE: {
-                ATTR_AVAILABLE: True,
-            },
-            ATTR_FANSPEED: {
-                ATTR_STATE: None,
-                ATTR_AVAILABLE: False,
-            },
-            ATTR_TEMPERATURE: {
-                ATTR_STATE: None,
-                ATTR_AVAILABLE: False,
-            },
-            ATTR_EPG: {
-                ATTR_STATE: None,
-                ATTR_EXTRA_STATE_ATTRIBUTES: {
-                    ATTR_TOTAL: None,
-                    ATTR_EVENTS: None,
-                },
-                ATTR_AVAILABLE: False,
-            },
-            ATTR_EPG_SCAN: {
-                ATTR_AVAILABLE: False,
-            },
-            ATTR_REBOOT: {
-                ATTR_AVAILABLE: False,
-            },
-            ATTR_TUNER: {
-                ATTR_STATE: None,
-                ATTR_EXTRA_STATE_ATTRIBUTES: {
-                    ATTR_LOCK: None,
-                    ATTR_STRENGTH: None,
-                    ATTR_SNR: None,
-                    ATTR_QUALITY: None,
-                    ATTR_LEVEL: None,
-                },
-                ATTR_AVAILABLE: False,
-            },
-            ATTR_STREAM: {
-                ATTR_STATE: None,
-                ATTR_EXTRA_STATE_ATTRIBUTES: {
-                    ATTR_INPUT: None,
-                    ATTR_PACKETS: None,
-                    ATTR_BYTES: None,
-                    ATTR_CLIENT: None,
-                },
-                ATTR_AVAILABLE: False,
-            },
-            ATTR_LAST_PULL: None,
-            ATTR_AVAILABLE: False,
+    async def async_close(self) -> None:
+        """Close the session of the device."""
+        if self._scheduled_update_listeners:
+            self._scheduled_update_listeners.cancel()
+            self._scheduled_update_listeners = None
+        self.orchestrator.async_remove(self.config_entry.entry_id)
+        # Continued from the statistics after the next start
+        self.history.flush()
+        await self.client.async_close()
+
+    def _get_section(
+        self,
+        key: str,
+    ) -> str | None:
+        """Return the data section an entity key belongs to."""
+        if key == ATTR_REBOOT:
+            return ATTR_TEMPERATURE
+        for _section in SECTION_UPDATE_INTERVALS:
+            if key == _section or key.startswith(f"{_section}_"):
+                return _section
+        return None
+
+    def _get_due_sections(
+        self,
+        now: float,
+    ) -> list[str]:
+        """Return the sections whose poll interval has elapsed."""
+        if self._force_update:
+            self._force_update = False
+            return list(SECTION_UPDATE_INTERVALS)
+        _live_sections = self._get_live_sections()
+        return [
+            _section
+            for _section in SECTION_UPDATE_INTERVALS
+            # Tolerate a little drift of the refresh timer
+            if _section not in _live_sections
+            and self._section_next_poll.get(_section, 0) <= now + 1
+        ]
+
+    def _get_live_sections(self) -> tuple[str, ...]:
+        """Return the sections kept current by the live updates instead of the poll.
+
+        The first lists are fetched by the poll, so all slots are known after setup.
+        """
+        if not self.live_updater.running:
+            return ()
+        return tuple(
+            _section
+            for _section in (ATTR_TUNER, ATTR_STREAM)
+            if _section in self._slot_fetched
+        )
+
+    def _schedule_sections(
+        self,
+        sections: list[str],
+        now: float,
+    ) -> None:
+        """Plan the next poll of the polled sections and the next refresh."""
+        # Zapping changes tuners and streams, poll both faster while in use.
+        # A running EPG scan is followed by the EPG scan tracker instead.
+        # Live updates keep both current, the regular poll skips them and
+        # only takes over once the live updates stopped
+        _live_sections = self._get_live_sections()
+        _tuner_active = (
+            bool(self.data.tuner.state or self.data.stream.state)
+            and not _live_sections
+        )
+        _active = {
+            ATTR_TUNER: _tuner_active,
+            ATTR_STREAM: _tuner_active,
         }
+        for _section in (*sections, *_live_sections):
+            _idle_interval, _active_interval = SECTION_UPDATE_INTERVALS[_section]
+            self._section_next_poll[_section] = now + (
+                _active_interval if _active.get(_section) else _idle_interval
+            )
+        if self._jitter:
+            for _section in self._section_next_poll:
+                self._section_next_poll[_section] += self._jitter
+            self._jitter = 0
 
-        try:
-            self.data.update(
-                {
-                    ATTR_FANSPEED: {
-                        ATTR_STATE: await self.client.async_get_fanspeed(),
-                        ATTR_AVAILABLE: True,
-                    },
-                }
+        self.update_interval = timedelta(
+            seconds=max(
+                UPDATE_INTERVAL_MIN,
+                min(self._section_next_poll.values()) - now,
             )
-        except OctopusNetApiError as exception:
-            LOGGER.error(str(exception))
-        except Exception as exception:
-            LOGGER.exception(exception)
+        )
 
-        try:
-            self.data.update(
-                {
-                    ATTR_TEMPERATURE: {
-                        ATTR_STATE: await self.client.async_get_temperature(),
-                        ATTR_AVAILABLE: True,
-                    },
-                    ATTR_REBOOT: {
-                        ATTR_AVAILABLE: True,
-                    },
-                }
+    @callback
+    def async_add_slot_listener(
+        self,
+        update_callback: CALLBACK_TYPE,
+    ) -> CALLBACK_TYPE:
+        """Listen for a changed number of tuners or streams."""
+        self._slot_listeners.append(update_callback)
+
+        @callback
+        def _remove_listener() -> None:
+            self._slot_listeners.remove(update_callback)
+
+        return _remove_listener
+
+    def get_section_schedule(self) -> dict[str, float]:
+        """Return the seconds until the next poll of each section."""
+        _now = self.hass.loop.time()
+        return {
+            _section: round(max(0, _next_poll - _now), 1)
+            for _section, _next_poll in self._section_next_poll.items()
+        }
+
+    async def _async_fetch_sections(
+        self,
+        sections: list[str],
+        changed_only: set[str] | None = None,
+    ) -> dict[str, any]:
+        """Fetch the endpoints of the sections concurrently within the poll deadline.
+
+        Sections in changed_only get None as result if their response did not change.
+        """
+        _requests = {
+            ATTR_FANSPEED: self.client.async_get_fanspeed,
+            ATTR_TEMPERATURE: self.client.async_get_temperature,
+            ATTR_EPG: self.client.async_get_epg,
+            ATTR_TUNER: self.client.async_get_tuner_status,
+            ATTR_STREAM: self.client.async_get_stream_status,
+        }
+
+        async def _async_fetch(section: str) -> any:
+            _result = await (
+                _requests[section](changed_only=True)
+                if section in (changed_only or ())
+                else _requests[section]()
             )
-        except OctopusNetApiError as exception:
-            LOGGER.error(str(exception))
-        except Exception as exception:
-            LOGGER.exception(exception)
+            # Orders the lists of the poll and of the live updates
+            self._section_fetched[section] = self.hass.loop.time()
+            return _result
 
-        try:
-            _epg = await self.client.async_get_epg()
-            _epg_state = _epg.get("status") == "active"
-
-            self.data.update(
-                {
-                    ATTR_EPG: {
-                        ATTR_STATE: _epg_state,
-                        ATTR_EXTRA_STATE_ATTRIBUTES: {
-                            ATTR_TOTAL: _epg.get("total", 0),
-                            ATTR_EVENTS: _epg.get("events", 0),
-                        },
-                        ATTR_AVAILABLE: True,
-                    },
-                    ATTR_EPG_SCAN: {
-                        ATTR_AVAILABLE: True,
-                    },
-                }
+        _tasks = {
+            _section: asyncio.create_task(_async_fetch(_section))
+            for _section in sections
+        }
+        if not _tasks:
+            return {}
+        _done, _pending = await asyncio.wait(
+            _tasks.values(),
+            timeout=POLL_TIMEOUT,
+        )
+        for _task in _pending:
+            _task.cancel()
+
+        _results = {}
+        for _section, _task in _tasks.items():
+            if _task in _pending:
+                _results[_section] = OctopusNetApiTimeoutError(
+                    f"Poll deadline exceeded fetching {_section}"
+                )
+            elif _task.exception() is not None:
+                _results[_section] = _task.exception()
+            else:
+                _results[_section] = _task.result()
+        return _results
+
+    def _get_cacheable_sections(self) -> set[str]:
+        """Return the sections that may be skipped if their response did not change."""
+        # Unavailable sections are fetched in full to recover them
+        return {
+            _section
+            for _section, _record in (
+                (ATTR_FANSPEED, self.data.fanspeed),
+                (ATTR_EPG, self.data.epg),
+                (ATTR_TUNER, self.data.tuner),
+                (ATTR_STREAM, self.data.stream),
             )
-        except OctopusNetApiError as exception:
+            if _record.available
+        }
+
+    def _get_section_result(
+        self,
+        results: dict[str, any],
+        section: str,
+    ) -> any:
+        """Return the fetched result of a section or raise its failure."""
+        _result = results.get(section)
+        if isinstance(_result, BaseException):
+            raise _result
+        return _result
+
+    def _log_api_error(
+        self,
+        exception: OctopusNetApiError,
+    ) -> None:
+        """Log a failed request, skipped requests only at debug level."""
+        # The circuit breaker already logs when a device becomes unreachable
+        if isinstance(exception, OctopusNetApiCircuitOpenError):
+            LOGGER.debug(str(exception))
+        else:
             LOGGER.error(str(exception))
-        except Exception as exception:
-            LOGGER.exception(exception)
 
-        try:
-            _tuner_index = 1
-            _tuner_total_lock = False
-            _tuner_total_count = _tuner_total_strength = _tuner_total_snr = _tuner_total_quality = _tuner_total_level = 0
-            _tuner_status = await self.client.async_get_tuner_status()
-            for _tuner in _tuner_status:
-                _tuner_key = f"{ATTR_TUNER}_{_tuner_index}"
-                _tuner_state = _tuner.get("Status") == "Active"
-                _tuner_lock = _tuner.get("Lock", False)
-                _tuner_strength = _tuner_snr = _tuner_quality = _tuner_level = 0
-                if _tuner_state:
-                    if _tuner_lock:
-                        _tuner_total_lock = True
-                    _tuner_strength = ((int(_tuner.get("Strength", 0)) + 108750) / 1000)
-                    _tuner_snr = (int(_tuner.get("SNR", 0)) / 1000)
-                    _tuner_quality = _tuner.get("Quality", 0)
-                    _tuner_level = _tuner.get("Level", 0)
-                    _tuner_total_count += 1
-                    _tuner_total_strength += _tuner_strength
-                    _tuner_total_snr += _tuner_snr
-                    _tuner_total_quality += _tuner_quality
-                    _tuner_total_level += _tuner_level
-
-                self.data.update(
-                    {
-                        _tuner_key: {
-                            ATTR_STATE: _tuner_state,
-                            ATTR_EXTRA_STATE_ATTRIBUTES: {
-                                ATTR_LOCK: _tuner_lock,
-                                ATTR_STRENGTH: _tuner_strength,
-                                ATTR_SNR: _tuner_snr,
-                                ATTR_QUALITY: _tuner_quality,
-                                ATTR_LEVEL: _tuner_level,
-                            },
-                            ATTR_AVAILABLE: True,
-                        },
-                    }
+    def _set_record(
+        self,
+        record: OctopusNetRecord,
+        **values: any,
+    ) -> None:
+        """Update a record and remember it as changed."""
+        if record.update(**values):
+            self._changed_keys.add(record.key)
+
+    def _set_section_unavailable(
+        self,
+        section: str,
+    ) -> None:
+        """Mark the records of a section as unavailable."""
+        if section == ATTR_FANSPEED:
+            self._set_record(self.data.fanspeed, state=None, available=False)
+        elif section == ATTR_TEMPERATURE:
+            self._set_record(self.data.temperature, state=None, available=False)
+            self._set_record(self.data.reboot, available=False)
+        elif section == ATTR_EPG:
+            self._set_record(
+                self.data.epg,
+                state=None,
+                total=None,
+                events=None,
+                progress=None,
+                event_rate=None,
+                eta=None,
+                available=False,
+            )
+            self._set_record(self.data.epg_scan, available=False)
+        elif section == ATTR_TUNER:
+            self._set_record(
+                self.data.tuner,
+                state=None,
+                lock=None,
+                strength=None,
+                snr=None,
+                quality=None,
+                level=None,
+                channel=None,
+                available=False,
+            )
+            for _record in self.data.tuners:
+                self._set_record(_record, state=None, channel=None, available=False)
+        elif section == ATTR_STREAM:
+            self._set_record(
+                self.data.stream,
+                state=None,
+                input=None,
+                packets=None,
+                bytes=None,
+                client=None,
+                channel=None,
+                available=False,
+            )
+            self._set_record(self.data.stream_bitrate, state=None, available=False)
+            self._set_record(self.data.stream_packet_rate, state=None, available=False)
+            self._input_channels = {}
+            self._input_transponders = {}
+            for _record in self.data.streams:
+                self._set_record(_record, state=None, channel=None, available=False)
+            for _record in (
+                *self.data.stream_bitrates,
+                *self.data.stream_packet_rates,
+            ):
+                self._set_record(_record, state=None, available=False)
+
+    def _update_epg_data(
+        self,
+        epg: dict,
+    ) -> None:
+        """Update the data of the EPG scan."""
+        _epg_state = epg.get("status") == "active"
+        if self.data.epg.state and not _epg_state:
+            # A finished EPG scan may have changed the channel list
+            self.channels.invalidate()
+        self.epg_tracker.update(epg, self.hass.loop.time())
+        self._set_record(
+            self.data.epg,
+            state=_epg_state,
+            total=epg.get("total", 0),
+            events=epg.get("events", 0),
+            progress=self.epg_tracker.progress,
+            event_rate=self.epg_tracker.event_rate,
+            eta=self.epg_tracker.eta,
+            available=True,
+        )
+        self._set_record(self.data.epg_scan, available=True)
+        if _epg_state:
+            self.epg_tracker.async_start()
+
+    @callback
+    def async_set_epg_status(
+        self,
+        epg: dict,
+    ) -> None:
+        """Update the EPG data from the EPG scan tracker."""
+        self._async_update_records(lambda: self._update_epg_data(epg))
+
+    @callback
+    def _async_update_records(
+        self,
+        update: Callable[[], None],
+    ) -> None:
+        """Update records outside of a poll and notify their listeners."""
+        # Keep the changes of a poll that may be in progress apart
+        _changed_keys = self._changed_keys
+        self._changed_keys = set()
+        update()
+        self.async_update_listeners()
+        self._changed_keys = _changed_keys
+
+    def _update_tuner_data(
+        self,
+        tuner_status: list,
+    ) -> None:
+        """Update the data of all tuners."""
+        if len(tuner_status) != self.tuner_count:
+            self.tuner_count = len(tuner_status)
+            self._slots_changed = True
+            for _record in self.data.tuners[self.tuner_count:]:
+                # Entities of retired tuners stay and become unavailable
+                self._set_record(_record, available=False)
+            del self._signal_windows[self.tuner_count:]
+            del self._signal_detectors[self.tuner_count:]
+            self._signal_windows.extend(
+                OctopusNetSignalWindow()
+                for _ in range(self.tuner_count - len(self._signal_windows))
+            )
+            self._signal_detectors.extend(
+                OctopusNetSignalDetector()
+                for _ in range(self.tuner_count - len(self._signal_detectors))
+            )
+        self.data.resize_tuners(self.tuner_count)
+        _tuner_total_lock = False
+        _tuner_total_channels = []
+        _tuner_total_count = _tuner_total_strength = _tuner_total_snr = _tuner_total_quality = _tuner_total_level = 0
+        for _tuner_index, (_tuner, _record) in enumerate(
+            zip(
+                tuner_status,
+                self.data.tuners,
+                strict=False,
+            )
+        ):
+            _tuner_state = _tuner.get("Status") == "Active"
+            _tuner_lock = _tuner.get("Lock", False)
+            _tuner_strength = _tuner_snr = _tuner_quality = _tuner_level = 0
+            _tuner_channels = []
+            if _tuner_state:
+                _tuner_channels = self._input_channels.get(_tuner_index, [])
+                _tuner_total_channels.extend(_tuner_channels)
+                if _tuner_lock:
+                    _tuner_total_lock = True
+                _tuner_strength = ((int(_tuner.get("Strength", 0)) + 108750) / 1000)
+                _tuner_snr = (int(_tuner.get("SNR", 0)) / 1000)
+                _tuner_quality = _tuner.get("Quality", 0)
+                _tuner_level = _tuner.get("Level", 0)
+                _tuner_total_count += 1
+                _tuner_total_strength += _tuner_strength
+                _tuner_total_snr += _tuner_snr
+                _tuner_total_quality += _tuner_quality
+                _tuner_total_level += _tuner_level
+
+            self._set_record(
+                _record,
+                state=_tuner_state,
+                lock=_tuner_lock,
+                strength=_tuner_strength,
+                snr=_tuner_snr,
+                quality=_tuner_quality,
+                level=_tuner_level,
+                channel=", ".join(_tuner_channels) or None,
+                available=True,
+            )
+            self._add_signal_sample(_tuner_index, _record)
+
+        if _tuner_total_count > 0:
+            _tuner_total_strength = (_tuner_total_strength / _tuner_total_count)
+            _tuner_total_snr = (_tuner_total_snr / _tuner_total_count)
+            _tuner_total_quality = (_tuner_total_quality / _tuner_total_count)
+            _tuner_total_level = (_tuner_total_level / _tuner_total_count)
+
+        self._set_record(
+            self.data.tuner,
+            state=_tuner_total_count,
+            lock=_tuner_total_lock,
+            strength=_tuner_total_strength,
+            snr=_tuner_total_snr,
+            quality=_tuner_total_quality,
+            level=_tuner_total_level,
+            channel=", ".join(_tuner_total_channels) or None,
+            available=True,
+        )
+
+    def _update_unchanged_tuner_data(self) -> None:
+        """Add the poll of an unchanged tuner list without processing it again.
+
+        The records hold the values of the list, only the signal statistics
+        and the channels, which follow the streams, are updated.
+        """
+        _tuner_total_channels = []
+        for _tuner_index, _record in enumerate(self.data.tuners):
+            _tuner_channels = []
+            if _record.state:
+                _tuner_channels = self._input_channels.get(_tuner_index, [])
+                _tuner_total_channels.extend(_tuner_channels)
+            self._set_record(_record, channel=", ".join(_tuner_channels) or None)
+            self._add_signal_sample(_tuner_index, _record)
+        self._set_record(
+            self.data.tuner,
+            channel=", ".join(_tuner_total_channels) or None,
+        )
+
+    def _add_signal_sample(
+        self,
+        index: int,
+        record: OctopusNetTunerRecord,
+    ) -> None:
+        """Add the values of a tuner record to its signal window and detector."""
+        _window = self._signal_windows[index]
+        _detector = self._signal_detectors[index]
+        _window.add(
+            active=record.state,
+            lock=record.lock,
+            strength=record.strength,
+            snr=record.snr,
+            quality=record.quality,
+            level=record.level,
+        )
+        _reasons = _detector.update(
+            active=record.state,
+            lock=record.lock,
+            tuning=self._input_transponders.get(index),
+            strength=record.strength,
+            snr=record.snr,
+        )
+        self._set_record(
+            record,
+            statistics={
+                **_window.as_attributes(),
+                ATTR_DEGRADED: _detector.degraded,
+            },
+        )
+        if _reasons:
+            self._fire_signal_degraded(index + 1, _detector, _reasons, record)
+
+    def _fire_signal_degraded(
+        self,
+        tuner: int,
+        detector: OctopusNetSignalDetector,
+        reasons: list[str],
+        record: OctopusNetTunerRecord,
+    ) -> None:
+        """Fire an event for a tuner whose signal left its baseline."""
+        _host = self.config_entry.data.get(CONF_HOST)
+        _device = dr.async_get(self.hass).async_get_device(
+            identifiers={(DOMAIN, _host)}
+        )
+        LOGGER.info(
+            "Signal of tuner %s of %s degraded: %s",
+            tuner,
+            self.config_entry.title,
+            ", ".join(reasons),
+        )
+        self.hass.bus.async_fire(
+            EVENT_SIGNAL_DEGRADED,
+            {
+                CONF_HOST: _host,
+                ATTR_DEVICE_ID: _device.id if _device else None,
+                ATTR_TUNER: tuner,
+                ATTR_REASONS: reasons,
+                ATTR_LOCK: record.lock,
+                ATTR_SNR: record.snr,
+                f"{ATTR_SNR}_{ATTR_BASELINE}": detector.get_baseline(ATTR_SNR),
+                ATTR_STRENGTH: record.strength,
+                f"{ATTR_STRENGTH}_{ATTR_BASELINE}": detector.get_baseline(ATTR_STRENGTH),
+                ATTR_LOCK_CHANGES: detector.lock_changes,
+            },
+        )
+
+    def _update_stream_data(
+        self,
+        stream_status: list,
+        fetched: float,
+    ) -> None:
+        """Update the data of all streams from a list fetched at the given loop time."""
+        if len(stream_status) != self.stream_count:
+            self.stream_count = len(stream_status)
+            self._slots_changed = True
+            for _records in (
+                self.data.streams,
+                self.data.stream_bitrates,
+                self.data.stream_packet_rates,
+            ):
+                for _record in _records[self.stream_count:]:
+                    # Entities of retired streams stay and become unavailable
+                    self._set_record(_record, available=False)
+            del self._stream_counters[self.stream_count:]
+            self._stream_counters.extend(
+                [None] * (self.stream_count - len(self._stream_counters))
+            )
+        self.data.resize_streams(self.stream_count)
+        _stream_total_input = _stream_total_packets = _stream_total_bytes = 0
+        # Without a previous sample of any stream there is no rate yet
+        _stream_total_bitrate: float | None = None
+        _stream_total_packet_rate: float | None = None
+        _stream_total_clients = []
+        _input_channels = {}
+        _input_transponders = {}
+        for _stream_index, _stream in enumerate(stream_status):
+            _stream_state = _stream.get("Status") == "Active"
+            _stream_input = _stream.get("Input", 0)
+            _stream_packets = _stream.get("Packets", 0)
+            _stream_bytes = _stream.get("Bytes", 0)
+            _stream_client = _stream.get("Client", "")
+            _stream_channel = None
+            if _stream_state:
+                _stream_channel = self.channels.resolve_name(_stream.get("Request"))
+                if _stream_channel:
+                    _input_channels.setdefault(_stream_input, []).append(_stream_channel)
+                _stream_transponder = get_transponder_key(
+                    get_request_params(_stream.get("Request"))
                 )
-                _tuner_index = _tuner_index + 1
-
-            if _tuner_total_count > 0:
-                _tuner_total_strength = (_tuner_total_strength / _tuner_total_count)
-                _tuner_total_snr = (_tuner_total_snr / _tuner_total_count)
-                _tuner_total_quality = (_tuner_total_quality / _tuner_total_count)
-                _tuner_total_level = (_tuner_total_level / _tuner_total_count)
-
-            self.data.update(
-                {
-                    ATTR_TUNER: {
-                        ATTR_STATE: _tuner_total_count,
-                        ATTR_EXTRA_STATE_ATTRIBUTES: {
-                            ATTR_LOCK: _tuner_total_lock,
-                            ATTR_STRENGTH: _tuner_total_strength,
-                            ATTR_SNR: _tuner_total_snr,
-                            ATTR_QUALITY: _tuner_total_quality,
-                            ATTR_LEVEL: _tuner_total_level,
-                        },
-                        ATTR_AVAILABLE: True,
-                    },
-                }
+                if _stream_transponder:
+                    _input_transponders[_stream_input] = _stream_transponder
+            _stream_total_input += _stream_input
+            _stream_total_packets += _stream_packets
+            _stream_total_bytes += _stream_bytes
+            if _stream_client:
+                _stream_total_clients = _stream_total_clients + _stream_client.split(" ")
+            _stream_bitrate, _stream_packet_rate = self._get_stream_rates(
+                _stream_index,
+                fetched,
+                _stream_packets,
+                _stream_bytes,
             )
-        except OctopusNetApiError as exception:
-            LOGGER.error(str(exception))
-        except Exception as exception:
-            LOGGER.exception(exception)
+            if _stream_bitrate is not None:
+                _stream_total_bitrate = (_stream_total_bitrate or 0) + _stream_bitrate
+                _stream_total_packet_rate = (_stream_total_packet_rate or 0) + _stream_packet_rate
 
-        try:
-            _stream_index = 1
-            _stream_total_state = False
-            _stream_total_input = _stream_total_packets = _stream_total_bytes = 0
-            _stream_total_clients = []
-            _stream_status = await self.client.async_get_stream_status()
-            for _stream in _stream_status:
-                _stream_key = f"{ATTR_STREAM}_{_stream_index}"
-                _stream_state = _stream.get("Status") == "Active"
-                _stream_input = _stream.get("Input", 0)
-                _stream_packets = _stream.get("Packets", 0)
-                _stream_bytes = _stream.get("Bytes", 0)
-                _stream_client = _stream.get("Client", "")
-                if _stream_state:
-                    _stream_total_state = True
-                _stream_total_input += _stream_input
-                _stream_total_packets += _stream_packets
-                _stream_total_bytes += _stream_bytes
-                if _stream_client:
-                    _stream_total_clients = _stream_total_clients + _stream_client.split(" ")
-
-                self.data.update(
-                    {
-                        _stream_key: {
-                            ATTR_STATE: _stream_state,
-                            ATTR_EXTRA_STATE_ATTRIBUTES: {
-                                ATTR_INPUT: _stream_input,
-                                ATTR_PACKETS: _stream_packets,
-                                ATTR_BYTES: _stream_bytes,
-                                ATTR_CLIENT: _stream_client,
-                            },
-                            ATTR_AVAILABLE: True,
-                        },
-                    }
+            self._set_record(
+                self.data.streams[_stream_index],
+                state=_stream_state,
+                input=_stream_input,
+                packets=_stream_packets,
+                bytes=_stream_bytes,
+                client=_stream_client,
+                channel=_stream_channel,
+                available=True,
+            )
+            self._set_record(
+                self.data.stream_bitrates[_stream_index],
+                state=_stream_bitrate,
+                available=True,
+            )
+            self._set_record(
+                self.data.stream_packet_rates[_stream_index],
+                state=_stream_packet_rate,
+                available=True,
+            )
+
+        self._set_record(
+            self.data.stream,
+            state=len(_stream_total_clients),
+            input=_stream_total_input,
+            packets=_stream_total_packets,
+            bytes=_stream_total_bytes,
+            client=" ".join([str(v) for v in _stream_total_clients]),
+            channel=", ".join(
+                _channel
+                for _channels in _input_channels.values()
+                for _channel in _channels
+            ) or None,
+            available=True,
+        )
+        self._input_channels = _input_channels
+        self._input_transponders = _input_transponders
+        self._set_record(
+            self.data.stream_bitrate,
+            state=_stream_total_bitrate,
+            available=True,
+        )
+        self._set_record(
+            self.data.stream_packet_rate,
+            state=_stream_total_packet_rate,
+            available=True,
+        )
+
+    def _update_unchanged_stream_data(
+        self,
+        fetched: float,
+    ) -> None:
+        """Add the poll of an unchanged stream list without processing it again.
+
+        The counters did not change, only the rates are updated.
+        """
+        _stream_total_bitrate: float | None = None
+        _stream_total_packet_rate: float | None = None
+        for _stream_index, _counters in enumerate(self._stream_counters):
+            _stream_bitrate = _stream_packet_rate = None
+            if _counters is not None:
+                _stream_bitrate, _stream_packet_rate = self._get_stream_rates(
+                    _stream_index,
+                    fetched,
+                    _counters[1],
+                    _counters[2],
                 )
-                _stream_index = _stream_index + 1
-
-            self.data.update(
-                {
-                    ATTR_STREAM: {
-                        ATTR_STATE: len(_stream_total_clients),
-                        ATTR_EXTRA_STATE_ATTRIBUTES: {
-                            ATTR_INPUT: _stream_total_input,
-                            ATTR_PACKETS: _stream_total_packets,
-                            ATTR_BYTES: _stream_total_bytes,
-                            ATTR_CLIENT: " ".join([str(v) for v in _stream_total_clients]),
-                        },
-                        ATTR_AVAILABLE: True,
-                    },
-                }
+            if _stream_bitrate is not None:
+                _stream_total_bitrate = (_stream_total_bitrate or 0) + _stream_bitrate
+                _stream_total_packet_rate = (_stream_total_packet_rate or 0) + _stream_packet_rate
+            self._set_record(
+                self.data.stream_bitrates[_stream_index],
+                state=_stream_bitrate,
             )
-        except OctopusNetApiError as exception:
-            LOGGER.error(str(exception))
-        except Exception as exception:
-            LOGGER.exception(exception)
+            self._set_record(
+                self.data.stream_packet_rates[_stream_index],
+                state=_stream_packet_rate,
+            )
+        self._set_record(
+            self.data.stream_bitrate,
+            state=_stream_total_bitrate,
+        )
+        self._set_record(
+            self.data.stream_packet_rate,
+            state=_stream_total_packet_rate,
+        )
 
-        self.data.update(
-            {
-                ATTR_LAST_PULL: dt_util.now(),
-            }
+    def _update_slot_data(
+        self,
+        section: str,
+        status: list | None,
+        fetched: float,
+    ) -> None:
+        """Process a tuner or stream list, None if the device sent the same list again."""
+        if not self._is_latest_slot_status(section, fetched):
+            return
+        if status is None:
+            if section not in self._slot_status:
+                return
+            if section == ATTR_STREAM:
+                self._update_unchanged_stream_data(fetched)
+            else:
+                self._update_unchanged_tuner_data()
+            return
+        if section == ATTR_STREAM:
+            self._update_stream_data(status, fetched)
+        else:
+            self._update_tuner_data(status)
+        self._slot_status[section] = status
+
+    def _get_stream_rates(
+        self,
+        index: int,
+        now: float,
+        packets: int,
+        bytes_: int,
+    ) -> tuple[float | None, float | None]:
+        """Return byte and packet rate of a stream since the previous poll."""
+        if index >= len(self._stream_counters):
+            return None, None
+        _previous = self._stream_counters[index]
+        if _previous is not None and now <= _previous[0]:
+            # Not newer than the stored sample, which is kept
+            return None, None
+        self._stream_counters[index] = (now, packets, bytes_)
+        if _previous is None:
+            return None, None
+        _elapsed = now - _previous[0]
+        _packets_delta = packets - _previous[1]
+        _bytes_delta = bytes_ - _previous[2]
+        if _packets_delta < 0 or _bytes_delta < 0:
+            # Counters start again from zero when a stream is restarted
+            _packets_delta = packets
+            _bytes_delta = bytes_
+        return round(_bytes_delta / _elapsed, 1), round(_packets_delta / _elapsed, 1)
+
+    def _is_latest_slot_status(
+        self,
+        section: str,
+        fetched: float,
+    ) -> bool:
+        """Return True if no newer list of the section was processed yet.
+
+        The poll and the live updates may overlap, a list that waited for
+        the other one must not be processed after it.
+        """
+        if fetched < self._slot_fetched.get(section, 0):
+            LOGGER.debug("Dropped %s status older than the processed one", section)
+            return False
+        self._slot_fetched[section] = fetched
+        return True
+
+    def _notify_slot_listeners(self) -> None:
+        """Notify the slot listeners if the number of tuners or streams changed."""
+        if not self._slots_changed:
+            return
+        self._slots_changed = False
+        LOGGER.debug(
+            "Device reports %s tuners and %s streams",
+            self.tuner_count,
+            self.stream_count,
         )
+        for _listener in list(self._slot_listeners):
+            _listener()
+
+    async def async_live_update(self) -> None:
+        """Fetch tuner and stream status and process them."""
+        if self.reboot_watcher.rebooting:
+            return
+        # Unavailable sections are fetched in full to recover them
+        try:
+            _stream_status, _tuner_status = await asyncio.gather(
+                self.client.async_get_stream_status(
+                    changed_only=self.data.stream.available,
+                ),
+                self.client.async_get_tuner_status(
+                    changed_only=self.data.tuner.available,
+                ),
+            )
+        except OctopusNetApiError:
+            # The regular poll leaves both sections to the live updates
+
+            def _set_unavailable() -> None:
+                self._set_section_unavailable(ATTR_STREAM)
+                self._set_section_unavailable(ATTR_TUNER)
+
+            self._async_update_records(_set_unavailable)
+            raise
+        _fetched = self.hass.loop.time()
+        # An unchanged list is not parsed again, only rates and signal
+        # statistics take the sample
+        if _stream_status is None:
+            self.unchanged_sections[ATTR_STREAM] = self.unchanged_sections.get(ATTR_STREAM, 0) + 1
+        if _tuner_status is None:
+            self.unchanged_sections[ATTR_TUNER] = self.unchanged_sections.get(ATTR_TUNER, 0) + 1
+        if _stream_status is not None and any(
+            _stream.get("Status") == "Active" for _stream in _stream_status
+        ):
+            await self.channels.async_ensure()
+
+        def _update() -> None:
+            # Streams are updated first, tuners show the channels of their streams
+            self._update_slot_data(ATTR_STREAM, _stream_status, _fetched)
+            self._update_slot_data(ATTR_TUNER, _tuner_status, _fetched)
+
+        self._async_update_records(_update)
+        self._notify_slot_listeners()
+
+    async def _async_update_data(self):
+        """Update data via library."""
+        if self.reboot_watcher.rebooting:
+            # Requests would only time out until the device is back
+            return self.data
+        async with self.orchestrator.async_poll(self.config_entry.entry_id):
+            await self._async_update_sections()
+        self._notify_slot_listeners()
+        self._set_record(
+            self.data.poll_duration,
+            state=round(self.orchestrator.last_durations.get(self.config_entry.entry_id, 0), 3),
+            fleet=self.orchestrator.as_dict(),
+        )
+        self._update_metric_data()
         return self.data
 
+    def _update_metric_data(self) -> None:
+        """Update the request metrics of the endpoints."""
+        for _name, _record in self.data.latencies.items():
+            _metrics = self.client.metrics.get(REQUEST_ENDPOINTS[_name])
+            if _metrics is None:
+                continue
+            self._set_record(
+                _record,
+                state=_metrics.percentile(95),
+                requests=_metrics.requests,
+                errors=_metrics.error_count,
+                error_classes=dict(_metrics.errors),
+                p50=_metrics.percentile(50),
+                max=_metrics.percentile(100),
+                available=True,
+            )
+
+    async def _async_update_sections(self) -> None:
+        """Fetch and process the sections that are due."""
+        _now = self.hass.loop.time()
+        _forced = self._force_update
+        _sections = self._get_due_sections(_now)
+        self._changed_keys = set()
+        _results = await self._async_fetch_sections(
+            _sections,
+            set() if _forced else self._get_cacheable_sections(),
+        )
+        for _section in [
+            _section for _section, _result in _results.items() if _result is None
+        ]:
+            # The device returned the same body as last time
+            self.unchanged_sections[_section] = self.unchanged_sections.get(_section, 0) + 1
+            if _section in self._slot_status:
+                # Only rates and signal statistics take the sample
+                continue
+            del _results[_section]
+            if _section == ATTR_EPG and self.data.epg.state:
+                self.epg_tracker.async_start()
+
+        if ATTR_FANSPEED in _results:
+            try:
+                self._set_record(
+                    self.data.fanspeed,
+                    state=self._get_section_result(_results, ATTR_FANSPEED),
+                    available=True,
+                )
+            except OctopusNetApiError as exception:
+                self._set_section_unavailable(ATTR_FANSPEED)
+                self._log_api_error(exception)
+            except Exception as exception:
+                self._set_section_unavailable(ATTR_FANSPEED)
+                LOGGER.exception(exception)
+
+        if ATTR_TEMPERATURE in _results:
+            try:
+                self._set_record(
+                    self.data.temperature,
+                    state=self._get_section_result(_results, ATTR_TEMPERATURE),
+                    available=True,
+                )
+                self._set_record(self.data.reboot, available=True)
+                self.history.add_samples(self.client.temperature_samples)
+                if self.history.needs_backfill:
+                    self._start_history_backfill()
+            except OctopusNetApiError as exception:
+                self._set_section_unavailable(ATTR_TEMPERATURE)
+                self._log_api_error(exception)
+            except Exception as exception:
+                self._set_section_unavailable(ATTR_TEMPERATURE)
+                LOGGER.exception(exception)
+
+        if ATTR_EPG in _results:
+            try:
+                self._update_epg_data(
+                    self._get_section_result(_results, ATTR_EPG)
+                )
+            except OctopusNetApiError as exception:
+                self._set_section_unavailable(ATTR_EPG)
+                self._log_api_error(exception)
+            except Exception as exception:
+                self._set_section_unavailable(ATTR_EPG)
+                LOGGER.exception(exception)
+
+        # Streams are updated first, tuners show the channels of their streams
+        if ATTR_STREAM in _results:
+            try:
+                _stream_status = self._get_section_result(_results, ATTR_STREAM)
+                if _stream_status is not None and any(
+                    _stream.get("Status") == "Active" for _stream in _stream_status
+                ):
+                    await self.channels.async_ensure()
+                self._update_slot_data(
+                    ATTR_STREAM,
+                    _stream_status,
+                    self._section_fetched.get(ATTR_STREAM, _now),
+                )
+            except OctopusNetApiError as exception:
+                self._set_section_unavailable(ATTR_STREAM)
+                self._log_api_error(exception)
+            except Exception as exception:
+                self._set_section_unavailable(ATTR_STREAM)
+                LOGGER.exception(exception)
+
+        if ATTR_TUNER in _results:
+            try:
+                self._update_slot_data(
+                    ATTR_TUNER,
+                    self._get_section_result(_results, ATTR_TUNER),
+                    self._section_fetched.get(ATTR_TUNER, _now),
+                )
+            except OctopusNetApiError as exception:
+                self._set_section_unavailable(ATTR_TUNER)
+                self._log_api_error(exception)
+            except Exception as exception:
+                self._set_section_unavailable(ATTR_TUNER)
+                LOGGER.exception(exception)
+
+        self.data.last_pull = dt_util.now()
+        self._schedule_sections(_sections, _now)
+
     async def _async_update_listeners(self) -> None:
         """Schedule update all registered listeners after 1 second."""
         if self._scheduled_update_listeners:
@@ -345,12 +1103,33 @@ class OctopusNetDataUpdateCoordinator(DataUpdateCoordinator):
             lambda: self.async_update_listeners(),
         )
 
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update only the listeners whose data has changed."""
+        _changed_keys = self._changed_keys
+        _listeners = []
+        for update_callback, context in list(self._listeners.values()):
+            if (
+                _changed_keys is None
+                or context is None
+                or self._get_section(context) is None
+                or context in _changed_keys
+            ):
+                _listeners.append(update_callback)
+            else:
+                self.skipped_writes += 1
+        self.data.skipped_writes.update(state=self.skipped_writes)
+        for update_callback in _listeners:
+            update_callback()
+
     async def async_update_data(
         self,
     ) -> None:
         """Update data."""
         try:
+            self._force_update = True
             await self._async_update_data()
+            self._changed_keys = None
 
             self.hass.async_create_task(
                 self._async_update_listeners()
@@ -360,22 +1139,62 @@ class OctopusNetDataUpdateCoordinator(DataUpdateCoordinator):
 
     async def async_reboot(
         self,
+        raise_errors: bool = False,
     ) -> bool:
         """Send command reboot to device."""
         try:
-            return await self.client.async_start_reboot()
+            _result = await self.client.async_start_reboot()
+            self._async_reboot_started()
+            return _result
         except OctopusNetApiError as exception:
+            if raise_errors:
+                raise
             LOGGER.error(str(exception))
         except Exception as exception:
+            if raise_errors:
+                raise
             LOGGER.exception(exception)
 
+    async def async_wait_ready(
+        self,
+    ) -> None:
+        """Wait until the device is back after a reboot."""
+        await self.reboot_watcher.async_wait_ready()
+
+    @callback
+    def _async_reboot_started(self) -> None:
+        """Mark the device data as unavailable while the device reboots."""
+
+        def _update() -> None:
+            for _section in SECTION_UPDATE_INTERVALS:
+                self._set_section_unavailable(_section)
+            self._set_record(self.data.reboot, rebooting=True, available=True)
+
+        self._async_update_records(_update)
+        self.reboot_watcher.async_start()
+
+    async def _async_reboot_finished(self) -> None:
+        """Fetch all data once the device is back or the watcher gave up."""
+        self._async_update_records(
+            lambda: self._set_record(self.data.reboot, rebooting=False)
+        )
+        self._force_update = True
+        await self.async_refresh()
+
     async def async_epg_scan(
         self,
+        raise_errors: bool = False,
     ) -> bool:
         """Send command epg_scan to device."""
         try:
-            return await self.client.async_epg_scan()
+            _result = await self.client.async_epg_scan()
+            self.epg_tracker.async_start()
+            return _result
         except OctopusNetApiError as exception:
+            if raise_errors:
+                raise
             LOGGER.error(str(exception))
         except Exception as exception:
+            if raise_errors:
+                raise
             LOGGER.exception(exception)
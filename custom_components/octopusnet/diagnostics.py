@@ -0,0 +1,43 @@
+"""Diagnostics support for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import (
+    CONF_USERNAME,
+    CONF_PASSWORD,
+)
+
+from .coordinator import OctopusNetDataUpdateCoordinator
+
+TO_REDACT = {
+    CONF_USERNAME,
+    CONF_PASSWORD,
+}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+) -> dict[str, any]:
+    """Return diagnostics for a config entry."""
+    coordinator: OctopusNetDataUpdateCoordinator = config_entry.runtime_data
+    return {
+        "config_entry": async_redact_data(config_entry.as_dict(), TO_REDACT),
+        "snapshot": coordinator.data.as_dict(),
+        "timing": {
+            "update_interval": coordinator.update_interval.total_seconds(),
+            "next_section_polls": coordinator.get_section_schedule(),
+            "skipped_writes": coordinator.skipped_writes,
+            "unchanged_sections": coordinator.unchanged_sections,
+            "orchestrator": coordinator.orchestrator.as_dict(),
+        },
+        "requests": coordinator.client.metrics.as_dict(),
+        "circuit": {
+            "state": coordinator.client.circuit.state,
+            "failures": coordinator.client.circuit.failures,
+            "backoff": coordinator.client.circuit.backoff,
+        },
+        "raw_responses": coordinator.client.responses.as_dict(),
+    }
@@ -1,22 +1,76 @@
 """Digital Devices Octopus NET entity."""
 from __future__ import annotations
 
-from homeassistant.core import callback
-from homeassistant.const import (
-    ATTR_STATE,
-)
+from collections.abc import Callable
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import CONF_HOST
+from homeassistant.config_entries import ConfigEntry
 from homeassistant.helpers.device_registry import DeviceInfo
+from homeassistant.helpers.entity import EntityDescription
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 from homeassistant.util import slugify
 
 from .const import (
     DOMAIN,
     MANUFACTURER,
-    ATTR_EXTRA_STATE_ATTRIBUTES,
-    ATTR_AVAILABLE,
     ATTR_LAST_PULL,
 )
 from .coordinator import OctopusNetDataUpdateCoordinator
+from .models import OctopusNetRecord
+
+
+def get_unique_id(
+    host: str,
+    entity_key: str | None,
+) -> str:
+    """Return the unique ID of an entity."""
+    if entity_key:
+        return slugify(f"{host}_{entity_key}")
+    return slugify(f"{host}")
+
+
+@callback
+def async_setup_slot_entities(
+    hass: HomeAssistant,
+    config_entry: ConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+    get_descriptions: Callable[[int, int], list[EntityDescription]],
+    create_entity: Callable[[EntityDescription], OctopusNetEntity],
+) -> None:
+    """Add the entities of tuners and streams as the device reports them.
+
+    Entities of tuners and streams the device no longer reports are kept
+    and become unavailable, e.g. while the device briefly reports an empty
+    list, and follow their slot again once it is back.
+    """
+    coordinator: OctopusNetDataUpdateCoordinator = config_entry.runtime_data
+    _host = config_entry.data[CONF_HOST]
+    _added: set[str] = set()
+
+    @callback
+    def _async_update_slots() -> None:
+        _descriptions = {
+            get_unique_id(_host, _description.key): _description
+            for _description in get_descriptions(
+                coordinator.tuner_count,
+                coordinator.stream_count,
+            )
+        }
+        _new = [
+            create_entity(_description)
+            for _unique_id, _description in _descriptions.items()
+            if _unique_id not in _added
+        ]
+        if _new:
+            async_add_entities(_new, update_before_add=True)
+        _added.update(_descriptions)
+
+    _async_update_slots()
+    config_entry.async_on_unload(
+        coordinator.async_add_slot_listener(_async_update_slots)
+    )
 
 
 class OctopusNetEntity(CoordinatorEntity):
@@ -32,16 +86,16 @@ class OctopusNetEntity(CoordinatorEntity):
         entity_key: str,
     ) -> None:
         """Initialize."""
-        super().__init__(coordinator)
+        super().__init__(coordinator, context=entity_key)
 
         self._host = host
         self._entity_type = entity_type
         self._entity_key = entity_key
+        self._record: OctopusNetRecord = coordinator.data.get_record(entity_key)
+        self._attributes: dict[str, any] = {}
+        self._attributes_revision: int | None = None
 
-        if entity_key:
-            self._unique_id = slugify(f"{self._host}_{entity_key}")
-        else:
-            self._unique_id = slugify(f"{self._host}")
+        self._unique_id = get_unique_id(self._host, entity_key)
 
         self.entity_id = f"{entity_type}.{self._unique_id}"
         self._attr_device_info = DeviceInfo(
@@ -60,7 +114,7 @@ class OctopusNetEntity(CoordinatorEntity):
         self,
     ) -> any:
         """Get state of the current entity."""
-        return self.coordinator.data.get(self._entity_key, {}).get(ATTR_STATE, None)
+        return self._record.state
 
     def _get_attribute(
         self,
@@ -68,7 +122,7 @@ class OctopusNetEntity(CoordinatorEntity):
         default_value: any | None = None,
     ) -> any:
         """Get attribute of the current entity."""
-        return self.coordinator.data.get(self._entity_key, {}).get(attr, default_value)
+        return getattr(self._record, attr, default_value)
 
     @property
     def unique_id(self) -> str:
@@ -78,18 +132,19 @@ class OctopusNetEntity(CoordinatorEntity):
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self.coordinator.data.get(self._entity_key, {}).get(ATTR_AVAILABLE, False)
+        return self._record.available
 
     @property
     def extra_state_attributes(self) -> dict[str, any]:
         """Return axtra attributes."""
-        _extra_state_attributes = self._get_attribute(ATTR_EXTRA_STATE_ATTRIBUTES, {})
-        _extra_state_attributes.update(
-            {
-                ATTR_LAST_PULL: self.coordinator.data.get(ATTR_LAST_PULL),
+        # Build the attributes only once per change of the record
+        if self._attributes_revision != self._record.revision:
+            self._attributes = {
+                **self._record.as_attributes(),
+                ATTR_LAST_PULL: self.coordinator.data.last_pull,
             }
-        )
-        return _extra_state_attributes
+            self._attributes_revision = self._record.revision
+        return self._attributes
 
     async def async_update(self) -> None:
         """Peform async_update."""
@@ -0,0 +1,98 @@
+"""EPG scan tracking for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    EPG_SCAN_POLL_INTERVAL,
+)
+from .api import (
+    OctopusNetApiClient,
+    OctopusNetApiError,
+)
+
+
+class OctopusNetEpgScanTracker:
+    """Follow a running EPG scan with a short poll interval."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        client: OctopusNetApiClient,
+        update_callback: Callable[[dict], None],
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._client = client
+        self._update_callback = update_callback
+        self._task: asyncio.Task | None = None
+        # Monotonic time and event counter of the first status of the scan
+        self._start: tuple[float, int] | None = None
+        self.progress: float | None = None
+        self.event_rate: float | None = None
+        self.eta: datetime | None = None
+
+    @property
+    def tracking(self) -> bool:
+        """Return True if the scan is followed by the short poll loop."""
+        return self._task is not None and not self._task.done()
+
+    def update(
+        self,
+        epg: dict,
+        now: float,
+    ) -> None:
+        """Derive progress, event rate and ETA from a status of the scan."""
+        if epg.get("status") != "active":
+            self._start = None
+            self.progress = self.event_rate = self.eta = None
+            return
+
+        _total = epg.get("total", 0)
+        _events = epg.get("events", 0)
+        if self._start is None or _events < self._start[1]:
+            self._start = (now, _events)
+        self.progress = round(min(100, _events / _total * 100), 1) if _total else None
+        _elapsed = now - self._start[0]
+        self.event_rate = round((_events - self._start[1]) / _elapsed, 1) if _elapsed > 0 else None
+        self.eta = None
+        if self.event_rate and _total > _events:
+            self.eta = dt_util.utcnow() + timedelta(
+                seconds=round((_total - _events) / self.event_rate)
+            )
+
+    def async_start(self) -> None:
+        """Start the short poll loop unless it is already running."""
+        if self.tracking:
+            return
+        self._task = self._config_entry.async_create_background_task(
+            self._hass,
+            self._async_track(),
+            f"{DOMAIN}_epg_scan_{self._config_entry.entry_id}",
+        )
+
+    async def _async_track(self) -> None:
+        """Poll the EPG status until the scan has finished."""
+        LOGGER.debug("Following EPG scan every %s seconds", EPG_SCAN_POLL_INTERVAL)
+        while True:
+            await asyncio.sleep(EPG_SCAN_POLL_INTERVAL)
+            try:
+                _epg = await self._client.async_get_epg()
+            except OctopusNetApiError as exception:
+                # The regular poll takes over and restarts the loop if needed
+                LOGGER.debug("Stop following EPG scan: %s", exception)
+                return
+            self._update_callback(_epg)
+            if _epg.get("status") != "active":
+                LOGGER.debug("EPG scan finished")
+                return
@@ -0,0 +1,243 @@
+"""Temperature history for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+from array import array
+from datetime import datetime, timedelta
+
+from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    UnitOfTemperature,
+)
+from homeassistant.components.recorder import (
+    DOMAIN as RECORDER_DOMAIN,
+    get_instance,
+)
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+    get_last_statistics,
+)
+from homeassistant.util import slugify
+from homeassistant.util.unit_conversion import TemperatureConverter
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    TEMPERATURE_LOG_INTERVAL,
+)
+from .api import (
+    OctopusNetApiClient,
+    OctopusNetApiError,
+)
+
+
+class OctopusNetHourBucket:
+    """Aggregate of the temperature samples of one hour."""
+
+    __slots__ = ("start", "min", "max", "sum", "count")
+
+    def __init__(
+        self,
+        start: datetime | None = None,
+    ) -> None:
+        """Initialize."""
+        self.start = start
+        self.min = float("inf")
+        self.max = float("-inf")
+        self.sum = 0.0
+        self.count = 0
+
+    def add(
+        self,
+        value: float,
+    ) -> None:
+        """Add a sample to the bucket."""
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+        self.sum += value
+        self.count += 1
+
+    def as_statistic(
+        self,
+        start: datetime,
+    ) -> StatisticData:
+        """Return the bucket as hourly statistic."""
+        return StatisticData(
+            start=start,
+            mean=self.sum / self.count,
+            min=self.min,
+            max=self.max,
+        )
+
+
+class OctopusNetTemperatureHistory:
+    """Import the temperature log into long-term statistics."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: OctopusNetApiClient,
+        host: str,
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._client = client
+        self.statistic_id = f"{DOMAIN}:{slugify(host)}_temperature"
+        self._metadata = StatisticMetaData(
+            mean_type=StatisticMeanType.ARITHMETIC,
+            has_sum=False,
+            name=f"{host} Temperature",
+            source=DOMAIN,
+            statistic_id=self.statistic_id,
+            unit_class=TemperatureConverter.UNIT_CLASS,
+            unit_of_measurement=UnitOfTemperature.CELSIUS,
+        )
+        self._bucket: OctopusNetHourBucket | None = None
+        self._running = False
+        self.backfilled = False
+
+    @property
+    def enabled(self) -> bool:
+        """Return True if the recorder is loaded to store the statistics."""
+        return RECORDER_DOMAIN in self._hass.config.components
+
+    @property
+    def needs_backfill(self) -> bool:
+        """Return True if the import has not succeeded yet and is not running."""
+        return self.enabled and not self.backfilled and not self._running
+
+    async def async_backfill(self) -> None:
+        """Import the samples of the device log once."""
+        self._running = True
+        try:
+            await self._async_backfill()
+        finally:
+            self._running = False
+
+    async def _async_backfill(self) -> None:
+        """Import the device log unless statistics exist already."""
+        _last_statistics = await get_instance(self._hass).async_add_executor_job(
+            get_last_statistics,
+            self._hass,
+            1,
+            self.statistic_id,
+            True,
+            {"mean", "min", "max"},
+        )
+        if _rows := _last_statistics.get(self.statistic_id):
+            self._seed_bucket(_rows[0])
+            self.backfilled = True
+            return
+
+        _samples = array("d")
+        try:
+            async for _sample in self._client.async_iter_temperature_log():
+                _samples.append(_sample)
+        except OctopusNetApiError as exception:
+            # Tried again after the next successful poll
+            LOGGER.error("Temperature history import failed: %s", exception)
+            return
+
+        # The log holds bare values without timestamps; the newest sample
+        # was logged now and the samples are assigned to the clock hours
+        # backwards by the logging interval of the device.
+        _samples_per_hour = max(1, 3600 // TEMPERATURE_LOG_INTERVAL)
+        _hour = self._current_hour()
+        _end = len(_samples)
+        _start = max(
+            0,
+            _end - int((dt_util.utcnow() - _hour).total_seconds() // TEMPERATURE_LOG_INTERVAL),
+        )
+        if _start < _end:
+            # Continued by the samples of the following polls
+            self._bucket = self._get_bucket(_samples, _start, _end, _hour)
+        _statistics = []
+        while _start > 0:
+            _end = _start
+            _start = max(0, _end - _samples_per_hour)
+            _hour -= timedelta(hours=1)
+            _statistics.append(
+                self._get_bucket(_samples, _start, _end, _hour).as_statistic(_hour)
+            )
+        _statistics.reverse()
+        if _statistics:
+            async_add_external_statistics(self._hass, self._metadata, _statistics)
+        LOGGER.debug(
+            "Imported %s hours of temperature history into %s",
+            len(_statistics),
+            self.statistic_id,
+        )
+        self.backfilled = True
+
+    @staticmethod
+    def _get_bucket(
+        samples: array,
+        start: int,
+        end: int,
+        hour: datetime,
+    ) -> OctopusNetHourBucket:
+        """Return a bucket of the given hour with a range of samples."""
+        _bucket = OctopusNetHourBucket(hour)
+        for _index in range(start, end):
+            _bucket.add(samples[_index])
+        return _bucket
+
+    def _seed_bucket(
+        self,
+        row: dict[str, any],
+    ) -> None:
+        """Continue the statistics of the current hour after a restart."""
+        _hour = self._current_hour()
+        if row.get("start") != _hour.timestamp() or row.get("mean") is None:
+            return
+        # The row holds no sample count, assume one sample per logging
+        # interval so far; otherwise the new samples would replace the hour
+        _count = max(
+            1,
+            int((dt_util.utcnow() - _hour).total_seconds() // TEMPERATURE_LOG_INTERVAL),
+        )
+        _mean = row["mean"]
+        self._bucket = OctopusNetHourBucket(_hour)
+        self._bucket.min = _mean if row.get("min") is None else row["min"]
+        self._bucket.max = _mean if row.get("max") is None else row["max"]
+        self._bucket.sum = _mean * _count
+        self._bucket.count = _count
+
+    def add_samples(
+        self,
+        samples: list[float],
+    ) -> None:
+        """Add newly logged samples to the statistics of the current hour."""
+        if not self.backfilled or not samples:
+            return
+        _hour = self._current_hour()
+        if self._bucket is not None and self._bucket.start != _hour:
+            async_add_external_statistics(
+                self._hass,
+                self._metadata,
+                [self._bucket.as_statistic(self._bucket.start)],
+            )
+            self._bucket = None
+        if self._bucket is None:
+            self._bucket = OctopusNetHourBucket(_hour)
+        for _sample in samples:
+            self._bucket.add(_sample)
+
+    def flush(self) -> None:
+        """Write the statistics of the current hour collected so far."""
+        if self._bucket is not None and self._bucket.count:
+            async_add_external_statistics(
+                self._hass,
+                self._metadata,
+                [self._bucket.as_statistic(self._bucket.start)],
+            )
+
+    @staticmethod
+    def _current_hour() -> datetime:
+        """Return the start of the current hour."""
+        return dt_util.utcnow().replace(minute=0, second=0, microsecond=0)
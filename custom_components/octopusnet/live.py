@@ -0,0 +1,69 @@
+"""Live updates of tuners and streams for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    LIVE_UPDATE_INTERVAL,
+)
+from .api import OctopusNetApiError
+
+
+class OctopusNetLiveUpdater:
+    """Poll tuner and stream status with a short interval."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        update_method: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._update_method = update_method
+        self._task: asyncio.Task | None = None
+
+    @property
+    def running(self) -> bool:
+        """Return True if the live updates are running."""
+        return self._task is not None and not self._task.done()
+
+    def async_start(self) -> None:
+        """Start the live updates unless they are already running."""
+        if self.running:
+            return
+        self._task = self._config_entry.async_create_background_task(
+            self._hass,
+            self._async_run(),
+            f"{DOMAIN}_live_{self._config_entry.entry_id}",
+        )
+
+    async def _async_run(self) -> None:
+        """Run the update method until the config entry is unloaded."""
+        LOGGER.debug(
+            "Live updates of %s every %s seconds",
+            self._config_entry.title,
+            LIVE_UPDATE_INTERVAL,
+        )
+        _failing = False
+        while True:
+            await asyncio.sleep(LIVE_UPDATE_INTERVAL)
+            try:
+                await self._update_method()
+            except OctopusNetApiError as exception:
+                # Tuners and streams were marked unavailable, log only the start
+                if not _failing:
+                    LOGGER.debug("Live update failed: %s", exception)
+                _failing = True
+                continue
+            except Exception as exception:  # pylint: disable=broad-except
+                LOGGER.exception(exception)
+                continue
+            _failing = False
@@ -0,0 +1,147 @@
+"""Request metrics and response capture for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+import math
+from collections import deque
+from datetime import datetime
+
+import homeassistant.util.dt as dt_util
+
+from .const import (
+    REQUEST_LATENCY_SAMPLES,
+    RAW_CAPTURE_RESPONSES,
+    RAW_CAPTURE_BYTES,
+)
+
+
+class OctopusNetEndpointMetrics:
+    """Request count, errors and recent latencies of one endpoint."""
+
+    __slots__ = ("requests", "errors", "latencies")
+
+    def __init__(
+        self,
+        samples: int = REQUEST_LATENCY_SAMPLES,
+    ) -> None:
+        """Initialize."""
+        self.requests = 0
+        self.errors: dict[str, int] = {}
+        self.latencies: deque[float] = deque(maxlen=samples)
+
+    def add(
+        self,
+        latency: float,
+        error: str | None = None,
+    ) -> None:
+        """Add a finished request."""
+        self.requests += 1
+        self.latencies.append(latency)
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    @property
+    def error_count(self) -> int:
+        """Return the number of failed requests."""
+        return sum(self.errors.values())
+
+    def percentile(
+        self,
+        percent: float,
+    ) -> float | None:
+        """Return a percentile of the recent latencies in milliseconds."""
+        if not self.latencies:
+            return None
+        _sorted = sorted(self.latencies)
+        _rank = max(1, math.ceil(percent / 100 * len(_sorted)))
+        return round(_sorted[_rank - 1] * 1000, 1)
+
+    def as_dict(self) -> dict[str, any]:
+        """Return the metrics of the endpoint."""
+        return {
+            "requests": self.requests,
+            "errors": self.error_count,
+            "error_classes": dict(self.errors),
+            "p50": self.percentile(50),
+            "p95": self.percentile(95),
+            "max": self.percentile(100),
+        }
+
+
+class OctopusNetRequestMetrics:
+    """Metrics of all endpoints of a device."""
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.endpoints: dict[str, OctopusNetEndpointMetrics] = {}
+
+    def add(
+        self,
+        endpoint: str,
+        latency: float,
+        error: str | None = None,
+    ) -> None:
+        """Add a finished request of an endpoint."""
+        if endpoint not in self.endpoints:
+            self.endpoints[endpoint] = OctopusNetEndpointMetrics()
+        self.endpoints[endpoint].add(latency, error)
+
+    def get(
+        self,
+        endpoint: str,
+    ) -> OctopusNetEndpointMetrics | None:
+        """Return the metrics of an endpoint."""
+        return self.endpoints.get(endpoint)
+
+    def as_dict(self) -> dict[str, dict[str, any]]:
+        """Return the metrics of all endpoints."""
+        return {
+            _endpoint: _metrics.as_dict()
+            for _endpoint, _metrics in self.endpoints.items()
+        }
+
+
+class OctopusNetResponseCapture:
+    """Last raw responses per endpoint within a byte budget."""
+
+    def __init__(
+        self,
+        responses: int = RAW_CAPTURE_RESPONSES,
+        max_bytes: int = RAW_CAPTURE_BYTES,
+    ) -> None:
+        """Initialize."""
+        self._responses = responses
+        self._max_bytes = max_bytes
+        # Time, status, original size and kept head of the body
+        self.endpoints: dict[str, deque[tuple[datetime, int, int, bytes]]] = {}
+        self._kept_bytes: dict[str, int] = {}
+
+    def add(
+        self,
+        endpoint: str,
+        status: int,
+        body: bytes,
+    ) -> None:
+        """Keep a response and drop the oldest ones beyond the budget."""
+        _body = body[:self._max_bytes]
+        _entries = self.endpoints.setdefault(endpoint, deque())
+        _entries.append((dt_util.utcnow(), status, len(body), _body))
+        _kept = self._kept_bytes.get(endpoint, 0) + len(_body)
+        while len(_entries) > self._responses or _kept > self._max_bytes:
+            _kept -= len(_entries.popleft()[3])
+        self._kept_bytes[endpoint] = _kept
+
+    def as_dict(self) -> dict[str, list[dict[str, any]]]:
+        """Return the kept responses of all endpoints."""
+        return {
+            _endpoint: [
+                {
+                    "time": _time.isoformat(),
+                    "status": _status,
+                    "size": _size,
+                    "truncated": _size > len(_body),
+                    "body": _body.decode("utf-8", errors="replace"),
+                }
+                for _time, _status, _size, _body in _entries
+            ]
+            for _endpoint, _entries in self.endpoints.items()
+        }
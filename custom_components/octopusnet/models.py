@@ -0,0 +1,331 @@
+"""Data models for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+from dataclasses import asdict, dataclass
+from datetime import datetime
+
+from homeassistant.const import (
+    ATTR_TEMPERATURE,
+)
+
+from .const import (
+    ATTR_UPDATE,
+    ATTR_FANSPEED,
+    ATTR_EPG,
+    ATTR_EPG_SCAN,
+    ATTR_REBOOT,
+    ATTR_REBOOTING,
+    ATTR_TOTAL,
+    ATTR_EVENTS,
+    ATTR_PROGRESS,
+    ATTR_EVENT_RATE,
+    ATTR_ETA,
+    ATTR_TUNER,
+    ATTR_LOCK,
+    ATTR_STRENGTH,
+    ATTR_SNR,
+    ATTR_QUALITY,
+    ATTR_LEVEL,
+    ATTR_STREAM,
+    ATTR_INPUT,
+    ATTR_PACKETS,
+    ATTR_BYTES,
+    ATTR_CLIENT,
+    ATTR_CHANNEL,
+    ATTR_BITRATE,
+    ATTR_PACKET_RATE,
+    ATTR_SKIPPED_WRITES,
+    ATTR_POLL_DURATION,
+    ATTR_LATENCY,
+    ATTR_REQUESTS,
+    ATTR_ERRORS,
+    ATTR_ERROR_CLASSES,
+    ATTR_P50,
+    ATTR_P95,
+    ATTR_MAX,
+    REQUEST_ENDPOINTS,
+)
+
+
+@dataclass(slots=True)
+class OctopusNetRecord:
+    """Data of a single device entity."""
+
+    key: str
+    state: any = None
+    available: bool = False
+    revision: int = 0
+
+    def update(
+        self,
+        **values: any,
+    ) -> bool:
+        """Set the given fields and return True if any of them changed."""
+        _changed = False
+        for _name, _value in values.items():
+            if getattr(self, _name) != _value:
+                setattr(self, _name, _value)
+                _changed = True
+        if _changed:
+            self.revision += 1
+        return _changed
+
+    def as_attributes(self) -> dict[str, any]:
+        """Return the extra state attributes of the record."""
+        return {}
+
+
+@dataclass(slots=True)
+class OctopusNetRebootRecord(OctopusNetRecord):
+    """Data of the reboot of the device."""
+
+    rebooting: bool = False
+
+    def as_attributes(self) -> dict[str, any]:
+        """Return the extra state attributes of the record."""
+        return {
+            ATTR_REBOOTING: self.rebooting,
+        }
+
+
+@dataclass(slots=True)
+class OctopusNetEpgRecord(OctopusNetRecord):
+    """Data of the EPG status."""
+
+    total: int | None = None
+    events: int | None = None
+    progress: float | None = None
+    event_rate: float | None = None
+    eta: datetime | None = None
+
+    def as_attributes(self) -> dict[str, any]:
+        """Return the extra state attributes of the record."""
+        return {
+            ATTR_TOTAL: self.total,
+            ATTR_EVENTS: self.events,
+            ATTR_PROGRESS: self.progress,
+            ATTR_EVENT_RATE: self.event_rate,
+            ATTR_ETA: self.eta,
+        }
+
+
+@dataclass(slots=True)
+class OctopusNetTunerRecord(OctopusNetRecord):
+    """Data of a tuner or of all tuners."""
+
+    lock: bool | None = None
+    strength: float | None = None
+    snr: float | None = None
+    quality: float | None = None
+    level: float | None = None
+    channel: str | None = None
+    # Rolling statistics of the signal, only kept for a single tuner
+    statistics: dict[str, float | int | None] | None = None
+
+    def as_attributes(self) -> dict[str, any]:
+        """Return the extra state attributes of the record."""
+        return {
+            ATTR_LOCK: self.lock,
+            ATTR_STRENGTH: self.strength,
+            ATTR_SNR: self.snr,
+            ATTR_QUALITY: self.quality,
+            ATTR_LEVEL: self.level,
+            ATTR_CHANNEL: self.channel,
+            **(self.statistics or {}),
+        }
+
+
+@dataclass(slots=True)
+class OctopusNetStreamRecord(OctopusNetRecord):
+    """Data of a stream or of all streams."""
+
+    input: int | None = None
+    packets: int | None = None
+    bytes: int | None = None
+    client: str | None = None
+    channel: str | None = None
+
+    def as_attributes(self) -> dict[str, any]:
+        """Return the extra state attributes of the record."""
+        return {
+            ATTR_INPUT: self.input,
+            ATTR_PACKETS: self.packets,
+            ATTR_BYTES: self.bytes,
+            ATTR_CLIENT: self.client,
+            ATTR_CHANNEL: self.channel,
+        }
+
+
+@dataclass(slots=True)
+class OctopusNetPollRecord(OctopusNetRecord):
+    """Timing of the polls of this and all other devices."""
+
+    fleet: dict[str, any] | None = None
+
+    def as_attributes(self) -> dict[str, any]:
+        """Return the extra state attributes of the record."""
+        return dict(self.fleet or {})
+
+
+@dataclass(slots=True)
+class OctopusNetLatencyRecord(OctopusNetRecord):
+    """Request metrics of an endpoint, the state is the 95th percentile."""
+
+    requests: int = 0
+    errors: int = 0
+    error_classes: dict[str, int] | None = None
+    p50: float | None = None
+    max: float | None = None
+
+    def as_attributes(self) -> dict[str, any]:
+        """Return the extra state attributes of the record."""
+        return {
+            ATTR_REQUESTS: self.requests,
+            ATTR_ERRORS: self.errors,
+            ATTR_ERROR_CLASSES: self.error_classes,
+            ATTR_P50: self.p50,
+            ATTR_P95: self.state,
+            ATTR_MAX: self.max,
+        }
+
+
+class OctopusNetSnapshot:
+    """Current data of a Digital Devices Octopus NET."""
+
+    __slots__ = (
+        "update",
+        "fanspeed",
+        "temperature",
+        "reboot",
+        "epg",
+        "epg_scan",
+        "tuner",
+        "stream",
+        "stream_bitrate",
+        "stream_packet_rate",
+        "skipped_writes",
+        "poll_duration",
+        "tuners",
+        "streams",
+        "stream_bitrates",
+        "stream_packet_rates",
+        "latencies",
+        "retired",
+        "last_pull",
+    )
+
+    def __init__(self) -> None:
+        """Initialize."""
+        self.update = OctopusNetRecord(ATTR_UPDATE, available=True)
+        self.fanspeed = OctopusNetRecord(ATTR_FANSPEED)
+        self.temperature = OctopusNetRecord(ATTR_TEMPERATURE)
+        self.reboot = OctopusNetRebootRecord(ATTR_REBOOT)
+        self.epg = OctopusNetEpgRecord(ATTR_EPG)
+        self.epg_scan = OctopusNetRecord(ATTR_EPG_SCAN)
+        self.tuner = OctopusNetTunerRecord(ATTR_TUNER)
+        self.stream = OctopusNetStreamRecord(ATTR_STREAM)
+        self.stream_bitrate = OctopusNetRecord(f"{ATTR_STREAM}_{ATTR_BITRATE}")
+        self.stream_packet_rate = OctopusNetRecord(f"{ATTR_STREAM}_{ATTR_PACKET_RATE}")
+        self.skipped_writes = OctopusNetRecord(ATTR_SKIPPED_WRITES, available=True)
+        self.poll_duration = OctopusNetPollRecord(ATTR_POLL_DURATION, available=True)
+        self.tuners: list[OctopusNetTunerRecord] = []
+        self.streams: list[OctopusNetStreamRecord] = []
+        self.stream_bitrates: list[OctopusNetRecord] = []
+        self.stream_packet_rates: list[OctopusNetRecord] = []
+        self.latencies: dict[str, OctopusNetLatencyRecord] = {
+            _name: OctopusNetLatencyRecord(f"{ATTR_LATENCY}_{_name}")
+            for _name in REQUEST_ENDPOINTS
+        }
+        # Records of tuners and streams the device no longer reports, reused
+        # if the slot comes back so their entities follow it again
+        self.retired: dict[str, OctopusNetRecord] = {}
+        self.last_pull: datetime | None = None
+
+    def resize_tuners(
+        self,
+        count: int,
+    ) -> None:
+        """Keep records for exactly the given number of tuners."""
+        self._retire(self.tuners[count:])
+        del self.tuners[count:]
+        for _index in range(len(self.tuners) + 1, count + 1):
+            self.tuners.append(
+                self._restore(f"{ATTR_TUNER}_{_index}", OctopusNetTunerRecord)
+            )
+
+    def resize_streams(
+        self,
+        count: int,
+    ) -> None:
+        """Keep records for exactly the given number of streams."""
+        self._retire(self.streams[count:])
+        self._retire(self.stream_bitrates[count:])
+        self._retire(self.stream_packet_rates[count:])
+        del self.streams[count:]
+        del self.stream_bitrates[count:]
+        del self.stream_packet_rates[count:]
+        for _index in range(len(self.streams) + 1, count + 1):
+            _key = f"{ATTR_STREAM}_{_index}"
+            self.streams.append(self._restore(_key, OctopusNetStreamRecord))
+            self.stream_bitrates.append(
+                self._restore(f"{_key}_{ATTR_BITRATE}", OctopusNetRecord)
+            )
+            self.stream_packet_rates.append(
+                self._restore(f"{_key}_{ATTR_PACKET_RATE}", OctopusNetRecord)
+            )
+
+    def _retire(
+        self,
+        records: list[OctopusNetRecord],
+    ) -> None:
+        """Keep the records of removed slots as unavailable."""
+        for _record in records:
+            _record.update(available=False)
+            self.retired[_record.key] = _record
+
+    def _restore(
+        self,
+        key: str,
+        record_class: type[OctopusNetRecord],
+    ) -> OctopusNetRecord:
+        """Return the retired record of a slot or a new one."""
+        return self.retired.pop(key, None) or record_class(key)
+
+    def as_dict(self) -> dict[str, any]:
+        """Return all records of the snapshot."""
+        _result = {}
+        for _name in self.__slots__:
+            _value = getattr(self, _name)
+            if isinstance(_value, OctopusNetRecord):
+                _result[_name] = asdict(_value)
+            elif isinstance(_value, list):
+                _result[_name] = [asdict(_record) for _record in _value]
+            elif isinstance(_value, dict):
+                _result[_name] = {_key: asdict(_record) for _key, _record in _value.items()}
+            else:
+                _result[_name] = _value
+        return _result
+
+    def get_record(
+        self,
+        key: str,
+    ) -> OctopusNetRecord:
+        """Return the record of an entity key."""
+        _prefix, _, _index = key.partition("_")
+        if _prefix == ATTR_LATENCY:
+            return self.latencies[_index]
+        if _prefix in (ATTR_TUNER, ATTR_STREAM) and _index[:1].isdigit():
+            _index, _, _suffix = _index.partition("_")
+            _index = int(_index)
+            if _prefix == ATTR_TUNER:
+                if _index > len(self.tuners):
+                    self.resize_tuners(_index)
+                return self.tuners[_index - 1]
+            if _index > len(self.streams):
+                self.resize_streams(_index)
+            if _suffix == ATTR_BITRATE:
+                return self.stream_bitrates[_index - 1]
+            if _suffix == ATTR_PACKET_RATE:
+                return self.stream_packet_rates[_index - 1]
+            return self.streams[_index - 1]
+        return getattr(self, key)
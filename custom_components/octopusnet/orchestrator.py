@@ -0,0 +1,119 @@
+"""Poll orchestration of all Digital Devices Octopus NET devices."""
+from __future__ import annotations
+
+import asyncio
+import time
+import zlib
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    POLL_CONCURRENCY,
+)
+
+DATA_ORCHESTRATOR = "orchestrator"
+
+
+class OctopusNetPollOrchestrator:
+    """Shared concurrency budget and timing of the polls of all devices."""
+
+    def __init__(
+        self,
+        concurrency: int = POLL_CONCURRENCY,
+    ) -> None:
+        """Initialize."""
+        self._semaphore = asyncio.Semaphore(concurrency)
+        self.concurrency = concurrency
+        self.active = 0
+        self.peak_active = 0
+        self.polls = 0
+        self.total_duration = 0.0
+        self.max_duration = 0.0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_durations: dict[str, float] = {}
+
+    @staticmethod
+    def get_jitter(
+        entry_id: str,
+        interval: float,
+    ) -> float:
+        """Return a stable offset of a device within the poll interval."""
+        # The offset is derived from the entry ID, so devices keep their
+        # position across restarts instead of drifting back into lock-step.
+        return (zlib.crc32(entry_id.encode()) % 1000) / 1000 * interval
+
+    @asynccontextmanager
+    async def async_poll(
+        self,
+        entry_id: str,
+    ) -> AsyncIterator[None]:
+        """Run a device poll within the shared concurrency budget."""
+        _queued = time.monotonic()
+        async with self._semaphore:
+            _started = time.monotonic()
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+            try:
+                yield
+            finally:
+                self.active -= 1
+                self._record(entry_id, _started - _queued, time.monotonic() - _started)
+
+    def _record(
+        self,
+        entry_id: str,
+        wait: float,
+        duration: float,
+    ) -> None:
+        """Add the timing of a poll to the statistics."""
+        self.polls += 1
+        self.total_duration += duration
+        self.max_duration = max(self.max_duration, duration)
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        self.last_durations[entry_id] = duration
+        LOGGER.debug(
+            "Poll of %s took %.3f s after waiting %.3f s, %s polls running",
+            entry_id,
+            duration,
+            wait,
+            self.active,
+        )
+
+    @callback
+    def async_remove(
+        self,
+        entry_id: str,
+    ) -> None:
+        """Forget a device that is unloaded."""
+        self.last_durations.pop(entry_id, None)
+
+    def as_dict(self) -> dict[str, any]:
+        """Return the aggregated poll statistics of all devices."""
+        return {
+            "devices": len(self.last_durations),
+            "concurrency": self.concurrency,
+            "active": self.active,
+            "peak_active": self.peak_active,
+            "polls": self.polls,
+            "average_duration": round(self.total_duration / self.polls, 3) if self.polls else None,
+            "max_duration": round(self.max_duration, 3),
+            "average_wait": round(self.total_wait / self.polls, 3) if self.polls else None,
+            "max_wait": round(self.max_wait, 3),
+        }
+
+
+@callback
+def async_get_orchestrator(
+    hass: HomeAssistant,
+) -> OctopusNetPollOrchestrator:
+    """Return the poll orchestrator shared by all config entries."""
+    _data = hass.data.setdefault(DOMAIN, {})
+    if DATA_ORCHESTRATOR not in _data:
+        _data[DATA_ORCHESTRATOR] = OctopusNetPollOrchestrator()
+    return _data[DATA_ORCHESTRATOR]
@@ -0,0 +1,94 @@
+"""Reboot tracking for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+
+from homeassistant.core import HomeAssistant
+from homeassistant.config_entries import ConfigEntry
+
+from .const import (
+    DOMAIN,
+    LOGGER,
+    REBOOT_DOWN_DELAY,
+    REBOOT_PROBE_INTERVAL,
+    REBOOT_PROBE_INTERVAL_MAX,
+    REBOOT_TIMEOUT,
+)
+from .api import (
+    OctopusNetApiClient,
+    OctopusNetApiTimeoutError,
+)
+
+
+class OctopusNetRebootWatcher:
+    """Wait for a device to come back after a reboot."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry: ConfigEntry,
+        client: OctopusNetApiClient,
+        ready_callback: Callable[[], Awaitable[None]],
+    ) -> None:
+        """Initialize."""
+        self._hass = hass
+        self._config_entry = config_entry
+        self._client = client
+        self._ready_callback = ready_callback
+        self._task: asyncio.Task | None = None
+        self.rebooting = False
+        self.timed_out = False
+
+    def async_start(self) -> None:
+        """Start watching a reboot that was just commanded."""
+        if self._task is not None and not self._task.done():
+            return
+        self.rebooting = True
+        self.timed_out = False
+        self._task = self._config_entry.async_create_background_task(
+            self._hass,
+            self._async_watch(),
+            f"{DOMAIN}_reboot_{self._config_entry.entry_id}",
+        )
+
+    async def async_wait_ready(self) -> None:
+        """Wait until a running reboot and the following refresh have finished."""
+        if self._task is not None and not self._task.done():
+            # A caller giving up must not stop the watcher
+            await asyncio.shield(self._task)
+        if self.timed_out:
+            raise OctopusNetApiTimeoutError(
+                f"{self._config_entry.title} did not come back within "
+                f"{REBOOT_TIMEOUT} seconds after reboot"
+            )
+
+    async def _async_watch(self) -> None:
+        """Probe the device with increasing intervals until it answers."""
+        try:
+            # The device keeps answering for a moment after the command
+            await asyncio.sleep(REBOOT_DOWN_DELAY)
+            _interval = REBOOT_PROBE_INTERVAL
+            _waited = REBOOT_DOWN_DELAY
+            while not await self._client.async_probe():
+                if _waited >= REBOOT_TIMEOUT:
+                    LOGGER.warning(
+                        "%s did not come back within %s seconds after reboot",
+                        self._config_entry.title,
+                        REBOOT_TIMEOUT,
+                    )
+                    # Polling resumes and reports the device as unavailable
+                    self.timed_out = True
+                    break
+                await asyncio.sleep(_interval)
+                _waited += _interval
+                _interval = min(REBOOT_PROBE_INTERVAL_MAX, _interval * 2)
+            else:
+                LOGGER.debug(
+                    "%s is back after about %s seconds",
+                    self._config_entry.title,
+                    _waited,
+                )
+        finally:
+            self.rebooting = False
+        await self._ready_callback()
@@ -5,6 +5,8 @@ from homeassistant.core import HomeAssistant
 from homeassistant.const import (
     CONF_HOST,
     REVOLUTIONS_PER_MINUTE,
+    UnitOfTime,
+    UnitOfDataRate,
     UnitOfTemperature,
     ATTR_TEMPERATURE,
 )
@@ -21,12 +23,22 @@ from homeassistant.helpers.entity import (
 )
 
 from .const import (
+    UNIT_PACKETS_PER_SECOND,
+    REQUEST_ENDPOINTS,
     ATTR_FANSPEED,
     ATTR_TUNER,
     ATTR_STREAM,
+    ATTR_SKIPPED_WRITES,
+    ATTR_POLL_DURATION,
+    ATTR_LATENCY,
+    ATTR_BITRATE,
+    ATTR_PACKET_RATE,
 )
 from .coordinator import OctopusNetDataUpdateCoordinator
-from .entity import OctopusNetEntity
+from .entity import (
+    OctopusNetEntity,
+    async_setup_slot_entities,
+)
 
 
 async def async_setup_entry(
@@ -75,7 +87,58 @@ async def async_setup_entry(
             device_class=None,
             state_class=SensorStateClass.MEASUREMENT,
         ),
+        SensorEntityDescription(
+            key=ATTR_SKIPPED_WRITES,
+            translation_key=ATTR_SKIPPED_WRITES,
+            icon="mdi:content-save-off-outline",
+            state_class=SensorStateClass.TOTAL_INCREASING,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+        SensorEntityDescription(
+            key=ATTR_POLL_DURATION,
+            translation_key=ATTR_POLL_DURATION,
+            icon="mdi:timer-outline",
+            native_unit_of_measurement=UnitOfTime.SECONDS,
+            device_class=SensorDeviceClass.DURATION,
+            suggested_display_precision=2,
+            state_class=SensorStateClass.MEASUREMENT,
+            entity_category=EntityCategory.DIAGNOSTIC,
+            entity_registry_enabled_default=False,
+        ),
+        SensorEntityDescription(
+            key=f"{ATTR_STREAM}_{ATTR_BITRATE}",
+            translation_key=ATTR_BITRATE,
+            icon="mdi:speedometer",
+            native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+            suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+            device_class=SensorDeviceClass.DATA_RATE,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
+        SensorEntityDescription(
+            key=f"{ATTR_STREAM}_{ATTR_PACKET_RATE}",
+            translation_key=ATTR_PACKET_RATE,
+            icon="mdi:speedometer",
+            native_unit_of_measurement=UNIT_PACKETS_PER_SECOND,
+            suggested_display_precision=0,
+            state_class=SensorStateClass.MEASUREMENT,
+        ),
     ]
+    for name in REQUEST_ENDPOINTS:
+        entity_descriptions.append(
+            SensorEntityDescription(
+                key=f"{ATTR_LATENCY}_{name}",
+                translation_key=ATTR_LATENCY,
+                translation_placeholders={"endpoint": name},
+                icon="mdi:timer-sand",
+                native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+                device_class=SensorDeviceClass.DURATION,
+                suggested_display_precision=0,
+                state_class=SensorStateClass.MEASUREMENT,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
+            )
+        )
 
     async_add_entities(
         [
@@ -88,6 +151,52 @@ async def async_setup_entry(
         ],
         update_before_add=True,
     )
+    async_setup_slot_entities(
+        hass=hass,
+        config_entry=config_entry,
+        async_add_entities=async_add_entities,
+        get_descriptions=_get_slot_descriptions,
+        create_entity=lambda entity_description: OctopusNetSensor(
+            coordinator=coordinator,
+            host=config_entry.data[CONF_HOST],
+            entity_description=entity_description,
+        ),
+    )
+
+
+def _get_slot_descriptions(
+    tuner_count: int,
+    stream_count: int,
+) -> list[SensorEntityDescription]:
+    """Return the descriptions of all streams."""
+    entity_descriptions = []
+    for i in range(1, stream_count + 1):
+        entity_descriptions.append(
+            SensorEntityDescription(
+                key=f"{ATTR_STREAM}_{i}_{ATTR_BITRATE}",
+                name=f"Stream {i} bitrate",
+                icon="mdi:speedometer",
+                native_unit_of_measurement=UnitOfDataRate.BYTES_PER_SECOND,
+                suggested_unit_of_measurement=UnitOfDataRate.MEGABITS_PER_SECOND,
+                device_class=SensorDeviceClass.DATA_RATE,
+                state_class=SensorStateClass.MEASUREMENT,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
+            )
+        )
+        entity_descriptions.append(
+            SensorEntityDescription(
+                key=f"{ATTR_STREAM}_{i}_{ATTR_PACKET_RATE}",
+                name=f"Stream {i} packet rate",
+                icon="mdi:speedometer",
+                native_unit_of_measurement=UNIT_PACKETS_PER_SECOND,
+                suggested_display_precision=0,
+                state_class=SensorStateClass.MEASUREMENT,
+                entity_category=EntityCategory.DIAGNOSTIC,
+                entity_registry_enabled_default=False,
+            )
+        )
+    return entity_descriptions
 
 
 class OctopusNetSensor(OctopusNetEntity, SensorEntity):
@@ -1,11 +1,19 @@
 """Services Registry for Digital Devices Octopus NET integration."""
 
+import asyncio
+import time
+from collections.abc import Awaitable, Callable
+
 from homeassistant.core import (
     HomeAssistant,
     ServiceCall,
+    ServiceResponse,
+    SupportsResponse,
 )
 from homeassistant.const import (
     CONF_DEVICE_ID,
+    CONF_HOST,
+    CONF_TIMEOUT,
 )
 from homeassistant.helpers.device_registry import async_get
 from homeassistant.helpers.service import (
@@ -14,11 +22,16 @@ from homeassistant.helpers.service import (
 
 from .const import (
     DOMAIN,
+    LOGGER,
     SERVICE_REBOOT,
     SERVICE_REBOOT_SCHEMA,
     SERVICE_EPG_SCAN,
     SERVICE_EPG_SCAN_SCHEMA,
+    CONF_WAVE_SIZE,
+    CONF_WAIT_ONLINE,
 )
+from .api import OctopusNetApiError
+from .coordinator import OctopusNetDataUpdateCoordinator
 
 
 async def async_setup_services(hass: HomeAssistant) -> None:
@@ -27,7 +40,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
         return
 
     @verify_domain_control(DOMAIN)
-    async def async_handle_service(call: ServiceCall) -> None:
+    async def async_handle_service(call: ServiceCall) -> ServiceResponse:
         """Call correct Digital Devices Octopus NET service."""
         service = call.service
         data = {**call.data}
@@ -48,45 +61,107 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             for config_entry_id in list(device.config_entries):
                 config_entry = hass.config_entries.async_get_entry(config_entry_id)
                 if config_entry.domain == DOMAIN:
-                    targets.append(config_entry.runtime_data)
+                    targets.append((device_id, config_entry.runtime_data))
                     break
 
         if service == SERVICE_REBOOT:
-            await _async_reboot(hass, targets, data)
-        elif service == SERVICE_EPG_SCAN:
-            await _async_epg_scan(hass, targets, data)
+            return await _async_reboot(hass, targets, data)
+        if service == SERVICE_EPG_SCAN:
+            return await _async_epg_scan(hass, targets, data)
+        return None
 
     hass.services.async_register(
         domain=DOMAIN,
         service=SERVICE_REBOOT,
         service_func=async_handle_service,
-        schema=SERVICE_REBOOT_SCHEMA
+        schema=SERVICE_REBOOT_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
     hass.services.async_register(
         domain=DOMAIN,
         service=SERVICE_EPG_SCAN,
         service_func=async_handle_service,
-        schema=SERVICE_EPG_SCAN_SCHEMA
+        schema=SERVICE_EPG_SCAN_SCHEMA,
+        supports_response=SupportsResponse.OPTIONAL,
     )
 
+async def _async_run_batch(
+    targets: list[tuple[str, OctopusNetDataUpdateCoordinator]],
+    action: Callable[[OctopusNetDataUpdateCoordinator], Awaitable[any]],
+    wave_size: int,
+    timeout: int,
+    wait: Callable[[OctopusNetDataUpdateCoordinator], Awaitable[any]] | None = None,
+) -> ServiceResponse:
+    """Run an action on several devices with a bounded number at a time.
+
+    A device leaves the wave once its action completed or timed out, the
+    next device starts right away. The timeout applies to the action only,
+    the optional wait afterwards is bounded by its own deadline.
+    """
+    _semaphore = asyncio.Semaphore(wave_size)
+
+    async def _async_run(
+        device_id: str,
+        coordinator: OctopusNetDataUpdateCoordinator,
+    ) -> dict[str, any]:
+        async with _semaphore:
+            _start = time.monotonic()
+            _error = None
+            try:
+                async with asyncio.timeout(timeout):
+                    await action(coordinator)
+                if wait is not None:
+                    await wait(coordinator)
+            except TimeoutError:
+                _error = f"Timeout after {timeout} seconds"
+            except OctopusNetApiError as exception:
+                _error = str(exception)
+            except Exception as exception:
+                LOGGER.exception(exception)
+                _error = str(exception)
+            return {
+                CONF_DEVICE_ID: device_id,
+                CONF_HOST: coordinator.config_entry.data.get(CONF_HOST),
+                "success": _error is None,
+                "latency": round(time.monotonic() - _start, 3),
+                "error": _error,
+            }
+
+    return {
+        "results": list(
+            await asyncio.gather(
+                *(
+                    _async_run(device_id, coordinator)
+                    for device_id, coordinator in targets
+                )
+            )
+        ),
+    }
+
 async def _async_reboot(
     hass: HomeAssistant,
-    targets: list[any],
+    targets: list[tuple[str, OctopusNetDataUpdateCoordinator]],
     data: dict[str, any],
-) -> None:
+) -> ServiceResponse:
     """Handle the service call."""
-    for coordinator in targets:
-        hass.async_create_task(
-            coordinator.async_reboot()
-        )
+    return await _async_run_batch(
+        targets,
+        lambda coordinator: coordinator.async_reboot(raise_errors=True),
+        data[CONF_WAVE_SIZE],
+        data[CONF_TIMEOUT],
+        # Not limited by the timeout, the reboot watcher has its own deadline
+        OctopusNetDataUpdateCoordinator.async_wait_ready if data[CONF_WAIT_ONLINE] else None,
+    )
 
 async def _async_epg_scan(
     hass: HomeAssistant,
-    targets: list[any],
+    targets: list[tuple[str, OctopusNetDataUpdateCoordinator]],
     data: dict[str, any],
-) -> None:
+) -> ServiceResponse:
     """Handle the service call."""
-    for coordinator in targets:
-        hass.async_create_task(
-            coordinator.async_epg_scan()
-        )
+    return await _async_run_batch(
+        targets,
+        lambda coordinator: coordinator.async_epg_scan(raise_errors=True),
+        data[CONF_WAVE_SIZE],
+        data[CONF_TIMEOUT],
+    )
@@ -0,0 +1,229 @@
+"""Tuner signal analytics for Digital Devices Octopus NET."""
+from __future__ import annotations
+
+import math
+from array import array
+
+from .const import (
+    SIGNAL_WINDOW_SIZE,
+    SIGNAL_BASELINE_ALPHA,
+    SIGNAL_WARMUP_SAMPLES,
+    SIGNAL_DEVIATION_FACTOR,
+    SIGNAL_FLAP_WINDOW,
+    SIGNAL_FLAP_THRESHOLD,
+    SIGNAL_LOCK_LOSS_POLLS,
+    SIGNAL_MIN_DEVIATION,
+    ATTR_STRENGTH,
+    ATTR_SNR,
+    ATTR_QUALITY,
+    ATTR_LEVEL,
+    ATTR_LOCK,
+    ATTR_MIN,
+    ATTR_MAX,
+    ATTR_MEAN,
+    ATTR_STDDEV,
+    ATTR_SAMPLES,
+    ATTR_LOCK_LOSSES,
+    ATTR_LOCK_CHANGES,
+)
+
+SIGNAL_VALUES = (
+    ATTR_STRENGTH,
+    ATTR_SNR,
+    ATTR_QUALITY,
+    ATTR_LEVEL,
+)
+
+# Attributes of the rolling window, they change with every poll
+SIGNAL_ATTRIBUTES = frozenset(
+    {
+        ATTR_SAMPLES,
+        ATTR_LOCK_LOSSES,
+        *(
+            f"{_name}_{_statistic}"
+            for _name in SIGNAL_VALUES
+            for _statistic in (ATTR_MIN, ATTR_MAX, ATTR_MEAN, ATTR_STDDEV)
+        ),
+    }
+)
+
+
+class OctopusNetSignalWindow:
+    """Rolling window of the signal values of an active tuner."""
+
+    __slots__ = ("_size", "_values", "_lock_losses", "_count", "_index", "_locked")
+
+    def __init__(
+        self,
+        size: int = SIGNAL_WINDOW_SIZE,
+    ) -> None:
+        """Initialize."""
+        self._size = size
+        # One preallocated ring buffer per value, written at the same index
+        self._values = {
+            _name: array("d", bytes(8 * size))
+            for _name in SIGNAL_VALUES
+        }
+        self._lock_losses = array("B", bytes(size))
+        self._count = 0
+        self._index = 0
+        self._locked: bool | None = None
+
+    def add(
+        self,
+        active: bool,
+        lock: bool,
+        **values: float,
+    ) -> None:
+        """Add the values of a poll; an inactive tuner adds no sample."""
+        if not active:
+            self._locked = None
+            return
+        for _name in SIGNAL_VALUES:
+            self._values[_name][self._index] = values[_name]
+        self._lock_losses[self._index] = bool(self._locked and not lock)
+        self._locked = lock
+        self._index = (self._index + 1) % self._size
+        self._count = min(self._count + 1, self._size)
+
+    def as_attributes(self) -> dict[str, float | int | None]:
+        """Return min, max, mean and standard deviation of all values."""
+        _attributes: dict[str, float | int | None] = {
+            ATTR_SAMPLES: self._count,
+            ATTR_LOCK_LOSSES: sum(self._lock_losses),
+        }
+        for _name in SIGNAL_VALUES:
+            # The filled part of the buffer; order does not matter here
+            _values = self._values[_name][:self._count]
+            _min = _max = _mean = _stddev = None
+            if _values:
+                _mean = math.fsum(_values) / self._count
+                _stddev = math.sqrt(
+                    math.fsum((_value - _mean) ** 2 for _value in _values) / self._count
+                )
+                _min = round(min(_values), 2)
+                _max = round(max(_values), 2)
+                _mean = round(_mean, 2)
+                _stddev = round(_stddev, 2)
+            _attributes[f"{_name}_{ATTR_MIN}"] = _min
+            _attributes[f"{_name}_{ATTR_MAX}"] = _max
+            _attributes[f"{_name}_{ATTR_MEAN}"] = _mean
+            _attributes[f"{_name}_{ATTR_STDDEV}"] = _stddev
+        return _attributes
+
+
+class OctopusNetSignalDetector:
+    """Exponentially weighted baseline of SNR and strength of a tuner."""
+
+    __slots__ = (
+        "_baselines",
+        "_samples",
+        "_tuning",
+        "_locked",
+        "_lock_changes",
+        "_unlocked",
+        "degraded",
+    )
+
+    def __init__(self) -> None:
+        """Initialize."""
+        # Mean and variance per value
+        self._baselines: dict[str, tuple[float, float]] = {}
+        self._samples = 0
+        self._tuning: str | None = None
+        self._locked: bool | None = None
+        # One bit per recent poll, set if the lock changed
+        self._lock_changes = 0
+        # Consecutive polls of the active tuner without lock
+        self._unlocked = 0
+        self.degraded = False
+
+    def reset(self) -> None:
+        """Forget the baseline, e.g. after the tuner was tuned to another transponder."""
+        self._baselines.clear()
+        self._samples = 0
+        self._locked = None
+        self._lock_changes = 0
+        self._unlocked = 0
+        self.degraded = False
+
+    @property
+    def lock_changes(self) -> int:
+        """Return the number of lock changes within the recent polls."""
+        return self._lock_changes.bit_count()
+
+    def get_baseline(
+        self,
+        name: str,
+    ) -> float | None:
+        """Return the baseline of a value."""
+        if name not in self._baselines:
+            return None
+        return round(self._baselines[name][0], 2)
+
+    def update(
+        self,
+        active: bool,
+        lock: bool,
+        tuning: str | None,
+        **values: float,
+    ) -> list[str]:
+        """Add the values of a poll and return the reasons of a new degradation."""
+        if not active:
+            self.reset()
+            return []
+        if tuning != self._tuning:
+            self.reset()
+            self._tuning = tuning
+
+        _changed = self._locked is not None and lock != self._locked
+        self._locked = lock
+        self._lock_changes = (
+            (self._lock_changes << 1 | _changed) & ((1 << SIGNAL_FLAP_WINDOW) - 1)
+        )
+        _reasons = []
+        if self.lock_changes >= SIGNAL_FLAP_THRESHOLD:
+            _reasons.append(ATTR_LOCK_CHANGES)
+        self._unlocked = 0 if lock else self._unlocked + 1
+        if (
+            # Lost after it had been locked, or never locked since the warm-up
+            self._unlocked >= SIGNAL_LOCK_LOSS_POLLS and self._samples
+        ) or self._unlocked >= SIGNAL_WARMUP_SAMPLES:
+            _reasons.append(ATTR_LOCK)
+
+        # Values of a tuner without lock are meaningless
+        if lock:
+            for _name, _minimum in SIGNAL_MIN_DEVIATION.items():
+                if self._update_baseline(_name, values[_name], _minimum):
+                    _reasons.append(_name)
+            self._samples += 1
+
+        _degraded = bool(_reasons)
+        _new = _degraded and not self.degraded
+        self.degraded = _degraded
+        return _reasons if _new else []
+
+    def _update_baseline(
+        self,
+        name: str,
+        value: float,
+        minimum: float,
+    ) -> bool:
+        """Update the baseline of a value and return True if the value is below its band."""
+        if name not in self._baselines:
+            self._baselines[name] = (value, 0.0)
+            return False
+        _mean, _variance = self._baselines[name]
+        if (
+            self._samples >= SIGNAL_WARMUP_SAMPLES
+            and value < _mean - max(SIGNAL_DEVIATION_FACTOR * math.sqrt(_variance), minimum)
+        ):
+            # Keep the baseline from following a fade
+            return True
+        _diff = value - _mean
+        _increment = SIGNAL_BASELINE_ALPHA * _diff
+        self._baselines[name] = (
+            _mean + _increment,
+            (1 - SIGNAL_BASELINE_ALPHA) * (_variance + _diff * _increment),
+        )
+        return False
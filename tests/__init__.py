@@ -0,0 +1,16 @@
+"""Tests for the Digital Devices Octopus NET integration."""
+from __future__ import annotations
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.octopusnet.coordinator import OctopusNetDataUpdateCoordinator
+
+
+async def async_poll(
+    hass: HomeAssistant,
+    coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Poll all sections now, as the refresh timer would once they are due."""
+    coordinator._section_next_poll.clear()
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
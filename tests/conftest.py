@@ -0,0 +1,81 @@
+"""Fixtures for the Digital Devices Octopus NET tests."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_PORT,
+    CONF_SSL,
+    CONF_USERNAME,
+    CONF_VERIFY_SSL,
+)
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.octopusnet.const import (
+    DOMAIN,
+    CONF_TUNER_COUNT,
+    CONF_STREAM_COUNT,
+)
+from custom_components.octopusnet.coordinator import OctopusNetDataUpdateCoordinator
+
+from .stand_in import OctopusNetStandIn
+
+
+@pytest.fixture(autouse=True)
+def auto_enable_custom_integrations(enable_custom_integrations):
+    """Load the integration from custom_components."""
+    yield
+
+
+@pytest.fixture
+async def stand_in() -> AsyncGenerator[OctopusNetStandIn]:
+    """Return a running stand-in device with 4 tuners and 8 streams."""
+    _stand_in = OctopusNetStandIn()
+    await _stand_in.async_start()
+    yield _stand_in
+    await _stand_in.async_stop()
+
+
+@pytest.fixture
+def config_entry(
+    hass: HomeAssistant,
+    stand_in: OctopusNetStandIn,
+) -> MockConfigEntry:
+    """Return a config entry of the stand-in device."""
+    _config_entry = MockConfigEntry(
+        domain=DOMAIN,
+        title="127.0.0.1",
+        unique_id="127.0.0.1",
+        data={
+            CONF_HOST: "127.0.0.1",
+            CONF_PORT: stand_in.port,
+            CONF_USERNAME: "",
+            CONF_PASSWORD: "",
+            CONF_SSL: False,
+            CONF_VERIFY_SSL: False,
+            CONF_TUNER_COUNT: len(stand_in.tuners),
+            CONF_STREAM_COUNT: len(stand_in.streams),
+        },
+    )
+    _config_entry.add_to_hass(hass)
+    return _config_entry
+
+
+@pytest.fixture
+async def coordinator(
+    recorder_mock,
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> AsyncGenerator[OctopusNetDataUpdateCoordinator]:
+    """Set up the integration and return its coordinator."""
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    yield config_entry.runtime_data
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
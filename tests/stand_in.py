@@ -0,0 +1,305 @@
+"""Stand-in for the web server of a Digital Devices Octopus NET."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+PATH_FANSPEED = "/system/fanspeed"
+PATH_TEMPERATURE = "/log/Temperatur.log"
+PATH_EPG = "/epg/status"
+PATH_TUNER = "/octoserve/tunerstatus.json"
+PATH_STREAM = "/octoserve/streamstatus.json"
+PATH_CHANNELS = "/channels/data"
+PATH_REBOOT = "/system/reboot"
+
+# Failures that are not an HTTP status
+FAIL_DISCONNECT = "disconnect"
+FAIL_INVALID = "invalid"
+
+
+class OctopusNetStandIn:
+    """Serve the endpoints used by the integration from generated data.
+
+    Latency, payload size, the number of tuners and streams and failures
+    of single endpoints can be set between requests.
+    """
+
+    def __init__(
+        self,
+        tuner_count: int = 4,
+        stream_count: int = 8,
+        channel_count: int = 100,
+        latency: float = 0.0,
+        padding: int = 0,
+    ) -> None:
+        """Initialize."""
+        self.latency = latency
+        # Filler added to every JSON body to raise the payload size
+        self.padding = padding
+        self.channel_count = channel_count
+        self.fanspeed = 1200
+        self.epg = {"status": "idle", "total": 0, "events": 0}
+        self.tuners: list[dict] = []
+        self.streams: list[dict] = []
+        self.requests: dict[str, int] = {}
+        # Body bytes sent per path
+        self.sent: dict[str, int] = {}
+        self._failures: dict[str, tuple[int | str, int | None]] = {}
+        self._log = bytearray()
+        self._log_generation = 0
+        self._server: TestServer | None = None
+        self.set_slots(tuner_count, stream_count)
+        self.append_temperature(40.0, 60)
+
+    @property
+    def port(self) -> int:
+        """Return the port of the running server."""
+        return self._server.port
+
+    def set_slots(
+        self,
+        tuner_count: int,
+        stream_count: int,
+    ) -> None:
+        """Report the given number of tuners and streams, all of them active."""
+        self.tuners = [
+            {
+                "Status": "Active",
+                "Lock": True,
+                "Strength": -60000,
+                "SNR": 12000,
+                "Quality": 15,
+                "Level": 48,
+            }
+            for _ in range(tuner_count)
+        ]
+        self.streams = [
+            {
+                "Status": "Active",
+                "Input": _index % max(1, tuner_count),
+                "Packets": 0,
+                "Bytes": 0,
+                "Client": f"192.168.1.{100 + _index}",
+                "Request": self.get_request(_index % max(1, self.channel_count)),
+            }
+            for _index in range(stream_count)
+        ]
+
+    def advance_streams(
+        self,
+        packets: int = 1000,
+    ) -> None:
+        """Advance the counters of all active streams."""
+        for _stream in self.streams:
+            if _stream["Status"] == "Active":
+                _stream["Packets"] += packets
+                _stream["Bytes"] += packets * 188
+
+    def append_temperature(
+        self,
+        value: float,
+        count: int = 1,
+    ) -> None:
+        """Append samples to the temperature log."""
+        self._log += f"{value:.1f}\n".encode() * count
+
+    def rotate_log(self) -> None:
+        """Start a new temperature log."""
+        self._log = bytearray()
+        self._log_generation += 1
+
+    def fail(
+        self,
+        path: str,
+        failure: int | str = 500,
+        count: int | None = None,
+    ) -> None:
+        """Fail the requests of an endpoint, count times or until cleared.
+
+        The failure is an HTTP status, FAIL_DISCONNECT or FAIL_INVALID.
+        """
+        self._failures[path] = (failure, count)
+
+    def clear_failures(self) -> None:
+        """Answer all requests again."""
+        self._failures.clear()
+
+    async def async_start(self) -> None:
+        """Start the server on a free local port."""
+        _app = web.Application()
+        _app.router.add_get(PATH_FANSPEED, self._handle_fanspeed)
+        _app.router.add_get(PATH_TEMPERATURE, self._handle_temperature)
+        _app.router.add_get(PATH_EPG, self._handle_epg)
+        _app.router.add_get(PATH_TUNER, self._handle_tuner)
+        _app.router.add_get(PATH_STREAM, self._handle_stream)
+        _app.router.add_post(PATH_CHANNELS, self._handle_channels)
+        _app.router.add_get(PATH_REBOOT, self._handle_reboot)
+        self._server = TestServer(_app, host="127.0.0.1")
+        await self._server.start_server()
+
+    async def async_stop(self) -> None:
+        """Stop the server."""
+        if self._server is not None:
+            await self._server.close()
+
+    def get_request(
+        self,
+        index: int,
+    ) -> str:
+        """Return the SAT>IP request of a generated channel."""
+        _frequency = 10700 + (index // 8) * 20
+        _pid = 100 + (index % 8) * 10
+        return (
+            f"?src=1&freq={_frequency}&pol=h&msys=dvbs2&sr=27500"
+            f"&pids=0,17,18,{_pid},{_pid + 1}"
+        )
+
+    async def _async_prepare(
+        self,
+        request: web.Request,
+    ) -> web.Response | None:
+        """Count and delay a request and return its injected failure."""
+        self.requests[request.path] = self.requests.get(request.path, 0) + 1
+        if self.latency:
+            await asyncio.sleep(self.latency)
+        if request.path not in self._failures:
+            return None
+        _failure, _count = self._failures[request.path]
+        if _count is not None:
+            if _count <= 1:
+                del self._failures[request.path]
+            else:
+                self._failures[request.path] = (_failure, _count - 1)
+        if _failure == FAIL_DISCONNECT:
+            request.transport.close()
+            raise ConnectionResetError
+        if _failure == FAIL_INVALID:
+            return web.Response(body=b"{", content_type="application/json")
+        return web.Response(status=_failure)
+
+    def _count_sent(
+        self,
+        request: web.Request,
+        body: bytes,
+    ) -> None:
+        """Count the body bytes sent for a path."""
+        self.sent[request.path] = self.sent.get(request.path, 0) + len(body)
+
+    def _json_response(
+        self,
+        request: web.Request,
+        data: dict,
+    ) -> web.Response:
+        """Return a JSON body with ETag, or 304 if the client has it already."""
+        if self.padding:
+            data = {**data, "Padding": "x" * self.padding}
+        _body = json.dumps(data).encode()
+        _etag = f'"{hashlib.md5(_body).hexdigest()}"'
+        if request.headers.get("If-None-Match") == _etag:
+            return web.Response(status=304, headers={"ETag": _etag})
+        self._count_sent(request, _body)
+        return web.Response(
+            body=_body,
+            content_type="application/json",
+            headers={"ETag": _etag},
+        )
+
+    async def _handle_fanspeed(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """Return the fan speed."""
+        if (_failure := await self._async_prepare(request)) is not None:
+            return _failure
+        return self._json_response(request, {"speed": self.fanspeed})
+
+    async def _handle_epg(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """Return the EPG status."""
+        if (_failure := await self._async_prepare(request)) is not None:
+            return _failure
+        return self._json_response(request, self.epg)
+
+    async def _handle_tuner(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """Return the tuner status."""
+        if (_failure := await self._async_prepare(request)) is not None:
+            return _failure
+        return self._json_response(request, {"TunerList": self.tuners})
+
+    async def _handle_stream(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """Return the stream status."""
+        if (_failure := await self._async_prepare(request)) is not None:
+            return _failure
+        return self._json_response(request, {"StreamList": self.streams})
+
+    async def _handle_channels(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """Return the channel list."""
+        if (_failure := await self._async_prepare(request)) is not None:
+            return _failure
+        return self._json_response(
+            request,
+            {
+                "data": [
+                    {
+                        "Title": f"Channel {_index + 1}",
+                        "Request": self.get_request(_index),
+                    }
+                    for _index in range(self.channel_count)
+                ],
+            },
+        )
+
+    async def _handle_reboot(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """Accept a reboot; the device keeps answering, fail it to take it down."""
+        if (_failure := await self._async_prepare(request)) is not None:
+            return _failure
+        return web.Response()
+
+    async def _handle_temperature(
+        self,
+        request: web.Request,
+    ) -> web.Response:
+        """Return the temperature log, or the requested range of it."""
+        if (_failure := await self._async_prepare(request)) is not None:
+            return _failure
+        _etag = f'"log-{self._log_generation}"'
+        _size = len(self._log)
+        _range = request.headers.get("Range", "")
+        _if_range = request.headers.get("If-Range")
+        if not _range.startswith("bytes=") or _if_range not in (None, _etag):
+            self._count_sent(request, self._log)
+            return web.Response(body=bytes(self._log), headers={"ETag": _etag})
+        _first, _, _last = _range[6:].partition("-")
+        _start = max(0, _size - int(_last)) if not _first else int(_first)
+        if _start >= _size:
+            return web.Response(
+                status=416,
+                headers={"Content-Range": f"bytes */{_size}", "ETag": _etag},
+            )
+        self._count_sent(request, self._log[_start:])
+        return web.Response(
+            status=206,
+            body=bytes(self._log[_start:]),
+            headers={
+                "Content-Range": f"bytes {_start}-{_size - 1}/{_size}",
+                "ETag": _etag,
+            },
+        )
@@ -0,0 +1,400 @@
+"""Tests for the Digital Devices Octopus NET API client."""
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+from collections.abc import AsyncGenerator
+
+import aiohttp
+import pytest
+
+from custom_components.octopusnet import api
+from custom_components.octopusnet.api import (
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+    OctopusNetApiCircuitOpenError,
+    OctopusNetApiClient,
+    OctopusNetApiCommunicationError,
+    OctopusNetCircuitBreaker,
+    OctopusNetLogTail,
+    create_session,
+)
+from custom_components.octopusnet.auth import OctopusNetAuth
+from custom_components.octopusnet.const import (
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_BACKOFF_MIN,
+    CIRCUIT_BACKOFF_MAX,
+)
+
+from .stand_in import (
+    FAIL_DISCONNECT,
+    FAIL_INVALID,
+    PATH_FANSPEED,
+    PATH_STREAM,
+    OctopusNetStandIn,
+)
+
+LOG = b"40.5\n41.0\n42.0\n"
+
+
+def _get_digest_params(header: str) -> dict[str, str]:
+    """Return the parameters of a digest authorization header."""
+    assert header.startswith("Digest ")
+    return {
+        _match.group(1): _match.group(2) if _match.group(2) is not None else _match.group(3)
+        for _match in re.finditer(r'(\w+)=(?:"([^"]*)"|([^\s,]+))', header[7:])
+    }
+
+
+def _read_suffix(
+    log_tail: OctopusNetLogTail,
+    log: bytes,
+    start: int,
+) -> list[str] | None:
+    """Feed the answer to the first read of the log tail."""
+    return log_tail.feed(
+        206,
+        {
+            "Content-Range": f"bytes {start}-{len(log) - 1}/{len(log)}",
+            "ETag": '"a"',
+        },
+        log[start:],
+    )
+
+
+def test_log_tail_suffix_drops_partial_line() -> None:
+    """Test the first line of a suffix read is dropped."""
+    _log_tail = OctopusNetLogTail(suffix_size=12)
+    assert _log_tail.request_headers() == {"Range": "bytes=-12"}
+
+    assert _read_suffix(_log_tail, LOG, 3) == ["41.0", "42.0"]
+    assert _log_tail.offset == len(LOG)
+    assert _log_tail.request_headers() == {
+        "Range": f"bytes={len(LOG)}-",
+        "If-Range": '"a"',
+    }
+
+
+def test_log_tail_reads_appended_lines() -> None:
+    """Test only complete appended lines are returned."""
+    _log_tail = OctopusNetLogTail()
+    _read_suffix(_log_tail, LOG, 0)
+
+    _lines = _log_tail.feed(
+        206,
+        {"Content-Range": f"bytes {len(LOG)}-21/22", "ETag": '"a"'},
+        b"43.0\n44",
+    )
+    assert _lines == ["43.0"]
+    # The incomplete line is requested again
+    assert _log_tail.offset == len(LOG) + 5
+    assert _log_tail.feed(304, {}, b"") == []
+
+
+def test_log_tail_detects_rotation() -> None:
+    """Test a log shorter than the read position is reported as rotated."""
+    _log_tail = OctopusNetLogTail()
+    _read_suffix(_log_tail, LOG, 0)
+
+    assert _log_tail.feed(416, {"Content-Range": f"bytes */{len(LOG)}"}, b"") == []
+    assert _log_tail.feed(416, {"Content-Range": "bytes */5"}, b"") is None
+
+
+def test_log_tail_skips_known_lines_of_full_reply() -> None:
+    """Test a full reply of the known log only returns the appended lines."""
+    _log_tail = OctopusNetLogTail()
+    _read_suffix(_log_tail, LOG, 0)
+
+    assert _log_tail.feed(200, {"ETag": '"b"'}, LOG + b"43.0\n") == ["43.0"]
+    assert _log_tail.offset == len(LOG) + 5
+
+
+def test_log_tail_reads_new_log_of_full_reply() -> None:
+    """Test all lines of a full reply of another log are returned."""
+    _log_tail = OctopusNetLogTail()
+    _read_suffix(_log_tail, LOG, 0)
+
+    assert _log_tail.feed(200, {"ETag": '"b"'}, b"30.0\n31.0\n") == ["30.0", "31.0"]
+    assert _log_tail.offset == 10
+    assert _log_tail.anchor == b"30.0\n31.0\n"
+    # Only the lines appended to the new log are read next
+    assert _log_tail.feed(200, {"ETag": '"c"'}, b"30.0\n31.0\n32.0\n") == ["32.0"]
+
+    # Same length as the known log, but other content
+    _log_tail = OctopusNetLogTail()
+    _read_suffix(_log_tail, LOG, 0)
+    assert _log_tail.feed(200, {}, b"30.5\n31.0\n32.0\n") == ["30.5", "31.0", "32.0"]
+
+
+def test_log_tail_seek() -> None:
+    """Test reading continues after a streamed log."""
+    _log_tail = OctopusNetLogTail()
+    _log_tail.seek(len(LOG), {"ETag": '"a"'}, b"42.0\n")
+    assert _log_tail.request_headers() == {
+        "Range": f"bytes={len(LOG)}-",
+        "If-Range": '"a"',
+    }
+    assert _log_tail.feed(200, {}, LOG + b"43.0\n") == ["43.0"]
+
+    _log_tail.reset()
+    assert _log_tail.offset is None
+    assert _log_tail.anchor == b""
+
+
+def test_auth_without_credentials() -> None:
+    """Test a challenge is not answered without credentials."""
+    _auth = OctopusNetAuth(None, None)
+    assert not _auth.enabled
+    assert not _auth.handle_challenge('Basic realm="octopus"', False)
+    assert _auth.get_headers("GET", "http://octopus/system/fanspeed") == {}
+
+
+def test_auth_basic() -> None:
+    """Test basic authentication is sent after a challenge."""
+    _auth = OctopusNetAuth("admin", "secret")
+    assert _auth.get_headers("GET", "http://octopus/") == {}
+
+    assert _auth.handle_challenge('Basic realm="octopus"', False)
+    assert _auth.get_headers("GET", "http://octopus/") == {
+        "Authorization": aiohttp.BasicAuth("admin", "secret").encode(),
+    }
+    # Rejected credentials are not sent again
+    assert not _auth.handle_challenge('Basic realm="octopus"', True)
+
+
+def test_auth_digest() -> None:
+    """Test the digest response and the nonce count."""
+    _auth = OctopusNetAuth("admin", "secret")
+    assert _auth.handle_challenge(
+        'Digest realm="octopus", nonce="abc", qop="auth,auth-int", opaque="xyz"',
+        False,
+    )
+
+    for _nonce_count in ("00000001", "00000002"):
+        _params = _get_digest_params(
+            _auth.get_headers("GET", "http://octopus/epg/status?full=1")["Authorization"]
+        )
+        _ha1 = hashlib.md5(b"admin:octopus:secret").hexdigest()
+        _ha2 = hashlib.md5(b"GET:/epg/status?full=1").hexdigest()
+        assert _params["uri"] == "/epg/status?full=1"
+        assert _params["opaque"] == "xyz"
+        assert _params["qop"] == "auth"
+        assert _params["nc"] == _nonce_count
+        assert _params["response"] == hashlib.md5(
+            f"{_ha1}:abc:{_nonce_count}:{_params['cnonce']}:auth:{_ha2}".encode()
+        ).hexdigest()
+
+
+def test_auth_digest_sha256_without_qop() -> None:
+    """Test the digest response of SHA-256 without quality of protection."""
+    _auth = OctopusNetAuth("admin", "secret")
+    assert _auth.handle_challenge(
+        'Digest realm="octopus", nonce="abc", algorithm=SHA-256',
+        False,
+    )
+    _params = _get_digest_params(
+        _auth.get_headers("POST", "http://octopus/channels/data")["Authorization"]
+    )
+    _ha1 = hashlib.sha256(b"admin:octopus:secret").hexdigest()
+    _ha2 = hashlib.sha256(b"POST:/channels/data").hexdigest()
+    assert "qop" not in _params
+    assert _params["response"] == hashlib.sha256(f"{_ha1}:abc:{_ha2}".encode()).hexdigest()
+
+
+def test_auth_digest_challenges() -> None:
+    """Test rejected, stale and unsupported digest challenges."""
+    _auth = OctopusNetAuth("admin", "secret")
+    assert not _auth.handle_challenge(
+        'Digest realm="octopus", nonce="abc", algorithm=SHA-512-256',
+        False,
+    )
+    assert _auth.handle_challenge('Digest realm="octopus", nonce="abc", qop="auth"', False)
+    assert not _auth.handle_challenge('Digest realm="octopus", nonce="def", qop="auth"', True)
+
+    # A stale nonce is replaced and counted from the start
+    _auth.get_headers("GET", "http://octopus/")
+    _auth.get_headers("GET", "http://octopus/")
+    assert _auth.handle_challenge(
+        'Digest realm="octopus", nonce="def", qop="auth", stale=true',
+        True,
+    )
+    _params = _get_digest_params(_auth.get_headers("GET", "http://octopus/")["Authorization"])
+    assert _params["nonce"] == "def"
+    assert _params["nc"] == "00000001"
+
+
+def test_circuit_breaker(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test the circuit opens, backs off and closes again."""
+    _now = 1000.0
+    monkeypatch.setattr(api.time, "monotonic", lambda: _now)
+    _circuit = OctopusNetCircuitBreaker("octopus")
+
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD - 1):
+        _circuit.record_failure()
+    assert _circuit.closed
+
+    _circuit.record_failure()
+    assert _circuit.state == CIRCUIT_OPEN
+    assert _circuit.backoff == CIRCUIT_BACKOFF_MIN
+    assert not _circuit.probe_due()
+
+    _now += CIRCUIT_BACKOFF_MIN
+    assert _circuit.probe_due()
+    assert _circuit.state == CIRCUIT_HALF_OPEN
+
+    # Every failed probe doubles the backoff up to the maximum
+    _backoff = CIRCUIT_BACKOFF_MIN
+    while _backoff < CIRCUIT_BACKOFF_MAX:
+        _circuit.record_failure()
+        _backoff = min(CIRCUIT_BACKOFF_MAX, _backoff * 2)
+        assert _circuit.state == CIRCUIT_OPEN
+        assert _circuit.backoff == _backoff
+        _now += _backoff
+        assert _circuit.probe_due()
+    _circuit.record_failure()
+    assert _circuit.backoff == CIRCUIT_BACKOFF_MAX
+
+    _circuit.record_success()
+    assert _circuit.state == CIRCUIT_CLOSED
+    assert _circuit.failures == 0
+    assert _circuit.backoff == 0
+
+
+def test_circuit_breaker_concurrent_failures(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    """Test failures of requests sent before the circuit opened keep the backoff."""
+    monkeypatch.setattr(api.time, "monotonic", lambda: 1000.0)
+    _circuit = OctopusNetCircuitBreaker("octopus")
+
+    # All requests of a poll fail at once
+    for _ in range(5):
+        _circuit.record_failure()
+    assert _circuit.state == CIRCUIT_OPEN
+    assert _circuit.failures == 5
+    assert _circuit.backoff == CIRCUIT_BACKOFF_MIN
+
+
+@pytest.fixture
+async def client(
+    stand_in: OctopusNetStandIn,
+) -> AsyncGenerator[OctopusNetApiClient]:
+    """Return a client of the stand-in device."""
+    _client = OctopusNetApiClient(
+        host="127.0.0.1",
+        username="",
+        password="",
+        port=stand_in.port,
+        tls=False,
+        verify_ssl=False,
+        session=create_session(tls=False, verify_ssl=False),
+    )
+    yield _client
+    await _client.async_close()
+
+
+async def test_get_status(
+    stand_in: OctopusNetStandIn,
+    client: OctopusNetApiClient,
+) -> None:
+    """Test the status lists and conditional requests."""
+    assert len(await client.async_get_tuner_status()) == 4
+    assert len(await client.async_get_stream_status()) == 8
+
+    assert await client.async_get_stream_status(changed_only=True) is None
+    stand_in.advance_streams()
+    _streams = await client.async_get_stream_status(changed_only=True)
+    assert _streams[0]["Packets"] == 1000
+
+    # The parsed list of an unchanged body is returned without changed_only
+    assert await client.async_get_stream_status() is _streams
+
+
+async def test_get_temperature(
+    stand_in: OctopusNetStandIn,
+    client: OctopusNetApiClient,
+) -> None:
+    """Test the temperature log is read incrementally."""
+    assert await client.async_get_temperature() == 40.0
+    # Samples of the first read may be known already
+    assert client.temperature_samples == []
+
+    stand_in.append_temperature(41.5)
+    stand_in.append_temperature(42.0)
+    assert await client.async_get_temperature() == 42.0
+    assert client.temperature_samples == [41.5, 42.0]
+
+    assert await client.async_get_temperature() == 42.0
+    assert client.temperature_samples == []
+
+    stand_in.rotate_log()
+    stand_in.append_temperature(30.0)
+    assert await client.async_get_temperature() == 30.0
+    assert client.temperature_samples == [30.0]
+
+
+async def test_iter_temperature_log(
+    stand_in: OctopusNetStandIn,
+    client: OctopusNetApiClient,
+) -> None:
+    """Test the streamed log continues with incremental reads."""
+    _samples = [_sample async for _sample in client.async_iter_temperature_log()]
+    assert _samples == [40.0] * 60
+
+    stand_in.append_temperature(45.0)
+    assert await client.async_get_temperature() == 45.0
+    assert client.temperature_samples == [45.0]
+
+
+async def test_failed_requests(
+    stand_in: OctopusNetStandIn,
+    client: OctopusNetApiClient,
+) -> None:
+    """Test an error status and an invalid body do not open the circuit."""
+    stand_in.fail(PATH_FANSPEED, 500, count=1)
+    with pytest.raises(OctopusNetApiCommunicationError):
+        await client.async_get_fanspeed()
+    assert await client.async_get_fanspeed() == 1200
+
+    stand_in.fail(PATH_STREAM, FAIL_INVALID, count=1)
+    with pytest.raises(OctopusNetApiCommunicationError, match="Invalid response"):
+        await client.async_get_stream_status()
+    assert len(await client.async_get_stream_status(changed_only=True)) == 8
+
+    assert client.circuit.closed
+    assert client.metrics.get(PATH_FANSPEED).error_count == 1
+
+
+async def test_cancelled_request(
+    stand_in: OctopusNetStandIn,
+    client: OctopusNetApiClient,
+) -> None:
+    """Test a request cancelled by the poll deadline is not measured."""
+    stand_in.latency = 1.0
+    _task = asyncio.create_task(client.async_get_fanspeed())
+    await asyncio.sleep(0.1)
+    _task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await _task
+    assert client.metrics.get(PATH_FANSPEED) is None
+
+
+async def test_unreachable_device(
+    stand_in: OctopusNetStandIn,
+    client: OctopusNetApiClient,
+) -> None:
+    """Test requests are skipped once the device dropped several connections."""
+    stand_in.fail(PATH_FANSPEED, FAIL_DISCONNECT)
+    for _ in range(CIRCUIT_FAILURE_THRESHOLD):
+        with pytest.raises(OctopusNetApiCommunicationError):
+            await client.async_get_fanspeed()
+    assert client.circuit.state == CIRCUIT_OPEN
+
+    _requests = dict(stand_in.requests)
+    with pytest.raises(OctopusNetApiCircuitOpenError):
+        await client.async_get_tuner_status()
+    assert stand_in.requests == _requests
@@ -0,0 +1,184 @@
+"""Benchmarks of the polling of a Digital Devices Octopus NET.
+
+Run with ``pytest tests/test_benchmark.py --benchmark-enable``, otherwise
+every benchmark runs once as a test.
+"""
+from __future__ import annotations
+
+import asyncio
+import tracemalloc
+from collections.abc import Awaitable, Callable
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.octopusnet.const import SIGNAL_WINDOW_SIZE
+from custom_components.octopusnet.coordinator import OctopusNetDataUpdateCoordinator
+
+from . import async_poll
+from .stand_in import (
+    PATH_TEMPERATURE,
+    OctopusNetStandIn,
+)
+
+pytestmark = pytest.mark.usefixtures("recorder_mock")
+
+# Polls measured for the memory retained per poll
+MEMORY_POLLS = 100
+
+
+async def _async_benchmark(
+    hass: HomeAssistant,
+    benchmark,
+    target: Callable[[], Awaitable[None]],
+) -> None:
+    """Benchmark a coroutine on the event loop of Home Assistant.
+
+    The benchmark fixture is synchronous, it runs in the executor and
+    waits for every round on the event loop.
+    """
+
+    def _run() -> None:
+        asyncio.run_coroutine_threadsafe(target(), hass.loop).result()
+
+    await hass.async_add_executor_job(benchmark, _run)
+
+
+@pytest.mark.parametrize(
+    ("tuner_count", "stream_count", "latency", "padding"),
+    [
+        (4, 8, 0, 0),
+        (4, 8, 0.02, 0),
+        (8, 32, 0, 0),
+        (8, 32, 0, 65536),
+    ],
+)
+@pytest.mark.parametrize("changed", [True, False], ids=["changed", "unchanged"])
+async def test_poll_latency(
+    hass: HomeAssistant,
+    benchmark,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+    tuner_count: int,
+    stream_count: int,
+    latency: float,
+    padding: int,
+    changed: bool,
+) -> None:
+    """Benchmark a poll of all sections."""
+    stand_in.set_slots(tuner_count, stream_count)
+    await async_poll(hass, coordinator)
+    stand_in.latency = latency
+    stand_in.padding = padding
+
+    async def _async_poll() -> None:
+        if changed:
+            stand_in.advance_streams()
+        await async_poll(hass, coordinator)
+
+    await _async_benchmark(hass, benchmark, _async_poll)
+    assert coordinator.data.stream.available
+    assert coordinator.stream_count == stream_count
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+@pytest.mark.parametrize(
+    ("tuner_count", "stream_count"),
+    [
+        (4, 8),
+        (8, 32),
+    ],
+)
+async def test_entity_fan_out(
+    hass: HomeAssistant,
+    benchmark,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+    tuner_count: int,
+    stream_count: int,
+) -> None:
+    """Benchmark the state writes of all entities after a poll."""
+    stand_in.set_slots(tuner_count, stream_count)
+    await async_poll(hass, coordinator)
+    await hass.async_block_till_done()
+
+    async def _async_update_listeners() -> None:
+        # All records changed
+        coordinator._changed_keys = None
+        coordinator.async_update_listeners()
+
+    await _async_benchmark(hass, benchmark, _async_update_listeners)
+    benchmark.extra_info["entities"] = len(coordinator._listeners)
+    assert len(coordinator._listeners) > 3 * tuner_count + stream_count
+
+
+@pytest.mark.parametrize("log_lines", [60, 10_000, 100_000])
+async def test_temperature_log_growth(
+    hass: HomeAssistant,
+    benchmark,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+    log_lines: int,
+) -> None:
+    """Benchmark a read of the temperature log, which must not grow with the log."""
+    stand_in.append_temperature(41.0, log_lines)
+    await coordinator.client.async_get_temperature()
+
+    async def _async_read() -> None:
+        stand_in.append_temperature(42.0)
+        await coordinator.client.async_get_temperature()
+
+    _sent = stand_in.sent[PATH_TEMPERATURE]
+    await _async_read()
+    _sent = stand_in.sent[PATH_TEMPERATURE] - _sent
+    benchmark.extra_info["sent_bytes_per_read"] = _sent
+    await _async_benchmark(hass, benchmark, _async_read)
+    # Only the appended line is transferred
+    assert _sent == len(b"42.0\n")
+    assert coordinator.client.temperature_samples == [42.0]
+
+
+async def test_memory_per_poll(
+    hass: HomeAssistant,
+    benchmark,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Benchmark a poll and measure the memory it retains once windows are full."""
+
+    async def _async_poll() -> None:
+        stand_in.advance_streams()
+        await async_poll(hass, coordinator)
+
+    # Fill signal windows, request metrics and caches first
+    for _ in range(SIGNAL_WINDOW_SIZE):
+        await _async_poll()
+
+    _filters = [tracemalloc.Filter(True, "*/custom_components/octopusnet/*")]
+    tracemalloc.start()
+    try:
+        # Allocations made once after tracing started are part of the
+        # first snapshot, only the growth between both snapshots counts
+        for _ in range(MEMORY_POLLS):
+            await _async_poll()
+        _before = tracemalloc.take_snapshot().filter_traces(_filters)
+        tracemalloc.reset_peak()
+        _start, _ = tracemalloc.get_traced_memory()
+        for _ in range(MEMORY_POLLS):
+            await _async_poll()
+        _, _peak = tracemalloc.get_traced_memory()
+        _after = tracemalloc.take_snapshot().filter_traces(_filters)
+    finally:
+        tracemalloc.stop()
+
+    _retained = sum(
+        _statistic.size_diff
+        for _statistic in _after.compare_to(_before, "filename")
+    )
+    benchmark.extra_info["retained_bytes_per_poll"] = round(_retained / MEMORY_POLLS)
+    benchmark.extra_info["peak_bytes"] = _peak - _start
+    await _async_benchmark(hass, benchmark, _async_poll)
+    # Below 40 bytes per poll were measured with 4 to 8 tuners and 8 to 32
+    # streams, mostly revision counters that outgrow the small int cache
+    assert _retained / MEMORY_POLLS < 256
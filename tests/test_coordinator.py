@@ -0,0 +1,294 @@
+"""Tests for the Digital Devices Octopus NET coordinator."""
+from __future__ import annotations
+
+from collections.abc import AsyncGenerator
+
+import pytest
+
+from homeassistant.core import HomeAssistant
+from homeassistant.const import (
+    CONF_DEVICE_ID,
+    CONF_TIMEOUT,
+    STATE_UNAVAILABLE,
+)
+from homeassistant.helpers import (
+    device_registry as dr,
+    entity_registry as er,
+)
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.octopusnet import reboot
+from custom_components.octopusnet.api import OctopusNetApiError
+from custom_components.octopusnet.const import (
+    DOMAIN,
+    SERVICE_REBOOT,
+    CONF_WAIT_ONLINE,
+    CONF_LIVE_MODE,
+    ATTR_TUNER,
+    ATTR_STREAM,
+)
+from custom_components.octopusnet.coordinator import OctopusNetDataUpdateCoordinator
+
+from . import async_poll
+from .stand_in import (
+    FAIL_DISCONNECT,
+    PATH_CHANNELS,
+    PATH_FANSPEED,
+    PATH_STREAM,
+    OctopusNetStandIn,
+)
+
+pytestmark = pytest.mark.usefixtures("recorder_mock")
+
+
+@pytest.fixture
+async def bare_coordinator(
+    hass: HomeAssistant,
+    config_entry: MockConfigEntry,
+) -> AsyncGenerator[OctopusNetDataUpdateCoordinator]:
+    """Return a coordinator of an entry that is not set up."""
+    _coordinator = OctopusNetDataUpdateCoordinator(
+        hass=hass,
+        config_entry=config_entry,
+    )
+    yield _coordinator
+    await _coordinator.async_close()
+
+
+async def test_stream_rates(
+    bare_coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Test the rates of a stream between two samples."""
+    assert bare_coordinator._get_stream_rates(0, 100.0, 1000, 188000) == (None, None)
+    assert bare_coordinator._get_stream_rates(0, 102.0, 2000, 376000) == (94000.0, 500.0)
+    # Unchanged counters
+    assert bare_coordinator._get_stream_rates(0, 104.0, 2000, 376000) == (0.0, 0.0)
+    # Counters start again from zero when a stream is restarted
+    assert bare_coordinator._get_stream_rates(0, 106.0, 10, 1880) == (940.0, 5.0)
+    # No time passed
+    assert bare_coordinator._get_stream_rates(0, 106.0, 20, 3760) == (None, None)
+    # Older than the stored sample, e.g. of a poll that overlapped a live update
+    assert bare_coordinator._get_stream_rates(0, 105.0, 0, 0) == (None, None)
+    assert bare_coordinator._get_stream_rates(0, 108.0, 30, 5640) == (1880.0, 10.0)
+    # Other streams are independent
+    assert bare_coordinator._get_stream_rates(1, 106.0, 20, 3760) == (None, None)
+    # Streams the device does not report
+    assert bare_coordinator._get_stream_rates(8, 106.0, 20, 3760) == (None, None)
+
+
+async def test_setup(
+    hass: HomeAssistant,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Test the first refresh fetches all sections."""
+    assert hass.states.get("sensor.127_0_0_1_fanspeed").state == "1200"
+    assert coordinator.tuner_count == 4
+    assert coordinator.stream_count == 8
+    assert coordinator.data.temperature.state == 40.0
+    assert coordinator.data.tuners[0].lock
+    assert coordinator.data.tuners[0].channel == "Channel 1, Channel 5"
+    assert coordinator.data.streams[1].channel == "Channel 2"
+
+
+async def test_unchanged_streams(
+    hass: HomeAssistant,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Test unchanged lists are not processed again but update rates and tuner channels."""
+    stand_in.advance_streams()
+    await async_poll(hass, coordinator)
+    assert coordinator.data.stream_bitrates[0].state > 0
+    assert coordinator.data.stream_bitrate.state > 0
+
+    _revision = coordinator.data.streams[0].revision
+    await async_poll(hass, coordinator)
+    assert coordinator.unchanged_sections[ATTR_STREAM] >= 1
+    assert coordinator.data.stream_bitrates[0].state == 0.0
+    assert coordinator.data.stream_bitrate.state == 0.0
+    assert coordinator.data.streams[0].revision == _revision
+
+    # Only the stream list changes, the tuner shows the new channel
+    stand_in.streams[0]["Request"] = stand_in.get_request(1)
+    await async_poll(hass, coordinator)
+    assert coordinator.unchanged_sections[ATTR_TUNER] >= 2
+    assert coordinator.data.tuners[0].channel == "Channel 2, Channel 5"
+    assert coordinator.data.tuners[0].statistics["samples"] == 4
+
+
+async def test_channels_fetched_lazily(
+    hass: HomeAssistant,
+    monkeypatch: pytest.MonkeyPatch,
+    stand_in: OctopusNetStandIn,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test the channel list is fetched once a stream is active and saved once."""
+    for _stream in stand_in.streams:
+        _stream["Status"] = "Inactive"
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    _coordinator = config_entry.runtime_data
+    assert PATH_CHANNELS not in stand_in.requests
+
+    _saved = []
+
+    async def _async_save(data: dict) -> None:
+        _saved.append(data)
+
+    monkeypatch.setattr(_coordinator.channels._store, "async_save", _async_save)
+    stand_in.set_slots(4, 8)
+    await async_poll(hass, _coordinator)
+    assert stand_in.requests[PATH_CHANNELS] == 1
+    assert len(_saved) == 1
+
+    # An unchanged list is not written again
+    _coordinator.channels.invalidate()
+    await _coordinator.channels.async_ensure()
+    assert stand_in.requests[PATH_CHANNELS] == 2
+    assert len(_saved) == 1
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_live_mode(
+    hass: HomeAssistant,
+    stand_in: OctopusNetStandIn,
+    config_entry: MockConfigEntry,
+) -> None:
+    """Test the poll leaves tuners and streams to the live updates."""
+    hass.config_entries.async_update_entry(
+        config_entry,
+        options={CONF_LIVE_MODE: True},
+    )
+    assert await hass.config_entries.async_setup(config_entry.entry_id)
+    await hass.async_block_till_done()
+    _coordinator = config_entry.runtime_data
+    assert _coordinator.live_updater.running
+
+    _requests = dict(stand_in.requests)
+    await async_poll(hass, _coordinator)
+    assert stand_in.requests[PATH_FANSPEED] == _requests[PATH_FANSPEED] + 1
+    assert stand_in.requests.get(PATH_STREAM) == _requests.get(PATH_STREAM)
+
+    stand_in.advance_streams()
+    await _coordinator.async_live_update()
+    assert _coordinator.data.stream_bitrates[0].state > 0
+    # A list fetched before the processed one is dropped
+    assert not _coordinator._is_latest_slot_status(ATTR_STREAM, 0)
+
+    # Failed live updates make tuners and streams unavailable
+    stand_in.fail(PATH_STREAM, FAIL_DISCONNECT)
+    with pytest.raises(OctopusNetApiError):
+        await _coordinator.async_live_update()
+    assert not _coordinator.data.stream.available
+    assert not _coordinator.data.tuner.available
+
+    await hass.config_entries.async_unload(config_entry.entry_id)
+    await hass.async_block_till_done()
+
+
+async def test_failed_section(
+    hass: HomeAssistant,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Test a failed endpoint only makes its own section unavailable."""
+    stand_in.fail(PATH_STREAM, 500)
+    await async_poll(hass, coordinator)
+    assert not coordinator.data.stream.available
+    assert not coordinator.data.streams[0].available
+    assert coordinator.data.fanspeed.available
+    assert coordinator.data.tuner.available
+
+    stand_in.clear_failures()
+    await async_poll(hass, coordinator)
+    assert coordinator.data.stream.available
+    assert coordinator.data.streams[0].available
+
+
+@pytest.mark.usefixtures("entity_registry_enabled_by_default")
+async def test_retired_slots(
+    hass: HomeAssistant,
+    entity_registry: er.EntityRegistry,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Test entities of slots the device no longer reports become unavailable."""
+    _entity_id = "binary_sensor.127_0_0_1_tuner_3"
+    assert hass.states.get(_entity_id).state == "on"
+
+    stand_in.set_slots(2, 8)
+    await async_poll(hass, coordinator)
+    assert coordinator.tuner_count == 2
+    assert hass.states.get(_entity_id).state == STATE_UNAVAILABLE
+    assert entity_registry.async_get(_entity_id) is not None
+
+    stand_in.set_slots(4, 8)
+    await async_poll(hass, coordinator)
+    assert coordinator.tuner_count == 4
+    assert hass.states.get(_entity_id).state == "on"
+    assert hass.states.get("binary_sensor.127_0_0_1_tuner_5") is None
+
+
+async def test_reboot_timeout(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Test a device that does not come back is reported as failed."""
+    monkeypatch.setattr(reboot, "REBOOT_DOWN_DELAY", 0)
+    monkeypatch.setattr(reboot, "REBOOT_PROBE_INTERVAL", 0.01)
+    monkeypatch.setattr(reboot, "REBOOT_PROBE_INTERVAL_MAX", 0.01)
+    monkeypatch.setattr(reboot, "REBOOT_TIMEOUT", 0.05)
+    # The probe takes an error status as not ready
+    stand_in.fail(PATH_FANSPEED, 503)
+    _device = device_registry.async_get_device(identifiers={(DOMAIN, "127.0.0.1")})
+
+    _response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REBOOT,
+        {
+            CONF_DEVICE_ID: [_device.id],
+            CONF_WAIT_ONLINE: True,
+        },
+        blocking=True,
+        return_response=True,
+    )
+    _result = _response["results"][0]
+    assert not _result["success"]
+    assert "did not come back" in _result["error"]
+    # Polling resumes and reports the device as it is
+    assert not coordinator.data.reboot.rebooting
+    assert not coordinator.data.fanspeed.available
+
+
+async def test_reboot_wait_online(
+    hass: HomeAssistant,
+    device_registry: dr.DeviceRegistry,
+    monkeypatch: pytest.MonkeyPatch,
+    stand_in: OctopusNetStandIn,
+    coordinator: OctopusNetDataUpdateCoordinator,
+) -> None:
+    """Test the timeout does not limit the wait until the device is back."""
+    monkeypatch.setattr(reboot, "REBOOT_DOWN_DELAY", 1.5)
+    _device = device_registry.async_get_device(identifiers={(DOMAIN, "127.0.0.1")})
+
+    _response = await hass.services.async_call(
+        DOMAIN,
+        SERVICE_REBOOT,
+        {
+            CONF_DEVICE_ID: [_device.id],
+            CONF_WAIT_ONLINE: True,
+            CONF_TIMEOUT: 1,
+        },
+        blocking=True,
+        return_response=True,
+    )
+    _result = _response["results"][0]
+    assert _result["success"]
+    assert _result["latency"] >= 1.5
+    assert not coordinator.data.reboot.rebooting
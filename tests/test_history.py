@@ -0,0 +1,72 @@
+"""Tests for the temperature history of Digital Devices Octopus NET."""
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+
+from homeassistant.core import HomeAssistant
+
+from custom_components.octopusnet import history
+from custom_components.octopusnet.api import (
+    OctopusNetApiClient,
+    create_session,
+)
+from custom_components.octopusnet.history import OctopusNetTemperatureHistory
+
+from .stand_in import OctopusNetStandIn
+
+
+@pytest.mark.usefixtures("recorder_mock")
+async def test_backfill_hours(
+    hass: HomeAssistant,
+    freezer: FrozenDateTimeFactory,
+    monkeypatch: pytest.MonkeyPatch,
+    stand_in: OctopusNetStandIn,
+) -> None:
+    """Test the log is assigned to the clock hours backwards from now."""
+    freezer.move_to(datetime(2026, 1, 1, 10, 30, tzinfo=UTC))
+    _statistics = []
+    monkeypatch.setattr(
+        history,
+        "async_add_external_statistics",
+        lambda _hass, _metadata, statistics: _statistics.extend(statistics),
+    )
+    # 60 samples of 40.0 from 09:00, 30 samples of 45.0 from 10:00
+    stand_in.append_temperature(45.0, 30)
+    _client = OctopusNetApiClient(
+        host="127.0.0.1",
+        username="",
+        password="",
+        port=stand_in.port,
+        tls=False,
+        verify_ssl=False,
+        session=create_session(tls=False, verify_ssl=False),
+    )
+    _history = OctopusNetTemperatureHistory(hass, _client, "127.0.0.1")
+    assert _history.needs_backfill
+
+    await _history.async_backfill()
+    await _client.async_close()
+    assert _history.backfilled
+    assert len(_statistics) == 1
+    assert _statistics[0]["start"] == datetime(2026, 1, 1, 9, tzinfo=UTC)
+    assert _statistics[0]["mean"] == 40.0
+
+    # The current hour is continued by the next polls
+    _history.add_samples([46.0])
+    _history.flush()
+    assert _statistics[1]["start"] == datetime(2026, 1, 1, 10, tzinfo=UTC)
+    assert _statistics[1]["min"] == 45.0
+    assert _statistics[1]["max"] == 46.0
+
+
+async def test_backfill_without_recorder(
+    hass: HomeAssistant,
+) -> None:
+    """Test nothing is imported if the recorder is not loaded."""
+    _history = OctopusNetTemperatureHistory(hass, None, "127.0.0.1")
+    assert not _history.needs_backfill
+    _history.add_samples([40.0])
+    _history.flush()
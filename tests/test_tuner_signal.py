@@ -0,0 +1,179 @@
+"""Tests for the tuner signal analytics of Digital Devices Octopus NET."""
+from __future__ import annotations
+
+import pytest
+
+from custom_components.octopusnet.const import (
+    ATTR_LOCK,
+    ATTR_LOCK_CHANGES,
+    ATTR_SNR,
+    ATTR_STRENGTH,
+    SIGNAL_WARMUP_SAMPLES,
+)
+from custom_components.octopusnet.tuner_signal import (
+    SIGNAL_ATTRIBUTES,
+    OctopusNetSignalDetector,
+    OctopusNetSignalWindow,
+)
+
+TUNING = "1:11836:h"
+
+
+def _add(
+    window: OctopusNetSignalWindow,
+    value: float,
+    active: bool = True,
+    lock: bool = True,
+) -> None:
+    """Add the same value for all signal values."""
+    window.add(
+        active=active,
+        lock=lock,
+        strength=value,
+        snr=value,
+        quality=value,
+        level=value,
+    )
+
+
+def _update(
+    detector: OctopusNetSignalDetector,
+    snr: float = 12.0,
+    strength: float = 48.0,
+    lock: bool = True,
+    active: bool = True,
+    tuning: str | None = TUNING,
+) -> list[str]:
+    """Add a poll to the detector."""
+    return detector.update(
+        active=active,
+        lock=lock,
+        tuning=tuning,
+        snr=snr,
+        strength=strength,
+    )
+
+
+def _warm_up(
+    detector: OctopusNetSignalDetector,
+) -> None:
+    """Add enough stable polls to check values against the baseline."""
+    for _ in range(SIGNAL_WARMUP_SAMPLES):
+        assert _update(detector) == []
+
+
+def test_window_statistics() -> None:
+    """Test min, max, mean and standard deviation of the samples."""
+    _window = OctopusNetSignalWindow(size=8)
+    _attributes = _window.as_attributes()
+    assert set(_attributes) == SIGNAL_ATTRIBUTES
+    assert _attributes["samples"] == 0
+    assert _attributes["snr_mean"] is None
+
+    for _value in (2.0, 4.0, 4.0, 4.0, 5.0, 5.0, 7.0, 9.0):
+        _add(_window, _value)
+    # An inactive tuner adds no sample
+    _add(_window, 100.0, active=False)
+
+    _attributes = _window.as_attributes()
+    assert _attributes["samples"] == 8
+    assert _attributes["snr_min"] == 2.0
+    assert _attributes["snr_max"] == 9.0
+    assert _attributes["snr_mean"] == 5.0
+    assert _attributes["snr_stddev"] == 2.0
+
+
+def test_window_keeps_recent_samples() -> None:
+    """Test the oldest samples are replaced once the window is full."""
+    _window = OctopusNetSignalWindow(size=4)
+    for _value in range(1, 11):
+        _add(_window, float(_value))
+
+    _attributes = _window.as_attributes()
+    assert _attributes["samples"] == 4
+    assert _attributes["strength_min"] == 7.0
+    assert _attributes["strength_max"] == 10.0
+    assert _attributes["strength_mean"] == 8.5
+
+
+def test_window_lock_losses() -> None:
+    """Test a lock loss is counted when a locked tuner has no lock next."""
+    _window = OctopusNetSignalWindow(size=8)
+    for _lock in (False, True, False, False, True, False):
+        _add(_window, 1.0, lock=_lock)
+    assert _window.as_attributes()["lock_losses"] == 2
+
+    # Samples of a new activation start without a known lock
+    _add(_window, 1.0, active=False)
+    _add(_window, 1.0, lock=False)
+    assert _window.as_attributes()["lock_losses"] == 2
+
+
+def test_detector_value_below_baseline() -> None:
+    """Test a drop of SNR is reported once and clears on recovery."""
+    _detector = OctopusNetSignalDetector()
+    _warm_up(_detector)
+    assert _detector.get_baseline(ATTR_SNR) == 12.0
+
+    # Within the minimum deviation of 1.5 dB
+    assert _update(_detector, snr=10.6) == []
+    assert not _detector.degraded
+
+    assert _update(_detector, snr=8.0) == [ATTR_SNR]
+    assert _detector.degraded
+    assert _update(_detector, snr=8.0) == []
+    assert _detector.degraded
+    # The baseline does not follow the fade
+    assert _detector.get_baseline(ATTR_SNR) == pytest.approx(11.93, abs=0.01)
+
+    assert _update(_detector) == []
+    assert not _detector.degraded
+
+    assert _update(_detector, strength=40.0) == [ATTR_STRENGTH]
+
+
+def test_detector_resets_on_tuning() -> None:
+    """Test the baseline is forgotten after the tuner was tuned elsewhere."""
+    _detector = OctopusNetSignalDetector()
+    _warm_up(_detector)
+    assert _update(_detector, snr=8.0) == [ATTR_SNR]
+
+    assert _update(_detector, snr=8.0, tuning="1:10744:h") == []
+    assert not _detector.degraded
+    assert _detector.get_baseline(ATTR_SNR) == 8.0
+
+    assert _update(_detector, active=False) == []
+    assert _detector.get_baseline(ATTR_SNR) is None
+
+
+def test_detector_lock_changes() -> None:
+    """Test a flapping lock is reported."""
+    _detector = OctopusNetSignalDetector()
+    assert _update(_detector) == []
+    assert _update(_detector, lock=False) == []
+    assert _update(_detector) == []
+    assert _update(_detector, lock=False) == [ATTR_LOCK_CHANGES]
+    assert _detector.lock_changes == 3
+
+
+def test_detector_persistent_lock_loss() -> None:
+    """Test a lock that is lost and not regained is reported."""
+    _detector = OctopusNetSignalDetector()
+    _warm_up(_detector)
+
+    assert _update(_detector, snr=0.0, lock=False) == []
+    assert _update(_detector, snr=0.0, lock=False) == []
+    assert _update(_detector, snr=0.0, lock=False) == [ATTR_LOCK]
+    assert _detector.degraded
+    assert _detector.lock_changes == 1
+
+    assert _update(_detector) == []
+    assert not _detector.degraded
+
+
+def test_detector_never_locked() -> None:
+    """Test a tuner without lock since it was tuned is reported after the warm-up."""
+    _detector = OctopusNetSignalDetector()
+    for _ in range(SIGNAL_WARMUP_SAMPLES - 1):
+        assert _update(_detector, lock=False) == []
+    assert _update(_detector, lock=False) == [ATTR_LOCK]